@@ -6,7 +6,7 @@ from uuid import UUID
 from getpass import getpass
 from domain.user.repository.postgres import PostgresUserRepository
 from domain.user.user_service import UserService
-from core.di_container import Container
+from core.di_container import get_container
 
 SUPER_ADMIN_USER_ID = UUID('00000000-0000-0000-0000-000000000002')
 
@@ -15,21 +15,25 @@ def main():
         password = sys.argv[1]
     else:
         password = getpass("Enter password to check against SUPER_ADMIN user: ")
-    container = Container()
+    container = get_container()
     pool = container.postgres_pool()
-    conn = pool.get_conn()
     try:
-        repo = PostgresUserRepository(conn)
-        service = UserService(repo)
-        ok, reason = service.verify_user_password(SUPER_ADMIN_USER_ID, password, conn=conn)
+        # Return the connection before the slow hash verification
+        with pool.connection(readonly=True) as (conn, _):
+            repo = PostgresUserRepository(conn)
+            service = UserService(repo)
+            password_hash = service.cache_password_hash(SUPER_ADMIN_USER_ID, conn=conn)
+        # Nothing was cached for a missing user, and the connection is already back in the pool
+        if password_hash is None:
+            print("Password does NOT match SUPER_ADMIN user. Reason: user_not_found")
+            return
+        ok, reason = service.verify_password_by_cached_hash(SUPER_ADMIN_USER_ID, password)
         if ok:
             print("Password matches SUPER_ADMIN user.")
         else:
             print(f"Password does NOT match SUPER_ADMIN user. Reason: {reason}")
     except Exception as e:
         print(f"Error comparing SUPER_ADMIN user password: {e}")
-    finally:
-        pool.put_conn(conn)
 
 if __name__ == "__main__":
     main()
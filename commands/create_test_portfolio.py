@@ -6,49 +6,40 @@ Usage:
 """
 import argparse
 import sys
-from uuid import uuid4
-from core.di_container import Container
-# Use in-memory approach to create portfolio first
-from domain.portfolio.repository.in_memory import (
-    InMemoryPortfolioRepository, InMemoryEquityRepository,
-    InMemoryEquityHoldingRepository, InMemoryCashHoldingRepository,
-    InMemoryActivityReportEntryRepository
-)
-from domain.portfolio.portfolio_service import PortfolioService
+from core.ids import new_tenant_id
+from core.di_container import get_container
+from commands.import_ibkr_csv import create_portfolio_service
 
 
 def create_test_portfolio(name: str):
     """Create a test portfolio in PostgreSQL."""
-    container = Container()
+    container = get_container()
+    db = container.postgres_pool()
     logger = container.logger()
     
     try:
-        # Create portfolio outside of transaction first
-        tenant_id = uuid4()
+        tenant_id = new_tenant_id()
         
         logger.info(f"Creating portfolio: {name}")
-        logger.info(f"Tenant ID: {tenant_id}")        
-        # Create in-memory service first
-        cash_holding_repo = InMemoryCashHoldingRepository()
-        portfolio_repo = InMemoryPortfolioRepository(cash_holding_repo)
-        mem_service = PortfolioService(
-            portfolio_repo,
-            InMemoryEquityRepository(),
-            InMemoryEquityHoldingRepository(),
-            cash_holding_repo,
-            InMemoryActivityReportEntryRepository()
-        )
+        logger.info(f"Tenant ID: {tenant_id}")
+        service = create_portfolio_service(db)
+        
+        with db.connection() as (conn, _):
+            conn.autocommit = False
+            try:
+                portfolio = service.create_portfolio(tenant_id, name, conn=conn)
+                conn.commit()
+            except Exception:
+                conn.rollback()
+                raise
         
-        portfolio = mem_service.create_portfolio(tenant_id, name)
         logger.info(f"Created portfolio: {portfolio.id}")
         logger.info(f"Portfolio name: {portfolio.name}")
         
         return portfolio.id
         
     except Exception as e:
-        logger.error(f"Error creating portfolio: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.exception(f"Error creating portfolio: {e}")
         return None
 
 
@@ -1,20 +1,21 @@
 """
 Debug IBKR CSV parsing to see what data would be imported
 """
+import asyncio
 from core.csv.ibkr import IbkrCsvParser
-from core.di_container import Container
+from core.di_container import get_container
 
 
 def debug_ibkr_csv():
     """Debug the IBKR CSV file to see what data would be imported."""
-    container = Container()
+    container = get_container()
     logger = container.logger()
     
     csv_file = "/Users/stevenmyers/dev/portfolio_tracker/ibkr_year_to_date.csv"
     
     # Parse the CSV file
     parser = IbkrCsvParser(logger=logger)
-    parser.parse(csv_file)
+    asyncio.run(parser.parse_async(csv_file))
     
     print("\n=== IBKR CSV Debug Report ===")
     print(f"File: {csv_file}")
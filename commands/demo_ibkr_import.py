@@ -2,17 +2,20 @@
 Complete IBKR CSV import demo command.
 
 This command demonstrates the full IBKR CSV import functionality:
-1. Parses an IBKR CSV file
-2. Creates a portfolio 
-3. Imports trades, dividends, and positions
-4. Shows detailed results
+1. Creates a portfolio
+2. Parses an IBKR CSV file, streaming trades, dividends, and positions into the import
+3. Shows detailed results
 
 Usage:
     python -m commands.demo_ibkr_import --csv-file <path>
 """
 import argparse
+import heapq
 import sys
-from uuid import uuid4
+from collections import defaultdict
+from functools import lru_cache
+from operator import attrgetter
+from core.ids import new_tenant_id
 from pathlib import Path
 from decimal import Decimal
 
@@ -25,11 +28,12 @@ from domain.portfolio.repository.in_memory import (
     InMemoryCashHoldingRepository,
     InMemoryActivityReportEntryRepository
 )
-from core.di_container import Container
+from core.di_container import get_container
 
 
+@lru_cache(maxsize=1)
 def create_demo_service() -> PortfolioService:
-    """Create a PortfolioService with in-memory repositories for demo."""
+    """Create a PortfolioService with in-memory repositories for demo, once per process."""
     cash_holding_repo = InMemoryCashHoldingRepository()
     portfolio_repo = InMemoryPortfolioRepository(cash_holding_repo)
     equity_repo = InMemoryEquityRepository()
@@ -45,6 +49,20 @@ def create_demo_service() -> PortfolioService:
     )
 
 
+def reset_demo_service() -> PortfolioService:
+    """Return the cached demo service with all of its repositories emptied."""
+    service = create_demo_service()
+    for repo in (
+        service.portfolio_repo,
+        service.equity_repo,
+        service.equity_holding_repo,
+        service.cash_holding_repo,
+        service.activity_entry_repo,
+    ):
+        repo.clear()
+    return service
+
+
 def demo_ibkr_import(csv_file_path: str) -> bool:
     """
     Complete demo of IBKR CSV import functionality.
@@ -55,7 +73,7 @@ def demo_ibkr_import(csv_file_path: str) -> bool:
     Returns:
         bool: True if demo completed successfully
     """
-    container = Container()
+    container = get_container()
     logger = container.logger()
     
     # Validate inputs
@@ -68,43 +86,23 @@ def demo_ibkr_import(csv_file_path: str) -> bool:
     print()
     
     try:
-        # Step 1: Parse the CSV file
-        print("📊 Step 1: Parsing IBKR CSV file...")
-        parser = IbkrCsvParser(logger=logger)
-        parser.parse(csv_file_path)
-        
-        trades = parser.trades
-        dividends = parser.dividends
-        positions = parser.positions
-        
-        print(f"   ✅ Parsed {len(trades)} trades")
-        print(f"   ✅ Parsed {len(dividends)} dividends") 
-        print(f"   ✅ Parsed {len(positions)} positions")
-        print()
+        # Step 1: Create portfolio service and portfolio
+        print("🏦 Step 1: Creating portfolio...")
+        service = reset_demo_service()
         
-        if not trades and not dividends and not positions:
-            print("❌ No data found in CSV file")
-            return False
-        
-        # Step 2: Create portfolio service and portfolio
-        print("🏦 Step 2: Creating portfolio...")
-        service = create_demo_service()
-        
-        tenant_id = uuid4()
+        tenant_id = new_tenant_id()
         portfolio = service.create_portfolio(tenant_id, "IBKR Import Demo Portfolio")
         print(f"   ✅ Created portfolio: {portfolio.id}")
         print(f"   📝 Portfolio name: {portfolio.name}")
         print(f"   💰 Initial cash balance: ${portfolio.cash_balance}")
         print()
         
-        # Step 3: Import the data
-        print("📥 Step 3: Importing IBKR data...")
-        
-        result = service.import_from_ibkr(
+        # Step 2: Parse and import in one pass, streaming rows straight into the service
+        print("📥 Step 2: Parsing and importing IBKR data...")
+        parser = IbkrCsvParser(logger=logger)
+        result = service.import_from_ibkr_stream(
             portfolio_id=portfolio.id,
-            trades=trades,
-            dividends=dividends,
-            positions=positions
+            sections=parser.iter_sections(csv_file_path)
         )
         
         if not result.success:
@@ -114,6 +112,14 @@ def demo_ibkr_import(csv_file_path: str) -> bool:
                 print(f"   {len(result.failed_items)} items failed to import")
             return False
         
+        print(f"   ✅ Parsed {result.trades_imported + result.skipped_trades} trades")
+        print(f"   ✅ Parsed {result.dividends_imported + result.skipped_dividends} dividends")
+        print(f"   ✅ Parsed {result.positions_imported + result.skipped_positions} positions")
+        
+        if not result.total_items_processed and not result.total_items_skipped and not result.failed_items:
+            print("❌ No data found in CSV file")
+            return False
+        
         print("   ✅ Import completed successfully!")
         print(f"   📊 Summary: {result.total_items_processed} items processed, "
               f"{result.total_models_created} models created")
@@ -121,8 +127,8 @@ def demo_ibkr_import(csv_file_path: str) -> bool:
             print(f"   ⚠️  {len(result.warnings)} warnings")
         print()
         
-        # Step 4: Show detailed results
-        print("📈 Step 4: Import Results")
+        # Step 3: Show detailed results
+        print("📈 Step 3: Import Results")
         print("=" * 50)
         
         # Get imported data
@@ -138,48 +144,56 @@ def demo_ibkr_import(csv_file_path: str) -> bool:
         print(f"   • {len(activities)} total activities")
         print()
         
+        # Resolve every referenced equity up front instead of once per printed row
+        equity_ids = {h.equity_id for h in holdings} | {a.equity_id for a in activities if a.equity_id}
+        equities = service.equity_repo.get_many(equity_ids)
+        # Resolve equity -> symbol once; the loops below only need a bound dict lookup
+        symbol_for = {equity_id: equity.symbol for equity_id, equity in equities.items()}.get
+        
         # Show holdings details
         print("🏪 Holdings:")
         total_cost_basis = Decimal('0')
+        holding_row = "   • {:8} | {:>8} shares | Cost Basis: ${:>10.2f}\n".format
+        rows = []
         for holding in holdings:
-            equity = service.equity_repo.get(holding.equity_id)
-            symbol = equity.symbol if equity else 'Unknown'
             cost_basis = holding.cost_basis
             total_cost_basis += cost_basis
-            print(f"   • {symbol:8} | {holding.quantity:>8} shares | Cost Basis: ${cost_basis:>10.2f}")
+            rows.append(holding_row(symbol_for(holding.equity_id, 'Unknown'), holding.quantity, cost_basis))
+        sys.stdout.write("".join(rows))
         print(f"   {'Total':9} | {'':>8} {'':>6} | Cost Basis: ${total_cost_basis:>10.2f}")
         print()
         
         # Show recent activities
         print("📅 Recent Activities (last 5):")
-        recent_activities = sorted(activities, key=lambda a: a.date, reverse=True)[:5]
-        for activity in recent_activities:
-            equity = service.equity_repo.get(activity.equity_id) if activity.equity_id else None
-            symbol = equity.symbol if equity else 'N/A'
-            date_str = activity.date.strftime('%Y-%m-%d')
-            print(f"   • {date_str} | {activity.activity_type:8} | {symbol:8} | ${activity.amount:>10.2f}")
+        recent_activities = heapq.nlargest(5, activities, key=attrgetter('date'))
+        activity_row = "   • {:%Y-%m-%d} | {:8} | {:8} | ${:>10.2f}\n".format
+        sys.stdout.write("".join(
+            activity_row(a.date, a.activity_type, symbol_for(a.equity_id, 'N/A'), a.amount)
+            for a in recent_activities
+        ))
         print()
         
         # Show dividend summary
         if dividend_activities:
             print("💰 Dividend Summary:")
-            total_dividends = sum(d.amount for d in dividend_activities)
-            print(f"   • Total dividends: ${total_dividends:.2f}")
-            print(f"   • Number of payments: {len(dividend_activities)}")
             
-            # Group by equity
-            dividend_by_symbol = {}
+            # Group by equity, accumulating totals and counts in one pass
+            dividend_totals = defaultdict(int)
+            dividend_counts = defaultdict(int)
             for div in dividend_activities:
-                equity = service.equity_repo.get(div.equity_id) if div.equity_id else None
-                symbol = equity.symbol if equity else 'Various'
-                if symbol not in dividend_by_symbol:
-                    dividend_by_symbol[symbol] = []
-                dividend_by_symbol[symbol].append(div.amount)
+                symbol = symbol_for(div.equity_id, 'Various')
+                dividend_totals[symbol] += div.amount
+                dividend_counts[symbol] += 1
+            
+            total_dividends = sum(dividend_totals.values())
+            print(f"   • Total dividends: ${total_dividends:.2f}")
+            print(f"   • Number of payments: {len(dividend_activities)}")
             
-            for symbol, amounts in dividend_by_symbol.items():
-                total = sum(amounts)
-                count = len(amounts)
-                print(f"   • {symbol}: ${total:.2f} ({count} payments)")
+            dividend_row = "   • {}: ${:.2f} ({} payments)\n".format
+            sys.stdout.write("".join(
+                dividend_row(symbol, total, dividend_counts[symbol])
+                for symbol, total in dividend_totals.items()
+            ))
             print()
         
         print("🎉 Demo completed successfully!")
@@ -189,8 +203,7 @@ def demo_ibkr_import(csv_file_path: str) -> bool:
                     
     except Exception as e:
         print(f"❌ Error during demo: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("Error during IBKR import demo", csv_file=csv_file_path)
         return False
 
 
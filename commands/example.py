@@ -1,15 +1,19 @@
-from core.di_container import Container
+import asyncio
+from core.di_container import get_container
 
-def main() -> None:
-    container = Container()
+async def main_async() -> None:
+    container = get_container()
     stock_api = container.integrations.stock_api()
     symbols = ['DDOG', 'S']
-    for symbol in symbols:
-        try:
-            price = stock_api.fetch_stock_price(symbol)
+    prices = await stock_api.fetch_stock_prices_async(symbols)
+    for symbol, price in zip(symbols, prices):
+        if price is None:
+            print(f"Failed to fetch price for {symbol}")
+        else:
             print(f"{symbol}: ${price:.2f}")
-        except Exception as e:
-            print(f"Failed to fetch price for {symbol}: {e}")
+
+def main() -> None:
+    asyncio.run(main_async())
 
 if __name__ == "__main__":
     main()
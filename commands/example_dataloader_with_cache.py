@@ -1,28 +1,38 @@
 """
 Example: Using DataLoader with MemoryCache backend via DI container
 """
-from core.di_container import Container
+import asyncio
+from functools import cache
+from core.di_container import get_container
 from core.dataloader import DataLoader
 
 
+@cache
+def _build_loader() -> DataLoader:
+    """Build the example DataLoader on first use; later calls reuse it and its dependencies."""
+    # Get dependencies from the DI container
+    container = get_container()
+    cache_backend = container.cache()
+    stock_api = container.integrations().stock_api()
+    get_named_lock = stock_api.get_named_lock
+    logger = container.logger()
 
-# Get dependencies from the DI container
+    # Example batch load function (fetches stock prices for a list of symbols concurrently)
+    def batch_fetch_stock_prices(symbols):
+        return asyncio.run(stock_api.fetch_stock_prices_async(symbols))
 
-container = Container()
-cache_backend = container.cache()
-stock_api = container.integrations().stock_api()
-get_named_lock = stock_api.get_named_lock
-logger = container.logger()
+    # Create DataLoader with MemoryCache backend, lock provider, and logger
+    return DataLoader(batch_load_fn=batch_fetch_stock_prices, backend=cache_backend, get_named_lock=get_named_lock, logger=logger)
 
-# Example batch load function (fetches stock prices for a list of symbols)
-def batch_fetch_stock_prices(symbols):
-    return [stock_api.fetch_stock_price(symbol) for symbol in symbols]
 
+def main():
+    loader = _build_loader()
 
-# Create DataLoader with MemoryCache backend, lock provider, and logger
-loader = DataLoader(batch_load_fn=batch_fetch_stock_prices, backend=cache_backend, get_named_lock=get_named_lock, logger=logger)
+    # Example usage
+    symbols = ["AAPL", "GOOG", "MSFT"]
+    results = loader.load_many(symbols)
+    print(f"Stock prices: {dict(zip(symbols, results))}")
 
-# Example usage
-symbols = ["AAPL", "GOOG", "MSFT"]
-results = loader.load_many(symbols)
-print(f"Stock prices: {dict(zip(symbols, results))}")
+
+if __name__ == "__main__":
+    main()
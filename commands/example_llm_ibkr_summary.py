@@ -1,6 +1,7 @@
 import os
-from core.di_container import Container
+from core.di_container import get_container
 from core.csv.ibkr import IbkrCsvParser
+from core.integrations.llm.llm_tools import summarize_positions_tool
 
 IBKR_CSV_PATH = os.path.join(os.path.dirname(__file__), '../ibkr_year_to_date.csv')
 
@@ -16,7 +17,7 @@ def parse_ibkr_positions(csv_path, logger):
 
 def main():
     # Set up DI container
-    container = Container()
+    container = get_container()
     llm_agent_openai = container.integrations().llm_agent()
     llm_agent_grok = container.integrations().llm_agent_grok()
     logger = container.logger()
@@ -28,12 +29,15 @@ def main():
         print("No positions found in the IBKR CSV.")
         return
 
+    # Serialize once and share the payload between both agents
+    positions_payload = summarize_positions_tool(positions)
+
     # Test OpenAI LLM agent
-    response_openai = llm_agent_openai.summarize_positions(positions)
+    response_openai = llm_agent_openai.summarize_positions(positions_payload)
     print("OpenAI LLM Response:\n", response_openai)
 
     # Test Grok LLM agent
-    response_grok = llm_agent_grok.summarize_positions(positions)
+    response_grok = llm_agent_grok.summarize_positions(positions_payload)
     print("Grok LLM Response:\n", response_grok)
 
 if __name__ == "__main__":
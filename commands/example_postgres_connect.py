@@ -1,17 +1,16 @@
-from core.di_container import Container
+from core.di_container import get_container
 from core.deadline_manager import DeadlineManager, DeadlineExceeded
 from core.persistence.postgres import CursorWithDeadline
-import time
+from psycopg2.errors import QueryCanceled
 
 # Example: connect to Postgres, list schemas, and demonstrate deadline enforcement
 def main():
-    container = Container()
+    container = get_container()
     pool = container.postgres_pool()
-    deadline = DeadlineManager(timeout_seconds=2)
-    conn = pool.get_conn()
-    try:
-        # Usage 1: Plain cursor (no deadline enforcement)
-        print("--- Plain cursor usage (no deadline enforcement) ---")
+
+    # Usage 1: Plain cursor (no deadline enforcement) on a read-only autocommit connection
+    print("--- Plain cursor usage (no deadline enforcement) ---")
+    with pool.connection(readonly=True) as (conn, _):
         with conn.cursor() as cur:
             cur.execute("SELECT schema_name FROM information_schema.schemata;")
             schemas = cur.fetchall()
@@ -19,8 +18,10 @@ def main():
             for row in schemas:
                 print(" -", row[0])
 
-        # Usage 2: CursorWithDeadline (enforces deadline)
-        print("\n--- CursorWithDeadline usage (with deadline enforcement) ---")
+    # Usage 2: CursorWithDeadline (enforces deadline)
+    # The deadline is sent as a statement_timeout with each statement, so it also applies under readonly=True (autocommit)
+    print("\n--- CursorWithDeadline usage (with deadline enforcement) ---")
+    with pool.connection(DeadlineManager(timeout_seconds=2)) as (conn, deadline):
         with conn.cursor() as cur:
             with CursorWithDeadline(cur, deadline) as cur_with_deadline:
                 cur_with_deadline.execute("SELECT schema_name FROM information_schema.schemata;")
@@ -29,13 +30,17 @@ def main():
                 for row in schemas:
                     print(" -", row[0])
                 print("Testing deadline enforcement...")
-                time.sleep(2.1)
+                try:
+                    # Runs past the deadline, so Postgres cancels it via statement_timeout
+                    cur_with_deadline.execute("SELECT pg_sleep(3);")
+                except QueryCanceled as e:
+                    print("Deadline exceeded (cancelled by server):", e)
+                    conn.rollback()
                 try:
                     cur_with_deadline.execute("SELECT 1;")
                 except DeadlineExceeded as e:
                     print("Deadline exceeded:", e)
-    finally:
-        pool.put_conn(conn)
+        conn.rollback()
 
 if __name__ == "__main__":
     main()
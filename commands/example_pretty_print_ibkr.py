@@ -1,3 +1,4 @@
+import asyncio
 import os
 from core.csv.ibkr import IbkrCsvParser
 
@@ -19,5 +20,5 @@ if __name__ == "__main__":
     test_csv_path = os.path.join(os.path.dirname(__file__), "../ibkr_year_to_date.csv")
     logger = StdoutLogger("ibkr_example")
     parser = IbkrCsvParser(strict=False, logger=logger)
-    parser.parse(test_csv_path)
+    asyncio.run(parser.parse_async(test_csv_path))
     parser.pretty_print()
@@ -6,10 +6,11 @@ Usage:
 """
 import argparse
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from uuid import UUID
 from pathlib import Path
 
-from core.di_container import Container
+from core.di_container import get_container
 from core.csv.ibkr import IbkrCsvParser
 from domain.portfolio.portfolio_service import PortfolioService
 from domain.portfolio.repository import (
@@ -43,11 +44,10 @@ def import_ibkr_csv(portfolio_id: UUID, portfolio_name: str, tenant_id: UUID, cs
     Import IBKR CSV data into the specified portfolio.
     
     Controller-style method that:
-    1. Parses the CSV file
+    1. Opens a transaction
     2. Creates the portfolio if it doesn't exist
-    3. Opens a transaction
-    4. Imports the data
-    5. Commits the transaction
+    3. Streams the parsed CSV records into the import
+    4. Commits the transaction
     
     Args:
         portfolio_id: UUID of the portfolio to import into
@@ -58,7 +58,7 @@ def import_ibkr_csv(portfolio_id: UUID, portfolio_name: str, tenant_id: UUID, cs
     Returns:
         bool: True if import was successful, False otherwise
     """
-    container = Container()
+    container = get_container()
     db = container.postgres_pool()
     logger = container.logger()
     
@@ -68,21 +68,7 @@ def import_ibkr_csv(portfolio_id: UUID, portfolio_name: str, tenant_id: UUID, cs
         return False
     
     try:
-        # Parse the CSV file
-        logger.info(f"Parsing IBKR CSV file: {csv_file_path}")
         parser = IbkrCsvParser(logger=logger)
-        parser.parse(csv_file_path)
-        
-        trades = parser.trades
-        dividends = parser.dividends
-        positions = parser.positions
-        forex_balances = parser.forex_balances
-        
-        logger.info(f"Parsed {len(trades)} trades, {len(dividends)} dividends, {len(positions)} positions, {len(forex_balances)} forex balances")
-        
-        if not trades and not dividends and not positions:
-            logger.warning("No data found in CSV file")
-            return False
         
         # Create service
         service = create_portfolio_service(db)
@@ -103,15 +89,23 @@ def import_ibkr_csv(portfolio_id: UUID, portfolio_name: str, tenant_id: UUID, cs
 
                 logger.info(f"Using portfolio: {portfolio.id} - {portfolio.name}")
                 
-                # Import data within transaction - use the actual portfolio ID
-                result = service.import_from_ibkr(
+                # Parse and import in one pass within the transaction; records are written in
+                # batches while the file is still being read - use the actual portfolio ID
+                logger.info(f"Parsing and importing IBKR CSV file: {csv_file_path}")
+                result = service.import_from_ibkr_stream(
                     portfolio_id=portfolio.id,  # Use the actual portfolio ID, not the input ID
-                    trades=trades,
-                    dividends=dividends,
-                    positions=positions,
-                    forex_balances=forex_balances,
+                    sections=parser.iter_sections(csv_file_path),
                     conn=conn
                 )
+                logger.info(f"Parsed {result.trades_imported + result.skipped_trades} trades, "
+                            f"{result.dividends_imported + result.skipped_dividends} dividends, "
+                            f"{result.positions_imported + result.skipped_positions} positions, "
+                            f"{result.forex_balances_imported} forex balances")
+                
+                if result.success and not (result.total_items_processed or result.total_items_skipped or result.failed_items):
+                    conn.rollback()
+                    logger.warning("No data found in CSV file")
+                    return False
                 
                 if result.success:
                     # Commit transaction
@@ -126,10 +120,13 @@ def import_ibkr_csv(portfolio_id: UUID, portfolio_name: str, tenant_id: UUID, cs
                         for warning in result.warnings:
                             logger.warning(f"  - {warning}")
                     
-                    # Show results (outside transaction)
-                    holdings = service.get_equity_holdings(portfolio.id, conn=conn)
-                    cash_holdings = service.get_cash_holdings(portfolio.id, conn=conn)
-                    activities = service.get_activity_entries(portfolio.id, conn=conn)
+                    # Show results (outside transaction); the three reads are independent,
+                    # so each runs on its own pooled connection
+                    with ThreadPoolExecutor(max_workers=3) as executor:
+                        holdings, cash_holdings, activities = executor.map(
+                            lambda fetch: fetch(portfolio.id),
+                            (service.get_equity_holdings, service.get_cash_holdings, service.get_activity_entries)
+                        )
                     
                     logger.info("Import results:")
                     logger.info(f"  - {len(holdings)} equity holdings") 
@@ -155,9 +152,7 @@ def import_ibkr_csv(portfolio_id: UUID, portfolio_name: str, tenant_id: UUID, cs
             except Exception as e:
                 # Rollback on exception
                 conn.rollback()
-                logger.error(f"Error during import: {e}")
-                import traceback
-                traceback.print_exc()
+                logger.exception(f"Error during import: {e}")
                 raise
                 
     except Exception as e:
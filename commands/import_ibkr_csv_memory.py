@@ -18,7 +18,7 @@ from domain.portfolio.repository.in_memory import (
     InMemoryCashHoldingRepository,
     InMemoryActivityReportEntryRepository
 )
-from core.di_container import Container
+from core.di_container import get_container
 
 
 def create_in_memory_portfolio_service() -> PortfolioService:
@@ -48,7 +48,7 @@ def import_ibkr_csv_memory(csv_file_path: str) -> bool:
     Returns:
         bool: True if import was successful, False otherwise
     """
-    container = Container()
+    container = get_container()
     logger = container.logger()
     
     # Validate inputs
@@ -106,8 +106,9 @@ def import_ibkr_csv_memory(csv_file_path: str) -> bool:
             
             # Show some holdings
             logger.info("Holdings:")
+            equities = service.equity_repo.get_many(h.equity_id for h in holdings)
             for holding in holdings:
-                equity = service.equity_repo.get(holding.equity_id)
+                equity = equities.get(holding.equity_id)
                 logger.info(f"  - {equity.symbol if equity else 'Unknown'}: {holding.quantity} shares")
             
             return True
@@ -119,9 +120,7 @@ def import_ibkr_csv_memory(csv_file_path: str) -> bool:
             return False
                     
     except Exception as e:
-        logger.error(f"Error importing IBKR CSV: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.exception(f"Error importing IBKR CSV: {e}")
         return False
 
 
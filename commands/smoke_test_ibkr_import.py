@@ -3,12 +3,12 @@ Test the IBKR CSV import command
 """
 from uuid import uuid4
 from commands.import_ibkr_csv import import_ibkr_csv, create_portfolio_service
-from core.di_container import Container
+from core.di_container import get_container
 
 
 def test_import():
     """Test importing the sample IBKR CSV file."""
-    container = Container()
+    container = get_container()
     db = container.postgres_pool()
     logger = container.logger()
     
@@ -1,4 +1,4 @@
-from typing import Any, Optional
+from typing import Any, Dict, Iterable, Optional, Tuple
 
 class CacheBackend:
     """
@@ -12,10 +12,29 @@ class CacheBackend:
         """Store a value in the cache with an optional time-to-live (ttl) in seconds."""
         raise NotImplementedError
 
+    def get_many(self, keys: Iterable[Any]) -> Dict[Any, Any]:
+        """Retrieve several keys at once. Returns a dict holding only the keys that were found."""
+        found = {}
+        for key in keys:
+            value = self.get(key)
+            if value is not None:
+                found[key] = value
+        return found
+
+    def set_many(self, items: Iterable[Tuple[Any, Any]], ttl: Optional[float] = None) -> None:
+        """Store several (key, value) pairs with the same optional ttl."""
+        for key, value in items:
+            self.set(key, value, ttl)
+
     def delete(self, key: Any) -> None:
         """Remove a value from the cache by key."""
         raise NotImplementedError
 
+    def delete_many(self, keys: Iterable[Any]) -> None:
+        """Remove several keys from the cache."""
+        for key in keys:
+            self.delete(key)
+
     def clear(self) -> None:
         """Clear all entries from the cache."""
         raise NotImplementedError
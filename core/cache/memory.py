@@ -1,31 +1,96 @@
+import heapq
+import itertools
 import time
-from typing import Any, Optional, Dict, Tuple
+from collections import OrderedDict
+from typing import Any, Optional, Dict, Iterable, List, Tuple
 from .base import CacheBackend
 
 class MemoryCache(CacheBackend):
     """
     In-memory cache backend with optional TTL support.
     Not safe for multi-process or distributed use.
+    Expiry uses time.monotonic(), so wall-clock jumps do not expire or revive entries.
+    Holds at most max_size entries (None for unbounded), evicting the least recently used.
     """
-    def __init__(self):
-        self._store: Dict[Any, Tuple[Any, Optional[float]]] = {}
+    # Most expired entries reclaimed per set, so one write never pays for a large backlog
+    SWEEP_LIMIT = 8
+    # Stale heap entries tolerated beyond twice the live entry count before the heap is rebuilt
+    HEAP_SLACK = 16
+
+    def __init__(self, max_size: Optional[int] = 10_000):
+        self.max_size = max_size
+        self._store: "OrderedDict[Any, Tuple[Any, Optional[float]]]" = OrderedDict()
+        # Min-heap of (expires_at, tiebreak, key); entries go stale when a key is overwritten or deleted
+        self._expirations: List[Tuple[float, int, Any]] = []
+        self._tiebreak = itertools.count()
 
     def get(self, key: Any) -> Optional[Any]:
         entry = self._store.get(key)
         if entry is None:
             return None
         value, expires_at = entry
-        if expires_at is not None and expires_at < time.time():
-            self.delete(key)
+        if expires_at is not None and expires_at < time.monotonic():
+            self._store.pop(key, None)
             return None
+        self._store.move_to_end(key)
         return value
 
+    def get_many(self, keys: Iterable[Any]) -> Dict[Any, Any]:
+        store_get = self._store.get
+        move_to_end = self._store.move_to_end
+        now = time.monotonic()
+        found = {}
+        for key in keys:
+            entry = store_get(key)
+            if entry is None:
+                continue
+            value, expires_at = entry
+            if expires_at is not None and expires_at < now:
+                self._store.pop(key, None)
+                continue
+            move_to_end(key)
+            # A stored None reads as a miss, as in get() and the other backends
+            if value is not None:
+                found[key] = value
+        return found
+
     def set(self, key: Any, value: Any, ttl: Optional[float] = None) -> None:
-        expires_at = time.time() + ttl if ttl is not None else None
-        self._store[key] = (value, expires_at)
+        now = time.monotonic()
+        store = self._store
+        expires_at = now + ttl if ttl is not None else None
+        store[key] = (value, expires_at)
+        store.move_to_end(key)
+        expirations = self._expirations
+        if expires_at is not None:
+            heapq.heappush(expirations, (expires_at, next(self._tiebreak), key))
+        # Reclaim expired keys that may never be read again
+        for _ in range(self.SWEEP_LIMIT):
+            if not expirations or expirations[0][0] >= now:
+                break
+            expired_at, _, expired_key = heapq.heappop(expirations)
+            entry = store.get(expired_key)
+            if entry is not None and entry[1] == expired_at:
+                del store[expired_key]
+        if self.max_size is not None and len(store) > self.max_size:
+            store.popitem(last=False)
+        # Overwrites, deletes and evictions leave stale heap entries behind; rebuilding once the heap
+        # outgrows twice the store keeps it bounded at amortized O(1) per set
+        if len(expirations) > 2 * len(store) + self.HEAP_SLACK:
+            self._rebuild_expirations()
+
+    def _rebuild_expirations(self) -> None:
+        """Replace the expiry heap with one entry per stored key that has a TTL."""
+        tiebreak = self._tiebreak
+        self._expirations = [
+            (expires_at, next(tiebreak), key)
+            for key, (_, expires_at) in self._store.items()
+            if expires_at is not None
+        ]
+        heapq.heapify(self._expirations)
 
     def delete(self, key: Any) -> None:
         self._store.pop(key, None)
 
     def clear(self) -> None:
         self._store.clear()
+        self._expirations.clear()
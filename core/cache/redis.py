@@ -1,4 +1,5 @@
-from typing import Any, Optional, Protocol
+from typing import Any, Dict, Iterable, List, Optional, Protocol, Tuple
+import orjson
 import redis
 from .base import CacheBackend
 
@@ -6,25 +7,44 @@ from .base import CacheBackend
 class RedisClientProtocol(Protocol):
     def ping(self) -> bool: ...
     def get(self, key: Any) -> Optional[Any]: ...
+    def mget(self, keys: List[Any]) -> List[Optional[Any]]: ...
     def set(self, key: Any, value: Any): ...
     def setex(self, key: Any, ttl: int, value: Any): ...
-    def delete(self, key: Any): ...
+    def delete(self, *keys: Any): ...
     def flushdb(self): ...
+    def pipeline(self, transaction: bool = True): ...
 
 class RedisClientFactory:
     @staticmethod
-    def create(host: str = 'localhost', port: int = 6379, db: int = 0) -> RedisClientProtocol:
-        return redis.StrictRedis(host=host, port=port, db=db, decode_responses=True)
+    def create(host: str = 'localhost', port: int = 6379, db: int = 0, max_connections: int = 50) -> RedisClientProtocol:
+        # Connection options live on the pool; callers block for a free connection instead of opening more sockets
+        pool = redis.BlockingConnectionPool(
+            host=host,
+            port=port,
+            db=db,
+            max_connections=max_connections,
+            socket_keepalive=True,
+            health_check_interval=30,
+            # Values are orjson bytes, so responses are not decoded to str
+            decode_responses=False,
+        )
+        return redis.Redis(connection_pool=pool)
 
 class RedisCache(CacheBackend):
     """
     Redis cache backend with optional TTL support.
     Accepts an injectable client for testing or advanced usage.
+    Values are any orjson-serializable object and are stored as orjson bytes.
     """
     def __init__(self, host: str = 'localhost', port: int = 6379, db: int = 0, logger=None, client: Optional[RedisClientProtocol] = None, default_ttl: Optional[float] = None):
         self._client = client if client is not None else RedisClientFactory.create(host, port, db)
         self._logger = logger
         self._default_ttl = default_ttl
+        # Bound once so the per-key paths skip the client attribute lookups
+        self._get = self._client.get
+        self._set = self._client.set
+        self._setex = self._client.setex
+        self._delete = self._client.delete
 
     def test_connection(self) -> bool:
         """
@@ -42,18 +62,47 @@ class RedisCache(CacheBackend):
             return False
 
     def get(self, key: Any) -> Optional[Any]:
-        value = self._client.get(key)
-        return value
+        raw = self._get(key)
+        return orjson.loads(raw) if raw is not None else None
 
     def set(self, key: Any, value: Any, ttl: Optional[float] = None) -> None:
         use_ttl = ttl if ttl is not None else self._default_ttl
+        payload = orjson.dumps(value)
         if use_ttl is not None:
-            self._client.setex(key, int(use_ttl), value)
+            self._setex(key, int(use_ttl), payload)
         else:
-            self._client.set(key, value)
+            self._set(key, payload)
+
+    def get_many(self, keys: Iterable[Any]) -> Dict[Any, Any]:
+        """Fetch all keys with a single MGET round-trip."""
+        unique_keys = list(dict.fromkeys(keys))
+        if not unique_keys:
+            return {}
+        values = self._client.mget(unique_keys)
+        decoded = ((key, orjson.loads(raw)) for key, raw in zip(unique_keys, values) if raw is not None)
+        # A stored None (b'null') reads as a miss, as in get() and MemoryCache.get_many
+        return {key: value for key, value in decoded if value is not None}
+
+    def set_many(self, items: Iterable[Tuple[Any, Any]], ttl: Optional[float] = None) -> None:
+        """Store all pairs through one non-transactional pipeline, i.e. a single round-trip."""
+        use_ttl = ttl if ttl is not None else self._default_ttl
+        with self._client.pipeline(transaction=False) as pipe:
+            for key, value in items:
+                payload = orjson.dumps(value)
+                if use_ttl is not None:
+                    pipe.setex(key, int(use_ttl), payload)
+                else:
+                    pipe.set(key, payload)
+            pipe.execute()
 
     def delete(self, key: Any) -> None:
-        self._client.delete(key)
+        self._delete(key)
+
+    def delete_many(self, keys: Iterable[Any]) -> None:
+        """Remove all keys with a single DEL."""
+        keys = list(keys)
+        if keys:
+            self._delete(*keys)
 
     def clear(self) -> None:
         self._client.flushdb()
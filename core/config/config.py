@@ -1,9 +1,10 @@
 from .load_env import load_env
 import os
+from functools import lru_cache
 from typing import Optional
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class PostgresConfig:
     host: str
     port: int
@@ -12,43 +13,65 @@ class PostgresConfig:
     db: str
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class RedisConfig:
     host: str
     port: int
 
-def get_postgres_config(env_path: str = '.env') -> PostgresConfig:
+@dataclass(frozen=True, slots=True)
+class AppConfig:
+    postgres: PostgresConfig
+    redis: RedisConfig
+    log_level: str
+    alpha_vantage_api_key: Optional[str]
+    openai_api_key: Optional[str]
+
+
+@lru_cache(maxsize=None)
+def get_app_config(env_path: str = '.env') -> AppConfig:
     """
-    Loads the .env file and returns a PostgresConfig object.
+    Loads the .env file once and snapshots every setting into an AppConfig.
+    This is the only place settings and their defaults are read; the getters below return parts
+    of the same cached snapshot, and the DI container holds it as container.app_config().
+    The snapshot lives for the process; call get_app_config.cache_clear() to re-read the environment.
+    API keys are None when unset, so only the integrations that need them fail.
     """
     load_env(env_path)
-    return PostgresConfig(
-        host=os.environ.get('POSTGRES_HOST', 'localhost'),
-        port=int(os.environ.get('POSTGRES_PORT', 5432)),
-        user=os.environ.get('POSTGRES_USER', 'postgres'),
-        password=os.environ.get('POSTGRES_PASSWORD', 'postgres'),
-        db=os.environ.get('POSTGRES_DB', 'portfolio_db'),
+    env = os.environ.get
+    return AppConfig(
+        postgres=PostgresConfig(
+            host=env('POSTGRES_HOST', 'localhost'),
+            port=int(env('POSTGRES_PORT', 5432)),
+            user=env('POSTGRES_USER', 'postgres'),
+            password=env('POSTGRES_PASSWORD', 'postgres'),
+            db=env('POSTGRES_DB', 'portfolio_db'),
+        ),
+        redis=RedisConfig(
+            host=env('REDIS_HOST', 'localhost'),
+            port=int(env('REDIS_PORT', 6379)),
+        ),
+        log_level=env('LOG_LEVEL', 'INFO').upper(),
+        alpha_vantage_api_key=env('ALPHA_VANTAGE_API_KEY') or None,
+        openai_api_key=env('OPENAI_API_KEY') or None,
     )
 
+def get_postgres_config(env_path: str = '.env') -> PostgresConfig:
+    """
+    Returns the PostgresConfig of the AppConfig snapshot.
+    """
+    return get_app_config(env_path).postgres
+
 def get_test_postgres_config(env_path: str = '.env') -> PostgresConfig:
     """
-    Loads the .env file and returns a PostgresConfig object for the test database (db name is test_portfolio).
+    Returns the snapshot's PostgresConfig for the test database (db name is test_portfolio_db).
     """
-    load_env(env_path)
-    return PostgresConfig(
-        host=os.environ.get('POSTGRES_HOST', 'localhost'),
-        port=int(os.environ.get('POSTGRES_PORT', 5432)),
-        user=os.environ.get('POSTGRES_USER', 'postgres'),
-        password=os.environ.get('POSTGRES_PASSWORD', 'postgres'),
-        db='test_portfolio_db',
-    )
+    return replace(get_app_config(env_path).postgres, db='test_portfolio_db')
 
 def get_database_url(env_path: str = '.env') -> str:
     """
-    Loads the .env file and returns the database URL.
+    Returns the database URL for the snapshot's Postgres settings.
     If TEST_ENV is set to 'true' (case-insensitive) in the environment, use the test database name.
     """
-    load_env(env_path)
     postgres_config = get_postgres_config(env_path)
     use_test_db = os.environ.get('TEST_ENV', '').lower() == 'true'
     db_name = 'test_portfolio_db' if use_test_db else 'portfolio_db'
@@ -58,39 +81,32 @@ def get_database_url(env_path: str = '.env') -> str:
 
 def get_redis_config(env_path: str = '.env') -> RedisConfig:
     """
-    Loads the .env file and returns a RedisConfig object.
+    Returns the RedisConfig of the AppConfig snapshot.
     """
-    load_env(env_path)
-    return RedisConfig(
-        host=os.environ.get('REDIS_HOST', 'localhost'),
-        port=int(os.environ.get('REDIS_PORT', 6379)),
-    )
+    return get_app_config(env_path).redis
 
 
 def get_alpha_vantage_api_key(env_path: str = '.env') -> str:
     """
-    Loads the .env file and returns the Alpha Vantage API key.
+    Returns the Alpha Vantage API key from the AppConfig snapshot.
     """
-    load_env(env_path)
-    api_key: Optional[str] = os.environ.get('ALPHA_VANTAGE_API_KEY')
+    api_key = get_app_config(env_path).alpha_vantage_api_key
     if not api_key:
         raise ValueError("ALPHA VANTAGE API key not found in environment variables.")
     return api_key
 
 def get_log_level(env_path: str = '.env') -> str:
     """
-    Loads the .env file and returns the log level (default INFO).
+    Returns the log level (default INFO) from the AppConfig snapshot.
     """
-    load_env(env_path)
-    return os.environ.get('LOG_LEVEL', 'INFO').upper()
+    return get_app_config(env_path).log_level
 
 
 def get_openai_api_key(env_path: str = '.env') -> str:
     """
-    Loads the .env file and returns the OpenAI API key.
+    Returns the OpenAI API key from the AppConfig snapshot.
     """
-    load_env(env_path)
-    api_key: Optional[str] = os.environ.get('OPENAI_API_KEY')
+    api_key = get_app_config(env_path).openai_api_key
     if not api_key:
         raise ValueError("OpenAI API key not found in environment variables.")
     return api_key
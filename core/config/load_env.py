@@ -1,17 +1,41 @@
+import mmap
 import os
+import re
+from functools import lru_cache
+from typing import Tuple
+
+# KEY=VALUE lines; comments, blank lines and lines without '=' do not match
+_ENV_LINE = re.compile(rb'(?m)^[ \t]*([^#=\s][^=\r\n]*?)[ \t]*=[ \t]*(.*?)[ \t\r]*$')
+
+
+@lru_cache(maxsize=4)
+def _read_env(env_path: str, mtime_ns: int) -> Tuple[Tuple[str, str], ...]:
+    """
+    Parses a .env file into (key, value) pairs.
+    Keyed on the file's mtime so an edited file is re-read.
+    """
+    with open(env_path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return ()
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            matches = _ENV_LINE.findall(data)
+    pairs = []
+    for key, value in matches:
+        # Surrounding matching quotes are not part of the value
+        if len(value) >= 2 and value[0] == value[-1] and value[:1] in (b'"', b"'"):
+            value = value[1:-1]
+        pairs.append((key.decode(), value.decode()))
+    return tuple(pairs)
+
 
 def load_env(env_path: str = '.env') -> None:
     """
     Loads environment variables from a .env file into os.environ.
     """
-    if not os.path.exists(env_path):
-        raise FileNotFoundError(f".env file not found at {env_path}")
-    with open(env_path) as f:
-        for line in f:
-            line = line.strip()
-            if not line or line.startswith('#'):
-                continue
-            if '=' not in line:
-                continue
-            key, value = line.split('=', 1)
-            os.environ.setdefault(key.strip(), value.strip())
+    try:
+        mtime_ns = os.stat(env_path).st_mtime_ns
+    except FileNotFoundError:
+        raise FileNotFoundError(f".env file not found at {env_path}") from None
+    setdefault = os.environ.setdefault
+    for key, value in _read_env(env_path, mtime_ns):
+        setdefault(key, value)
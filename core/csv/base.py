@@ -1,13 +1,28 @@
-from typing import Dict, Optional, Callable, List
+from typing import Callable, Dict, List, Optional
 import csv
+from core.csv.utils import debug_enabled
+
+# Read-buffer size for CSV files: one read syscall per MiB instead of per 8 KiB default chunk
+READ_BUFFER_SIZE = 1 << 20
 
 class CsvSectionHandler:
     """
     Base class for section handlers. Subclass and override handle_row for custom logic.
     """
+    # Empty so slotted subclasses stay free of a per-instance __dict__; subclasses without __slots__ still get one
+    __slots__ = ()
+
     def handle_row(self, row: dict):
         raise NotImplementedError
 
+    def handle_row_indexed(self, row: List[str], col_idx: Dict[str, int]):
+        """
+        Handle a data row given as the raw cell list plus a column name -> index map built once per header.
+        Override to read only the cells you need (row[col_idx['Symbol']]) without building a dict per row;
+        the default builds the dict and delegates to handle_row.
+        """
+        self.handle_row({name: row[i] for name, i in col_idx.items()})
+
 class BaseCSVParser:
     def __init__(
         self,
@@ -32,39 +47,63 @@ class BaseCSVParser:
         current_section = None
         handler = None
         header = None
-        with open(file_path, newline='', encoding='utf-8') as f:
+        header_len = 0
+        col_idx = None
+        # Bind per-row lookups once instead of resolving them on every row
+        detect_section = self.section_header_detector or self._default_detect_section
+        handlers_get = self.section_handlers.get
+        # Decided once per parse so disabled debug messages are never formatted
+        debug = debug_enabled(self.logger)
+        with open(file_path, newline='', encoding='utf-8', buffering=READ_BUFFER_SIZE) as f:
             reader = csv.reader(f)
             for row_num, row in enumerate(reader):
-                if not any(cell.strip() for cell in row):
-                    continue  # skip blank lines
+                # skip blank lines; a non-blank first cell settles it without joining the whole row
+                if not (row and row[0].strip()) and not ''.join(row).strip():
+                    continue
                 # Section header detection
-                section = self._detect_section(row)
+                section = detect_section(row)
                 if section is not None:
-                    self.logger.debug(f"[DEBUG] Section change at row {row_num+1}: {current_section} -> {section}")
+                    if debug:
+                        self.logger.debug(f"[DEBUG] Section change at row {row_num+1}: {current_section} -> {section}")
                     current_section = section
-                    handler = self.section_handlers.get(current_section)
+                    handler = handlers_get(current_section)
                     header = None
                     continue
                 # Header row detection (first non-empty row after section header)
                 if header is None:
-                    self.logger.debug(f"[DEBUG] New header for section '{current_section}' at row {row_num+1}: {row}")
+                    if debug:
+                        self.logger.debug(f"[DEBUG] New header for section '{current_section}' at row {row_num+1}: {row}")
                     header = row
+                    header_len = len(header)
+                    col_idx = {name: i for i, name in enumerate(header)}
                     continue
                 # Data row
                 if handler is None:
-                    handler = self.section_handlers.get(None)
+                    handler = handlers_get(None)
                 if handler is None:
-                    self.logger.debug(f"[DEBUG] No handler for section '{current_section}' at row {row_num+1}")
-                    self._handle_error(f"No handler for section '{current_section}' at row {row_num+1}")
+                    message = f"No handler for section '{current_section}' at row {row_num+1}"
+                    if debug:
+                        self.logger.debug(f"[DEBUG] {message}")
+                    self._handle_error(message)
+                    continue
+                if len(row) != header_len:
+                    message = (f"Error in section '{current_section}' at row {row_num+1}: "
+                               f"Row length {len(row)} does not match header length {header_len} at row {row_num+1}")
+                    if debug:
+                        self.logger.debug(f"[DEBUG] {message}")
+                    self._handle_error(message)
                     continue
                 try:
-                    if len(row) != len(header):
-                        raise ValueError(f"Row length {len(row)} does not match header length {len(header)} at row {row_num+1}")
-                    data = dict(zip(header, row))
-                    handler.handle_row(data)
+                    # Handlers outside the CsvSectionHandler hierarchy only implement handle_row(dict)
+                    if isinstance(handler, CsvSectionHandler):
+                        handler.handle_row_indexed(row, col_idx)
+                    else:
+                        handler.handle_row(dict(zip(header, row)))
                 except Exception as e:
-                    self.logger.debug(f"[DEBUG] Error in section '{current_section}' at row {row_num+1}: {e}")
-                    self._handle_error(f"Error in section '{current_section}' at row {row_num+1}: {e}")
+                    message = f"Error in section '{current_section}' at row {row_num+1}: {e}"
+                    if debug:
+                        self.logger.debug(f"[DEBUG] {message}")
+                    self._handle_error(message)
         if self.errors and self.strict:
             raise RuntimeError(f"Parsing failed with errors: {self.errors}")
         return self
@@ -72,9 +111,16 @@ class BaseCSVParser:
     def _detect_section(self, row: List[str]) -> Optional[str]:
         if self.section_header_detector:
             return self.section_header_detector(row)
+        return self._default_detect_section(row)
+
+    @staticmethod
+    def _default_detect_section(row: List[str]) -> Optional[str]:
         # Default: treat rows with 'Header' in second column as section header
-        if len(row) > 1 and row[1].strip().lower() == 'header':
-            return row[0].strip()
+        if len(row) > 1:
+            cell = row[1]
+            # Exact match first; cells shorter than 'header' cannot match, so skip strip/lower for them
+            if cell == 'Header' or (len(cell) >= 6 and cell.strip().lower() == 'header'):
+                return row[0].strip()
         return None
 
     def _handle_error(self, msg: str):
@@ -1,126 +1,365 @@
-from typing import Dict, Optional, List
-from core.csv.base import BaseCSVParser, CsvSectionHandler
-from datetime import datetime
+import asyncio
+import os
+import sys
+from collections import OrderedDict
+from copy import copy
+from typing import Any, Callable, Dict, Iterator, Optional, List, Tuple
+from core.csv.base import READ_BUFFER_SIZE, BaseCSVParser, CsvSectionHandler
+from datetime import date, datetime
 from core.csv.state_machine import CsvStateMachine
+from core.csv.utils import debug_enabled
 from enum import Enum
+from functools import partial, partialmethod
+from itertools import groupby
+from operator import itemgetter
+
+def _advise_sequential(f):
+    """Ask the kernel for aggressive readahead on f; a no-op where fadvise or a real fd is unavailable."""
+    try:
+        os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+    except (AttributeError, TypeError, OSError):
+        pass
+
+# Statement date formats: Period is "January 1, 2024 - December 31, 2024", WhenGenerated starts "2024-12-31"
+_PERIOD_DATE_FORMAT = "%B %d, %Y"
+_GENERATED_DATE_FORMAT = "%Y-%m-%d"
+_MONTHS = {
+    name: number for number, name in enumerate(
+        ("January", "February", "March", "April", "May", "June", "July",
+         "August", "September", "October", "November", "December"), start=1)
+}
+
+def _parse_period_date(text: str) -> date:
+    """
+    Parse an IBKR period date such as "January 1, 2024" without strptime's format machinery.
+    Anything not in that exact shape goes through strptime, so errors and edge cases match it.
+    """
+    month, _, rest = text.partition(" ")
+    day, _, year = rest.partition(", ")
+    number = _MONTHS.get(month)
+    if number and day.isdigit() and len(day) <= 2 and year.isdigit() and len(year) == 4:
+        return date(int(year), number, int(day))
+    return datetime.strptime(text, _PERIOD_DATE_FORMAT).date()
+
+def _parse_when_generated(text: str) -> datetime:
+    """
+    Parse an IBKR generation date such as "2024-12-31" (midnight) with fromisoformat.
+    Anything not in that zero-padded shape goes through strptime, so errors and edge cases match it.
+    """
+    if (len(text) == 10 and text[4] == "-" and text[7] == "-"
+            and text[:4].isdigit() and text[5:7].isdigit() and text[8:].isdigit()):
+        return datetime.fromisoformat(text)
+    return datetime.strptime(text, _GENERATED_DATE_FORMAT)
+
+# Cells IBKR uses for "no value"
+_BLANK_CELLS = frozenset(("", "--"))
 
 def parse_float(val):
+    if val.__class__ is str:
+        # Fast path for CSV cells: blanks are rejected by lookup instead of a raised exception,
+        # and the thousands separator is only stripped when present
+        if val in _BLANK_CELLS:
+            return None
+        if "," in val:
+            val = val.replace(",", "")
+        try:
+            return float(val)
+        except ValueError:
+            return None
     try:
-        if val is None or val == "" or val == "--":
+        if val is None:
             return None
         return float(str(val).replace(",", ""))
     except Exception:
         return None
+
+def _first_float(*vals):
+    """parse_float of the first value that parses; unlike `a or b`, a legitimate 0.0 is kept and b is never parsed."""
+    for val in vals:
+        result = parse_float(val)
+        if result is not None:
+            return result
+    return None
+
+def _intern(value):
+    """Intern a repeated label (symbol, currency, code, ...) so every record shares one string object."""
+    return sys.intern(value) if value else value
+
+# Numeric columns per section, converted with one map(parse_float, ...) pass per record
+_TRADE_NUMERIC_COLUMNS = (
+    "quantity", "t._price", "c._price", "proceeds", "basis", "realized_p_l",
+)
+_POSITION_NUMERIC_COLUMNS = (
+    "quantity", "mult", "cost_price", "cost_basis", "close_price", "value", "unrealized_p_l",
+)
+_FOREX_NUMERIC_COLUMNS = (
+    "quantity", "cost_price", "cost_basis_in_cad", "close_price", "value_in_cad", "unrealized_p_l_in_cad",
+)
     
 class IbkrStatementHandler(CsvSectionHandler):
+    __slots__ = ("statement_metadata",)
+
     def __init__(self):
         self.statement_metadata = {}
 
-    def handle_row(self, row: dict):
+    def build_record(self, row: dict) -> Optional[dict]:
         # Accepts a dict with keys like 'field_name' and 'field_value' from generic parsing
-        field = row.get('field_name')
-        value = row.get('field_value')
-        if field:
-            self.statement_metadata[field] = value
+        return row if row.get('field_name') else None
+
+    def handle_row(self, row: dict):
+        record = self.build_record(row)
+        if record:
+            self.statement_metadata[record['field_name']] = record.get('field_value')
+
+class _IbkrRecordHandler(CsvSectionHandler):
+    """
+    Builds one record per data row from the normalized columns named in COLUMNS.
+    Rows arrive either as dicts (build_record) or as raw cell lists plus the section's column index
+    (build_record_indexed); the latter resolves COLUMNS to positions once per header, so no dict is built per row.
+    """
+    __slots__ = ("_plan_for", "_plan")
+    COLUMNS: Tuple[str, ...] = ()
+    _columns_getter: Callable[[dict], tuple] = staticmethod(lambda row: ())
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # One C-level call fetches every column; itemgetter returns a bare value for a single key
+        columns = cls.COLUMNS
+        cls._columns_getter = staticmethod(
+            itemgetter(*columns) if len(columns) > 1 else lambda row: tuple(map(row.__getitem__, columns)))
+
+    def __init__(self):
+        self._plan_for: Optional[Dict[str, int]] = None
+        self._plan: Tuple[Optional[int], ...] = ()
+
+    def build_values(self, values) -> Optional[dict]:
+        """Build a record from the cell values of COLUMNS, in order (None for columns the header lacks)."""
+        raise NotImplementedError
+
+    def build_record(self, row: dict) -> Optional[dict]:
+        try:
+            values = self._columns_getter(row)
+        except KeyError:
+            # The header lacks some columns; those read as None
+            values = tuple(map(row.get, self.COLUMNS))
+        return self.build_values(values)
+
+    def column_plan(self, col_idx: Dict[str, int]) -> Tuple[Optional[int], ...]:
+        """Position of each COLUMNS entry in a data row, recomputed only when the header changes."""
+        if col_idx is not self._plan_for:
+            self._plan_for = col_idx
+            self._plan = tuple(map(col_idx.get, self.COLUMNS))
+        return self._plan
+
+    def build_record_indexed(self, row: List[str], col_idx: Dict[str, int]) -> Optional[dict]:
+        return self.build_values([None if i is None else row[i] for i in self.column_plan(col_idx)])
+
+class IbkrTradesHandler(_IbkrRecordHandler):
+    __slots__ = ("trades",)
+    COLUMNS = (("datadiscriminator", "asset_category", "currency", "symbol", "date_time") + _TRADE_NUMERIC_COLUMNS
+               + ("comm_fee", "comm_in_cad", "mtm_p_l", "mtm_in_cad", "code"))
 
-class IbkrTradesHandler(CsvSectionHandler):
     def __init__(self):
+        super().__init__()
         self.trades: List[dict] = []
 
-    def handle_row(self, row: dict):
+    def build_values(self, values) -> Optional[dict]:
+        (discriminator, asset_category, currency, symbol, date_time,
+         quantity, t_price, c_price, proceeds, basis, realized_pl,
+         comm_fee, comm_in_cad, mtm_pl, mtm_in_cad, code) = values
         # Only process rows with a symbol and datetime (skip SubTotal/Total)
-        if not row.get("symbol") or not row.get("date_time"):
-            return
-        trade = {
-            "data_discriminator": row.get("datadiscriminator"),
-            "asset_category": row.get("asset_category"),
-            "currency": row.get("currency"),
-            "symbol": row.get("symbol"),
-            "datetime": row.get("date_time"),
-            "quantity": parse_float(row.get("quantity")),
-            "t_price": parse_float(row.get("t._price")),  # Handle normalized field name
-            "c_price": parse_float(row.get("c._price")),  # Handle normalized field name
-            "proceeds": parse_float(row.get("proceeds")),
-            "commission": parse_float(row.get("comm_fee")) or parse_float(row.get("comm_in_cad")),
-            "basis": parse_float(row.get("basis")),
-            "realized_pl": parse_float(row.get("realized_p_l")),
-            "mtm_pl": parse_float(row.get("mtm_p_l")) or parse_float(row.get("mtm_in_cad")),
-            "code": row.get("code"),
+        if not symbol or not date_time:
+            return None
+        quantity, t_price, c_price, proceeds, basis, realized_pl = map(
+            parse_float, (quantity, t_price, c_price, proceeds, basis, realized_pl))
+        return {
+            "data_discriminator": _intern(discriminator),
+            "asset_category": _intern(asset_category),
+            "currency": _intern(currency),
+            "symbol": _intern(symbol),
+            "datetime": date_time,
+            "quantity": quantity,
+            "t_price": t_price,  # Handle normalized field name
+            "c_price": c_price,  # Handle normalized field name
+            "proceeds": proceeds,
+            "commission": _first_float(comm_fee, comm_in_cad),
+            "basis": basis,
+            "realized_pl": realized_pl,
+            "mtm_pl": _first_float(mtm_pl, mtm_in_cad),
+            "code": _intern(code),
         }
-        self.trades.append(trade)
 
-class IbkrDividendsHandler(CsvSectionHandler):
+    def handle_row(self, row: dict):
+        record = self.build_record(row)
+        if record is not None:
+            self.trades.append(record)
+
+    def handle_row_indexed(self, row: List[str], col_idx: Dict[str, int]):
+        record = self.build_record_indexed(row, col_idx)
+        if record is not None:
+            self.trades.append(record)
+
+class IbkrDividendsHandler(_IbkrRecordHandler):
+    __slots__ = ("dividends",)
+    COLUMNS = ("currency", "date", "description", "amount")
+
     def __init__(self):
+        super().__init__()
         self.dividends: List[dict] = []
 
-    def handle_row(self, row: dict):
+    def build_values(self, values) -> Optional[dict]:
+        currency, date, description, amount = values
         # Only process rows with a date and description (skip Total rows)
-        if not row.get("date") or not row.get("description"):
-            return
-        dividend = {
-            "currency": row.get("currency"),
-            "date": row.get("date"),
-            "description": row.get("description"),
-            "amount": parse_float(row.get("amount")),
+        if not date or not description:
+            return None
+        return {
+            "currency": _intern(currency),
+            "date": date,
+            "description": description,
+            "amount": parse_float(amount),
         }
-        self.dividends.append(dividend)
 
-class IbkrOpenPositionsHandler(CsvSectionHandler):
+    def handle_row(self, row: dict):
+        record = self.build_record(row)
+        if record is not None:
+            self.dividends.append(record)
+
+    def handle_row_indexed(self, row: List[str], col_idx: Dict[str, int]):
+        record = self.build_record_indexed(row, col_idx)
+        if record is not None:
+            self.dividends.append(record)
+
+class IbkrOpenPositionsHandler(_IbkrRecordHandler):
+    __slots__ = ("positions",)
+    COLUMNS = ("datadiscriminator", "asset_category", "currency", "symbol") + _POSITION_NUMERIC_COLUMNS + ("code",)
+
     def __init__(self):
+        super().__init__()
         self.positions: List[dict] = []
 
-    def handle_row(self, row: dict):
+    def build_values(self, values) -> Optional[dict]:
+        (discriminator, asset_category, currency, symbol,
+         quantity, mult, cost_price, cost_basis, close_price, value, unrealized_pl, code) = values
         # Only process rows with a symbol and quantity (skip Total rows)
-        if not row.get("symbol") or not row.get("quantity"):
-            return
-        position = {
-            "data_discriminator": row.get("datadiscriminator"),
-            "asset_category": row.get("asset_category"),
-            "currency": row.get("currency"),
-            "symbol": row.get("symbol"),
-            "quantity": parse_float(row.get("quantity")),
-            "mult": parse_float(row.get("mult")),
-            "cost_price": parse_float(row.get("cost_price")),
-            "cost_basis": parse_float(row.get("cost_basis")),
-            "close_price": parse_float(row.get("close_price")),
-            "value": parse_float(row.get("value")),
-            "unrealized_pl": parse_float(row.get("unrealized_p_l")),
-            "code": row.get("code"),
+        if not symbol or not quantity:
+            return None
+        quantity, mult, cost_price, cost_basis, close_price, value, unrealized_pl = map(
+            parse_float, (quantity, mult, cost_price, cost_basis, close_price, value, unrealized_pl)
+        )
+        return {
+            "data_discriminator": _intern(discriminator),
+            "asset_category": _intern(asset_category),
+            "currency": _intern(currency),
+            "symbol": _intern(symbol),
+            "quantity": quantity,
+            "mult": mult,
+            "cost_price": cost_price,
+            "cost_basis": cost_basis,
+            "close_price": close_price,
+            "value": value,
+            "unrealized_pl": unrealized_pl,
+            "code": _intern(code),
         }
-        self.positions.append(position)
 
-class IbkrForexBalancesHandler(CsvSectionHandler):
+    def handle_row(self, row: dict):
+        record = self.build_record(row)
+        if record is not None:
+            self.positions.append(record)
+
+    def handle_row_indexed(self, row: List[str], col_idx: Dict[str, int]):
+        record = self.build_record_indexed(row, col_idx)
+        if record is not None:
+            self.positions.append(record)
+
+class IbkrForexBalancesHandler(_IbkrRecordHandler):
+    __slots__ = ("forex_balances",)
+    COLUMNS = ("asset_category", "currency", "description") + _FOREX_NUMERIC_COLUMNS + ("code",)
+
     def __init__(self):
+        super().__init__()
         self.forex_balances: List[dict] = []
 
-    def handle_row(self, row: dict):
+    def build_values(self, values) -> Optional[dict]:
+        (asset_category, currency, description,
+         quantity, cost_price, cost_basis_in_cad, close_price, value_in_cad, unrealized_pl_in_cad, code) = values
         # Only process rows with currency and quantity (skip Total rows)
-        if not row.get("currency") or not row.get("quantity") or row.get("currency") == "":
-            return
+        if not currency or not quantity:
+            return None
         
         # In IBKR forex balances, the 'description' field contains the actual currency
         # while 'currency' field shows the base currency (usually CAD)
-        actual_currency = row.get("description") or row.get("currency")
+        quantity, cost_price, cost_basis_in_cad, close_price, value_in_cad, unrealized_pl_in_cad = map(
+            parse_float, (quantity, cost_price, cost_basis_in_cad, close_price, value_in_cad, unrealized_pl_in_cad)
+        )
         
-        forex_balance = {
-            "asset_category": row.get("asset_category"),
-            "currency": actual_currency,  # Use description as the actual currency
-            "base_currency": row.get("currency"),  # The original currency column
-            "description": row.get("description"),
-            "quantity": parse_float(row.get("quantity")),
-            "cost_price": parse_float(row.get("cost_price")),
-            "cost_basis_in_cad": parse_float(row.get("cost_basis_in_cad")),
-            "close_price": parse_float(row.get("close_price")),
-            "value_in_cad": parse_float(row.get("value_in_cad")),
-            "unrealized_pl_in_cad": parse_float(row.get("unrealized_p_l_in_cad")),
-            "code": row.get("code"),
+        return {
+            "asset_category": _intern(asset_category),
+            "currency": _intern(description or currency),  # Use description as the actual currency
+            "base_currency": _intern(currency),  # The original currency column
+            "description": _intern(description),
+            "quantity": quantity,
+            "cost_price": cost_price,
+            "cost_basis_in_cad": cost_basis_in_cad,
+            "close_price": close_price,
+            "value_in_cad": value_in_cad,
+            "unrealized_pl_in_cad": unrealized_pl_in_cad,
+            "code": _intern(code),
         }
-        self.forex_balances.append(forex_balance)
 
-def ibkr_section_header_detector(row: List[str]) -> Optional[str]:
-    if len(row) > 1 and row[1].strip().lower() == 'header':
-        return row[0].strip()
-    return None
+    def handle_row(self, row: dict):
+        record = self.build_record(row)
+        if record is not None:
+            self.forex_balances.append(record)
+
+    def handle_row_indexed(self, row: List[str], col_idx: Dict[str, int]):
+        record = self.build_record_indexed(row, col_idx)
+        if record is not None:
+            self.forex_balances.append(record)
+
+class _RecordCollector(CsvSectionHandler):
+    """Buffers the records a section handler builds, so iter_sections can yield them row by row."""
+    __slots__ = ("handler", "records", "_build_indexed")
+
+    def __init__(self, handler: CsvSectionHandler):
+        self.handler = handler
+        self.records: List[dict] = []
+        # Positional builder of the IBKR handlers; other handlers get a dict per row
+        self._build_indexed = getattr(handler, "build_record_indexed", None)
+
+    def handle_row(self, row: dict):
+        record = self.handler.build_record(row)
+        if record is not None:
+            self.records.append(record)
+
+    def handle_row_indexed(self, row: List[str], col_idx: Dict[str, int]):
+        if self._build_indexed is None:
+            return super().handle_row_indexed(row, col_idx)
+        record = self._build_indexed(row, col_idx)
+        if record is not None:
+            self.records.append(record)
+
+# IBKR marks section headers exactly like the base parser's default ('Header' in the second column)
+ibkr_section_header_detector = BaseCSVParser._default_detect_section
+
+def _split_sections(reader) -> Iterator[Tuple[Optional[str], Iterator[List[str]]]]:
+    """
+    Lazily split a CSV reader into (section_name, rows) pairs, starting a new pair at every section header.
+    Each rows iterator reads from the underlying reader and must be consumed (or dropped) before the next pair.
+    Rows before the first header are yielded under the name None.
+    """
+    current = [0, None]  # headers seen so far, name of the latest one
+
+    def header_count(row):
+        # Inlined ibkr_section_header_detector: this runs once per row of the file
+        if len(row) > 1:
+            cell = row[1]
+            if cell == 'Header' or (len(cell) >= 6 and cell.strip().lower() == 'header'):
+                current[0] += 1
+                current[1] = row[0].strip()
+        return current[0]
+
+    for _, rows in groupby(reader, key=header_count):
+        yield current[1], rows
 
 class SectionNames(Enum):
     TRADES = "Trades"
@@ -129,6 +368,23 @@ class SectionNames(Enum):
     STATEMENT = "Statement"
     FOREX_BALANCES = "Forex Balances"
 
+# Default handler class and the attribute holding its records, per section
+_DEFAULT_HANDLERS = {
+    SectionNames.TRADES.value: (IbkrTradesHandler, "trades"),
+    SectionNames.DIVIDENDS.value: (IbkrDividendsHandler, "dividends"),
+    SectionNames.OPEN_POSITIONS.value: (IbkrOpenPositionsHandler, "positions"),
+    SectionNames.STATEMENT.value: (IbkrStatementHandler, "statement_metadata"),
+    SectionNames.FOREX_BALANCES.value: (IbkrForexBalancesHandler, "forex_balances"),
+}
+
+_PARSE_CACHE_SIZE = 8
+# (absolute path, st_mtime_ns, st_size) -> (records per section, errors); least recently used first
+_parse_cache: "OrderedDict[Tuple[str, int, int], Tuple[Dict[str, Any], Tuple[str, ...]]]" = OrderedDict()
+
+def clear_parse_cache() -> None:
+    """Forget every cached parse result."""
+    _parse_cache.clear()
+
 class IbkrCsvParser(BaseCSVParser):
     def __init__(
         self,
@@ -137,13 +393,7 @@ class IbkrCsvParser(BaseCSVParser):
         logger=None,
     ):
         if section_handlers is None:
-            section_handlers = {
-                SectionNames.TRADES.value: IbkrTradesHandler(),
-                SectionNames.DIVIDENDS.value: IbkrDividendsHandler(),
-                SectionNames.OPEN_POSITIONS.value: IbkrOpenPositionsHandler(),
-                SectionNames.STATEMENT.value: IbkrStatementHandler(),
-                SectionNames.FOREX_BALANCES.value: IbkrForexBalancesHandler(),
-            }
+            section_handlers = {name: handler_cls() for name, (handler_cls, _) in _DEFAULT_HANDLERS.items()}
         super().__init__(
             section_handlers=section_handlers,
             strict=strict,
@@ -162,6 +412,11 @@ class IbkrCsvParser(BaseCSVParser):
         
         # Initialize state machine
         self.state_machine = CsvStateMachine(self.logger)
+        # Section name -> (parse method, kind), resolved here for the known sections instead of per parsed section
+        self._section_parsers: Dict[str, Tuple[Callable[[Any, Any], None], str]] = {}
+        for section_name in self.section_handlers:
+            if section_name is not None:
+                self._section_parser(section_name)
 
     @property
     def trades(self):
@@ -188,21 +443,21 @@ class IbkrCsvParser(BaseCSVParser):
         handler = self.section_handlers.get(SectionNames.FOREX_BALANCES.value)
         return handler.forex_balances if handler else []
     
-    def _parse_section_trades(self, rows, handler):
-        self.state_machine.transition_to_section(SectionNames.TRADES.value)
-        self.state_machine.process_section(rows, handler)
-
-    def _parse_section_open_positions(self, rows, handler):
-        self.state_machine.transition_to_section(SectionNames.OPEN_POSITIONS.value)
+    def _parse_section(self, section_name, rows, handler):
+        """
+        Parse one section's rows with the state machine state registered for section_name.
+        Sections differ only in that state (summary-row rules, row layout), so one method serves them all.
+        """
+        self.state_machine.transition_to_section(section_name)
         self.state_machine.process_section(rows, handler)
 
-    def _parse_section_dividends(self, rows, handler):
-        self.state_machine.transition_to_section(SectionNames.DIVIDENDS.value)
-        self.state_machine.process_section(rows, handler)
+    _parse_section_trades = partialmethod(_parse_section, SectionNames.TRADES.value)
+    _parse_section_open_positions = partialmethod(_parse_section, SectionNames.OPEN_POSITIONS.value)
+    _parse_section_dividends = partialmethod(_parse_section, SectionNames.DIVIDENDS.value)
+    _parse_section_forex_balances = partialmethod(_parse_section, SectionNames.FOREX_BALANCES.value)
 
     def _parse_section_statement(self, rows, handler=None):
-        self.state_machine.transition_to_section(SectionNames.STATEMENT.value)
-        self.state_machine.process_section(rows, handler)
+        self._parse_section(SectionNames.STATEMENT.value, rows, handler)
         
         # Post-process statement metadata
         self._process_statement_metadata(handler)
@@ -213,7 +468,8 @@ class IbkrCsvParser(BaseCSVParser):
             return
             
         meta = handler.statement_metadata
-        if self.logger:
+        debug = bool(self.logger) and debug_enabled(self.logger)
+        if debug:
             self.logger.debug(f"[IBKR DEBUG] Extracted statement_info: {meta}")
         
         # Parse period
@@ -222,7 +478,7 @@ class IbkrCsvParser(BaseCSVParser):
         # Parse generated date
         self._parse_generated_date(meta)
         
-        if self.logger:
+        if debug:
             self.logger.debug(f"[IBKR DEBUG] Final statement_metadata: {meta}")
 
     def _parse_period(self, meta):
@@ -231,10 +487,10 @@ class IbkrCsvParser(BaseCSVParser):
         if " - " in period:
             period_start, period_end = [d.strip().replace('"', '') for d in period.split(" - ")]
             try:
-                meta["PeriodStart"] = datetime.strptime(period_start, "%B %d, %Y").date()
-                meta["PeriodEnd"] = datetime.strptime(period_end, "%B %d, %Y").date()
+                meta["PeriodStart"] = _parse_period_date(period_start)
+                meta["PeriodEnd"] = _parse_period_date(period_end)
             except Exception as e:
-                if self.logger:
+                if self.logger and debug_enabled(self.logger):
                     self.logger.debug(f"[IBKR DEBUG] Failed to parse period: {e}")
                 meta["PeriodStart"] = period_start
                 meta["PeriodEnd"] = period_end
@@ -243,16 +499,12 @@ class IbkrCsvParser(BaseCSVParser):
         """Parse generated date from statement metadata."""
         when_generated = meta.get("WhenGenerated", "").replace('"', '').split(",")[0]
         try:
-            meta["GeneratedAt"] = datetime.strptime(when_generated, "%Y-%m-%d")
+            meta["GeneratedAt"] = _parse_when_generated(when_generated)
         except Exception as e:
-            if self.logger:
+            if self.logger and debug_enabled(self.logger):
                 self.logger.debug(f"[IBKR DEBUG] Failed to parse generated date: {e}")
             meta["GeneratedAt"] = when_generated
 
-    def _parse_section_forex_balances(self, rows, handler):
-        self.state_machine.transition_to_section(SectionNames.FOREX_BALANCES.value)
-        self.state_machine.process_section(rows, handler)
-
     def pretty_print(self, sections=None):
         """
         Pretty print the parsed IBKR CSV data.
@@ -300,37 +552,124 @@ class IbkrCsvParser(BaseCSVParser):
     def parse(self, file_path: str):
         """
         Per-section parsing for IBKR's multi-section CSV format. Each section is parsed by a dedicated method for robustness.
+        Sections are handed over as lazy row iterators fed straight from the reader, so rows are parsed as they are read
+        and neither the file nor a section is ever held as a list.
+        Files parsed with the default handlers are cached by (path, mtime, size), so parsing an unchanged
+        file again copies the earlier records instead of re-reading it.
         """
-        import csv
-        with open(file_path, newline='', encoding='utf-8-sig') as f:
-            reader = list(csv.reader(f))
-        # Find all section start indices
-        section_indices = []
-        for idx, row in enumerate(reader):
-            if len(row) > 1 and row[1].strip().lower() == 'header':
-                section_indices.append(idx)
-        section_indices.append(len(reader))  # Sentinel for last section
-
-        for i in range(len(section_indices) - 1):
-            start = section_indices[i]
-            end = section_indices[i+1]
-            section_row = reader[start]
-            section_name = section_row[0].strip()
-            if section_name in self.section_handlers:
-                parse_method = getattr(self, f'_parse_section_{section_name.lower().replace(" ", "_")}', None)
-                if parse_method:
-                    self.logger.debug(f"[IBKR DEBUG] Using custom parser for section '{section_name}'")
-                    parse_method(reader[start:end], self.section_handlers[section_name])
-                else:
-                    self.logger.debug(f"[IBKR DEBUG] Using generic parser for section '{section_name}'")
-                    self._parse_section_generic(reader[start:end], self.section_handlers[section_name])
+        key = self._cache_key(file_path)
+        if key is None:
+            self._parse_file(file_path)
+        else:
+            cached = _parse_cache.get(key)
+            if cached is None:
+                fresh = IbkrCsvParser(strict=False, logger=self.logger)
+                fresh._parse_file(file_path)
+                cached = _parse_cache[key] = (
+                    {name: copy(getattr(fresh.section_handlers[name], attr)) for name, (_, attr) in _DEFAULT_HANDLERS.items()},
+                    tuple(fresh.errors),
+                )
+                if len(_parse_cache) > _PARSE_CACHE_SIZE:
+                    _parse_cache.popitem(last=False)
+            else:
+                _parse_cache.move_to_end(key)
+            self._apply_cached(*cached)
         if self.errors and self.strict:
             raise RuntimeError(f"Parsing failed with errors: {self.errors}")
         return self
 
+    def _cache_key(self, file_path: str) -> Optional[Tuple[str, int, int]]:
+        """Cache key for file_path, or None when the result must not be cached (custom handlers, unreadable path)."""
+        handlers = self.section_handlers
+        if handlers.keys() != _DEFAULT_HANDLERS.keys() or any(
+            type(handlers[name]) is not handler_cls for name, (handler_cls, _) in _DEFAULT_HANDLERS.items()
+        ):
+            return None
+        try:
+            st = os.stat(file_path)
+        except (OSError, TypeError, ValueError):
+            return None
+        return os.path.abspath(file_path), st.st_mtime_ns, st.st_size
+
+    def _apply_cached(self, records: Dict[str, Any], errors: Tuple[str, ...]):
+        """Add cached results to this parser's handlers; every record is copied so callers can't alter the cache."""
+        for name, (_, attr) in _DEFAULT_HANDLERS.items():
+            target = getattr(self.section_handlers[name], attr)
+            if isinstance(target, dict):
+                target.update(records[name])
+            else:
+                target.extend(map(dict.copy, records[name]))
+        self.errors.extend(errors)
+
+    def _parse_file(self, file_path: str):
+        """Read and parse file_path into this parser's handlers, bypassing the cache."""
+        import csv
+        with open(file_path, newline='', encoding='utf-8-sig', buffering=READ_BUFFER_SIZE) as f:
+            _advise_sequential(f)
+            for section_name, rows in _split_sections(csv.reader(f)):
+                self._dispatch_section(section_name, rows)
+
+    async def parse_async(self, file_path: str):
+        """
+        Run parse() in a worker thread so the event loop stays free while the file is read and parsed.
+        The file is opened with sequential readahead, letting the kernel fetch ahead of the parser.
+        """
+        return await asyncio.to_thread(self.parse, file_path)
+
+    def iter_sections(self, file_path: str) -> Iterator[Tuple[str, dict]]:
+        """
+        Lazily yield (section_name, record) pairs from an IBKR CSV, one record per data row.
+        Records have the same shape as the entries of trades/dividends/positions/forex_balances,
+        but are not accumulated on the handlers, so callers can import while parsing.
+        """
+        import csv
+        collector = None
+        with open(file_path, newline='', encoding='utf-8-sig', buffering=READ_BUFFER_SIZE) as f:
+            _advise_sequential(f)
+            for row in csv.reader(f):
+                header_name = ibkr_section_header_detector(row)
+                if header_name is not None:
+                    handler = self.section_handlers.get(header_name)
+                    collector = _RecordCollector(handler) if hasattr(handler, 'build_record') else None
+                    if collector:
+                        self.state_machine.transition_to_section(header_name)
+                        section_name = header_name
+                        process = self.state_machine.current_processor
+                if collector is None:
+                    continue
+                process((row,), collector)
+                if collector.records:
+                    for record in collector.records:
+                        yield section_name, record
+                    collector.records.clear()
+
+    def _section_parser(self, section_name: str) -> Tuple[Callable[[Any, Any], None], str]:
+        """
+        The (parse method, "custom" | "generic") pair for section_name: its _parse_section_<name> method if defined,
+        otherwise _parse_section bound to the name. Resolved once per section name and kept in self._section_parsers.
+        """
+        entry = self._section_parsers.get(section_name)
+        if entry is None:
+            parse_method = getattr(self, f'_parse_section_{section_name.lower().replace(" ", "_")}', None)
+            if parse_method:
+                entry = (parse_method, "custom")
+            else:
+                entry = (partial(self._parse_section, section_name), "generic")
+            self._section_parsers[section_name] = entry
+        return entry
+
+    def _dispatch_section(self, section_name, rows):
+        """Hand the rows of one section to its dedicated parser, if the section has a handler."""
+        handler = self.section_handlers.get(section_name)
+        if handler is None and section_name not in self.section_handlers:
+            return
+        parse_method, kind = self._section_parser(section_name)
+        if debug_enabled(self.logger):
+            self.logger.debug(f"[IBKR DEBUG] Using {kind} parser for section '{section_name}'")
+        parse_method(rows, handler)
+
     def _parse_section_generic(self, rows, handler):
         """Generic section parsing using state machine."""
         # Use the current section name if available, or fallback to generic
         section_name = getattr(self.state_machine, 'current_section_name', 'Generic')
-        self.state_machine.transition_to_section(section_name)
-        self.state_machine.process_section(rows, handler)
+        self._parse_section(section_name, rows, handler)
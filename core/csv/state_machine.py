@@ -6,9 +6,14 @@ where each section requires different parsing logic.
 """
 
 from abc import ABC, abstractmethod
-from typing import List
+from typing import Any, Callable, Iterable, List
 from enum import Enum
-from core.csv.utils import normalize_field, is_summary_row
+from core.csv.base import CsvSectionHandler
+from core.csv.utils import debug_enabled, normalize_field, is_summary_row
+
+# Summary-row label prefixes, as tuples so is_summary_row matches them in one startswith call
+_TOTAL_OR_SUBTOTAL = ("total", "subtotal")
+_TOTAL = ("total",)
 
 
 class ParseState(Enum):
@@ -33,6 +38,9 @@ class SectionParsingState(ABC):
         self.state = ParseState.INITIAL
         self.header = None
         self.normalized_header = None
+        self.col_idx = None
+        self.row_len = 0
+        self.debug = False
     
     @abstractmethod
     def should_skip_row(self, row: List[str]) -> bool:
@@ -55,10 +63,15 @@ class SectionParsingState(ABC):
             row: Header row as list of strings
         """
         self.header = row[2:]  # Skip first two columns (section name, row type)
+        self.row_len = len(row)  # Data rows must match the header's full width, checked before slicing
         self.normalized_header = [normalize_field(h) for h in self.header]
+        # Built once per header; CsvSectionHandlers read cells by position instead of getting a dict per row
+        self.col_idx = {name: i for i, name in enumerate(self.normalized_header)}
         self.state = ParseState.HEADER
+        # Checked once per header so per-row debug messages are only built when they will be emitted
+        self.debug = bool(self.logger) and debug_enabled(self.logger)
         
-        if self.logger:
+        if self.debug:
             self.logger.debug(f"[IBKR DEBUG] Detected header in {self.section_name}: {self.header}")
     
     def process_data_row(self, row: List[str], handler) -> None:
@@ -75,18 +88,20 @@ class SectionParsingState(ABC):
             return
         
         if self.should_skip_row(row):
-            if self.logger:
+            if self.debug:
                 self.logger.debug(f"[IBKR DEBUG] Skipping summary row in {self.section_name}: {row}")
             return
         
-        data_row = row[2:]  # Skip first two columns
-        if len(data_row) != len(self.header):
+        if len(row) != self.row_len:
             if self.logger:
-                self.logger.warning(f"[IBKR WARNING] Data/header length mismatch in {self.section_name}: {data_row} vs {self.header}")
+                self.logger.warning(f"[IBKR WARNING] Data/header length mismatch in {self.section_name}: {row[2:]} vs {self.header}")
             return
+        data_row = row[2:]  # Skip first two columns
         
-        data = dict(zip(self.normalized_header, data_row))
-        handler.handle_row(data)
+        if isinstance(handler, CsvSectionHandler):
+            handler.handle_row_indexed(data_row, self.col_idx)
+        else:
+            handler.handle_row(dict(zip(self.normalized_header, data_row)))
         self.state = ParseState.DATA
     
     def process_row(self, row: List[str], handler) -> None:
@@ -97,36 +112,53 @@ class SectionParsingState(ABC):
             row: CSV row as list of strings
             handler: Section handler to process the parsed data
         """
-        if not any(cell.strip() for cell in row):
+        # Blank rows have an empty type cell and fall through both branches,
+        # so only the type cell is inspected instead of joining every cell
+        if len(row) < 2:
             return
         
-        row_type = row[1].strip() if len(row) > 1 else None
+        row_type = row[1].strip()
         
-        if row_type == 'Header':
-            self.process_header(row)
-        elif row_type == 'Data':
+        # Data rows outnumber headers, so they are matched first
+        if row_type == 'Data':
             self.process_data_row(row, handler)
+        elif row_type == 'Header':
+            self.process_header(row)
+    
+    def make_processor(self) -> Callable[[Iterable[List[str]], Any], None]:
+        """
+        Build a process(rows, handler) function that runs this state over a batch of rows.
+        
+        The state's process_row is bound once, so the loop skips the per-row attribute lookup;
+        skip, summary and header rules stay in process_row / process_data_row / process_header.
+        """
+        process_row = self.process_row
+        
+        def process(rows, handler):
+            for row in rows:
+                process_row(row, handler)
+        return process
 
 
 class TradesParsingState(SectionParsingState):
     """Parsing state for Trades section."""
     
     def should_skip_row(self, row: List[str]) -> bool:
-        return is_summary_row(row, summary_keywords=["total", "subtotal"])
+        return is_summary_row(row, _TOTAL_OR_SUBTOTAL)
 
 
 class DividendsParsingState(SectionParsingState):
     """Parsing state for Dividends section."""
     
     def should_skip_row(self, row: List[str]) -> bool:
-        return is_summary_row(row, summary_keywords=["total"])
+        return is_summary_row(row, _TOTAL)
 
 
 class OpenPositionsParsingState(SectionParsingState):
     """Parsing state for Open Positions section."""
     
     def should_skip_row(self, row: List[str]) -> bool:
-        return is_summary_row(row, summary_keywords=["total", "subtotal"])
+        return is_summary_row(row, _TOTAL_OR_SUBTOTAL)
 
 
 class StatementParsingState(SectionParsingState):
@@ -150,7 +182,7 @@ class ForexBalancesParsingState(SectionParsingState):
     """Parsing state for Forex Balances section."""
     
     def should_skip_row(self, row: List[str]) -> bool:
-        return is_summary_row(row, summary_keywords=["total", "subtotal"])
+        return is_summary_row(row, _TOTAL_OR_SUBTOTAL)
 
 
 class GenericParsingState(SectionParsingState):
@@ -178,6 +210,7 @@ class CsvStateMachine:
             "Forex Balances": ForexBalancesParsingState("Forex Balances", logger),
         }
         self.current_state = None
+        self.current_processor = None
         self.current_section_name = None
     
     def transition_to_section(self, section_name: str) -> None:
@@ -190,13 +223,15 @@ class CsvStateMachine:
         if section_name in self.states:
             self.current_state = self.states[section_name]
             self.current_section_name = section_name
-            if self.logger:
+            if self.logger and debug_enabled(self.logger):
                 self.logger.debug(f"[IBKR DEBUG] Transitioned to section: {section_name}")
         else:
             self.current_state = GenericParsingState(section_name, self.logger)
             self.current_section_name = section_name
-            if self.logger:
+            if self.logger and debug_enabled(self.logger):
                 self.logger.debug(f"[IBKR DEBUG] Using generic parser for unknown section: {section_name}")
+        # Built once per section so the row loop does not go through the state's methods per row
+        self.current_processor = self.current_state.make_processor()
     
     def process_section(self, rows: List[List[str]], handler) -> None:
         """
@@ -206,10 +241,9 @@ class CsvStateMachine:
             rows: List of CSV rows for the section
             handler: Section handler to process the parsed data
         """
-        if not self.current_state:
+        if not self.current_processor:
             if self.logger:
                 self.logger.warning("[IBKR WARNING] No current state set for processing rows")
             return
         
-        for row in rows:
-            self.current_state.process_row(row, handler)
+        self.current_processor(rows, handler)
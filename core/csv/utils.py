@@ -1,14 +1,38 @@
+import logging
+from functools import lru_cache
+from typing import Sequence, Tuple
+
+
+def debug_enabled(logger) -> bool:
+    """
+    Whether logger would emit DEBUG messages, so callers can skip formatting them.
+    Loggers without isEnabledFor are assumed to want everything.
+    """
+    is_enabled_for = getattr(logger, "isEnabledFor", None)
+    return True if is_enabled_for is None else bool(is_enabled_for(logging.DEBUG))
+
+@lru_cache(maxsize=256)
 def normalize_field(field: str) -> str:
     """
     Normalize a field name by stripping whitespace, converting to lowercase,
     and replacing spaces and slashes with underscores.
+    Cached: the same few dozen IBKR column names recur in every header of every statement.
     """
     return field.strip().lower().replace(' ', '_').replace('/', '_')
 
-def is_summary_row(row: list, summary_keywords: list = ["total", "subtotal"]) -> bool:
+@lru_cache(maxsize=256)
+def _is_summary_label(label: str, prefixes: Tuple[str, ...]) -> bool:
+    # Third-column labels (Order, Trade, Summary, Total, currencies...) repeat on nearly every row,
+    # so each distinct label is stripped and lowered once instead of per row
+    return label.strip().lower().startswith(prefixes)
+
+def is_summary_row(row: list, summary_keywords: Sequence[str] = ("total", "subtotal")) -> bool:
     """
     Check if a row is a summary row based on keywords.
+    Pass a tuple of keywords to match them all in one C-level startswith call.
     """
     if len(row) > 2:
-        return any(row[2].strip().lower().startswith(keyword) for keyword in summary_keywords)
+        if summary_keywords.__class__ is not tuple:
+            summary_keywords = tuple(summary_keywords)
+        return _is_summary_label(row[2], summary_keywords)
     return False
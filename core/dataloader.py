@@ -1,5 +1,6 @@
 
 from typing import Callable, Any, List, Optional
+from core.cache.base import CacheBackend
 from core.lock.lock import Lock
 from core.logger import Logger
 
@@ -25,14 +26,23 @@ class DataLoader:
             cached = {}
             missing = []
             missing_indices = []
-            for idx, key in enumerate(keys):
-                value = self._backend.get(key)
-                self.logger.debug("backend.get", key=key, value=value)
-                if value is not None:
-                    cached[key] = value
-                else:
-                    missing.append(key)
-                    missing_indices.append(idx)
+            if isinstance(self._backend, CacheBackend):
+                # One bulk lookup (a single MGET for Redis) instead of a get per key
+                cached = self._backend.get_many(keys)
+                self.logger.debug("backend.get_many", keys=keys, found=cached)
+                for idx, key in enumerate(keys):
+                    if key not in cached:
+                        missing.append(key)
+                        missing_indices.append(idx)
+            else:
+                for idx, key in enumerate(keys):
+                    value = self._backend.get(key)
+                    self.logger.debug("backend.get", key=key, value=value)
+                    if value is not None:
+                        cached[key] = value
+                    else:
+                        missing.append(key)
+                        missing_indices.append(idx)
 
             self.logger.debug("Cached and missing keys", cached=cached, missing=missing)
 
@@ -50,9 +60,12 @@ class DataLoader:
             if unique_missing:
                 loaded = self._batch_load_fn(unique_missing)
                 self.logger.debug("batch_load_fn result", unique_missing=unique_missing, loaded=loaded)
-                for key, value in zip(unique_missing, loaded):
-                    self._backend.set(key, value)
-                    results[key] = value
+                results = dict(zip(unique_missing, loaded))
+                if isinstance(self._backend, CacheBackend):
+                    self._backend.set_many(results.items())
+                else:
+                    for key, value in results.items():
+                        self._backend.set(key, value)
             self.logger.debug("Results after batch load", results=results)
 
             # Merge cached and loaded results in order, preserving duplicates
@@ -7,6 +7,9 @@ class DeadlineManager:
     def __init__(self, timeout_seconds):
         self.start = time.monotonic()
         self.timeout = timeout_seconds
+    def remaining(self):
+        """Seconds left before the deadline (negative once it has passed)."""
+        return self.timeout - (time.monotonic() - self.start)
     def check(self):
         if time.monotonic() - self.start > self.timeout:
             raise DeadlineExceeded("Request deadline exceeded")
@@ -1,5 +1,6 @@
+from functools import lru_cache
 from dependency_injector import containers, providers
-from core.config.config import get_alpha_vantage_api_key, get_postgres_config, get_redis_config, get_openai_api_key
+from core.config.config import get_app_config
 from core.persistence.postgres import PostgresPool
 from core.integrations import stock_api
 from core.integrations.llm.llm_agent import LLMAgent
@@ -15,8 +16,7 @@ from core.logger import Logger
 # Factory function for stock_api with lock
 def stock_api_with_lock():
     obj = stock_api
-    from core.di_container import Container
-    container = Container()
+    container = get_container()
     get_named_lock = container.get_named_lock
     setattr(obj, 'get_named_lock', get_named_lock)
     return obj
@@ -43,12 +43,19 @@ class IntegrationsContainer(containers.DeclarativeContainer):
         llm=grok_llm,
     )
 
+def _required(value, name: str):
+    if not value:
+        raise ValueError(f"{name} not found in environment variables.")
+    return value
+
 # Main DI container
 class Container(containers.DeclarativeContainer):
-    config = providers.Singleton(get_alpha_vantage_api_key)
-    openai_api_key = providers.Singleton(get_openai_api_key)
-    postgres_config = providers.Singleton(get_postgres_config)
-    redis_config = providers.Singleton(get_redis_config)
+    # .env is read once; every other setting is an attribute of this snapshot
+    app_config = providers.Singleton(get_app_config)
+    config = providers.Singleton(_required, app_config.provided.alpha_vantage_api_key, "ALPHA VANTAGE API key")
+    openai_api_key = providers.Singleton(_required, app_config.provided.openai_api_key, "OpenAI API key")
+    postgres_config = app_config.provided.postgres
+    redis_config = app_config.provided.redis
     integrations = providers.Container(
         IntegrationsContainer,
         openai_api_key=openai_api_key,
@@ -58,8 +65,17 @@ class Container(containers.DeclarativeContainer):
         RedisCache,
         host=providers.Callable(lambda c: c.host, redis_config),
         port=providers.Callable(lambda c: c.port, redis_config),
-        logger=providers.Singleton(Logger),
+        logger=providers.Singleton(Logger, level=app_config.provided.log_level),
     )
-    postgres_pool = providers.Singleton(PostgresPool)
+    postgres_pool = providers.Singleton(PostgresPool, config=postgres_config, minconn=2, maxconn=25)
     get_named_lock = providers.Factory(lambda name: InProcessLock(name))
-    logger = providers.Singleton(Logger)
+    logger = providers.Singleton(Logger, level=app_config.provided.log_level)
+
+
+@lru_cache(maxsize=None)
+def get_container() -> containers.Container:
+    """
+    Return the process-wide Container, building it on first use.
+    Providers stay lazy, so only the ones a command touches are resolved.
+    """
+    return Container()
@@ -0,0 +1,30 @@
+"""
+Identifier helpers.
+
+UUIDv7 (RFC 9562) puts a millisecond Unix timestamp in the high bits, so IDs
+generated one after another sort together and land on neighbouring btree pages
+instead of random ones. Use it for primary keys of rows inserted in bulk; keep
+uuid4 where unpredictability matters.
+"""
+import os
+import time
+import uuid
+
+
+def uuid7() -> uuid.UUID:
+    """Return a time-ordered UUIDv7."""
+    if hasattr(uuid, "uuid7"):  # Python 3.14+
+        return uuid.uuid7()
+    timestamp_ms = time.time_ns() // 1_000_000
+    rand = int.from_bytes(os.urandom(10), "big")
+    value = (timestamp_ms & ((1 << 48) - 1)) << 80
+    value |= 0x7 << 76                         # version
+    value |= ((rand >> 62) & 0xFFF) << 64      # rand_a (12 bits)
+    value |= 0b10 << 62                        # RFC 4122 variant
+    value |= rand & ((1 << 62) - 1)            # rand_b (62 bits)
+    return uuid.UUID(int=value)
+
+
+def new_tenant_id() -> uuid.UUID:
+    """Return a new tenant ID."""
+    return uuid7()
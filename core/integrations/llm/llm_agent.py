@@ -2,10 +2,10 @@ from langgraph.graph import StateGraph, END
 from .llm_tools import summarize_positions_tool
 from .llm_prompt import load_llm_prompt
 from .llm_interface import LLMClient
-from typing import TypedDict, List
+from typing import TypedDict, List, Union
 
 class LLMState(TypedDict):
-    positions: List[dict]
+    positions: Union[List[dict], str]
     llm_response: str
 
 
@@ -33,6 +33,7 @@ class LLMAgent(LLMClient):
         graph.add_edge("summarize", END)
         return graph.compile()
 
-    def summarize_positions(self, positions: list) -> str:
+    def summarize_positions(self, positions: Union[list, str]) -> str:
+        """positions: list of dicts, or a payload already built with summarize_positions_tool."""
         result = self.graph.invoke({"positions": positions})
         return result["llm_response"]
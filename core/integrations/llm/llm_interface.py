@@ -1,6 +1,7 @@
 from abc import ABC, abstractmethod
+from typing import Union
 
 class LLMClient(ABC):
     @abstractmethod
-    def summarize_positions(self, positions: list) -> str:
+    def summarize_positions(self, positions: Union[list, str]) -> str:
         pass
@@ -1,3 +1,18 @@
-def summarize_positions_tool(positions: list) -> str:
-    """Format or summarize positions for the LLM."""
-    return "\n".join(str(position) for position in positions)
+import csv
+import io
+
+
+def summarize_positions_tool(positions) -> str:
+    """Format positions for the LLM as tab-separated rows under a single header line.
+
+    An already-serialized payload (str) is returned unchanged, so callers that
+    query several agents can serialize once and reuse the result.
+    """
+    if isinstance(positions, str):
+        return positions
+    columns = list(dict.fromkeys(key for position in positions for key in position))
+    buf = io.StringIO()
+    writer = csv.writer(buf, delimiter="\t", lineterminator="\n")
+    writer.writerow(columns)
+    writer.writerows([position.get(key) for key in columns] for position in positions)
+    return buf.getvalue()
@@ -1,5 +1,7 @@
+import asyncio
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import Optional
+import httpx
 import requests
 from core.config.config import get_alpha_vantage_api_key
 
@@ -10,17 +12,21 @@ def fetch_stock_price(symbol: str) -> float:
     Fetch the latest stock price for the given symbol from Alpha Vantage API.
     """
     api_key: str = get_alpha_vantage_api_key()
-    params = {
+    response = requests.get(BASE_URL, params=_intraday_params(symbol, api_key))
+    return _parse_latest_price(symbol, response.json())
+
+def _intraday_params(symbol: str, api_key: str) -> dict:
+    return {
         'function': 'TIME_SERIES_INTRADAY',
         'symbol': symbol,
         'interval': '1min',
         'apikey': api_key
     }
-    response = requests.get(BASE_URL, params=params)
-    data = response.json()
+
+def _parse_latest_price(symbol: str, data: dict) -> float:
     if 'Time Series (1min)' not in data:
         raise Exception(f"Error fetching data for {symbol}: {data.get('Note') or data.get('Error Message') or data}")
-    latest_time = sorted(data['Time Series (1min)'].keys())[-1]
+    latest_time = max(data['Time Series (1min)'])
     latest_price = data['Time Series (1min)'][latest_time]['4. close']
     return float(latest_price)
 
@@ -42,4 +48,25 @@ def batch_fetch_stock_prices(symbols: list[str], max_workers: Optional[int] = 4)
         for future in as_completed(futures):
             idx, price = future.result()
             results[idx] = price
-    return results
\ No newline at end of file
+    return results
+
+async def fetch_stock_prices_async(symbols: list[str]) -> list[Optional[float]]:
+    """
+    Fetch the latest stock prices for a list of symbols concurrently over one pooled HTTP client.
+    Returns a list of prices in the same order as the input symbols; failed lookups are None.
+    """
+    api_key: str = get_alpha_vantage_api_key()
+    async with httpx.AsyncClient() as client:
+        responses = await asyncio.gather(
+            *(client.get(BASE_URL, params=_intraday_params(symbol, api_key)) for symbol in symbols),
+            return_exceptions=True,
+        )
+    results: list[Optional[float]] = []
+    for symbol, response in zip(symbols, responses):
+        try:
+            if isinstance(response, BaseException):
+                raise response
+            results.append(_parse_latest_price(symbol, response.json()))
+        except Exception:
+            results.append(None)
+    return results
@@ -1,7 +1,9 @@
 
 import sys
 import json
+import logging
 import datetime
+import traceback
 from typing import Any, Dict
 from core.config.config import get_log_level
 
@@ -25,6 +27,13 @@ class Logger:
     def _should_log(self, level: str) -> bool:
         return LOG_LEVELS.index(level) >= LOG_LEVELS.index(self.level)
 
+    def isEnabledFor(self, level) -> bool:
+        """Whether messages at level (a name such as "DEBUG" or a stdlib logging constant) would be emitted.
+        Lets callers skip building expensive messages that would be dropped."""
+        if isinstance(level, int):
+            level = logging.getLevelName(level)
+        return self._should_log(level)
+
     def _log(self, level: str, msg: str, **kwargs):
         if not self._should_log(level):
             return
@@ -52,3 +61,10 @@ class Logger:
 
     def critical(self, msg: str, **kwargs):
         self._log("CRITICAL", msg, **kwargs)
+
+    def exception(self, msg: str, **kwargs):
+        """Log at ERROR with the traceback of the exception being handled.
+        The traceback is only formatted when ERROR is enabled."""
+        if not self._should_log("ERROR"):
+            return
+        self._log("ERROR", msg, exc_info=traceback.format_exc(), **kwargs)
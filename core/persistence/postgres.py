@@ -1,15 +1,52 @@
-from psycopg2.pool import SimpleConnectionPool
+from psycopg2 import sql
+from psycopg2.pool import ThreadedConnectionPool
 from core.config.config import get_postgres_config
 import contextlib
 
+def _with_statement_timeout(query, timeout_ms: int):
+    """Prefix query with a session-level SET statement_timeout, so both travel in one round trip."""
+    prefix = f"SET statement_timeout = {int(timeout_ms)}; "
+    if isinstance(query, sql.Composable):
+        return sql.SQL(prefix) + query
+    if isinstance(query, bytes):
+        return prefix.encode() + query
+    return prefix + query
+
+
 class CursorWithDeadline:
+    """
+    Cursor wrapper that enforces a DeadlineManager on every execute.
+    Besides the client-side check, the remaining time is sent as a session-level
+    statement_timeout in the same round trip as the statement, so Postgres cancels
+    a query (QueryCanceled) that would run past the deadline. The deadline applies
+    on autocommit (readonly=True) and transactional connections alike.
+    After a statement succeeds, the timeout is RESET through a separate cursor (one
+    extra round trip, which keeps this cursor's results intact), so later statements
+    on the connection run without it. A failed statement's SET is undone when its
+    transaction (the implicit one under autocommit) rolls back.
+    Named (server-side) cursors get the SET as its own statement before the DECLARE,
+    so only the DECLARE (not later fetches) runs under the timeout.
+    Only execute is covered; executemany and callproc run without the server-side timeout.
+    """
     def __init__(self, cursor, deadline_manager=None):
         self._cursor = cursor
         self._deadline_manager = deadline_manager
-    def execute(self, *args, **kwargs):
-        if self._deadline_manager:
-            self._deadline_manager.check()
-        return self._cursor.execute(*args, **kwargs)
+    def execute(self, query, *args, **kwargs):
+        if not self._deadline_manager:
+            return self._cursor.execute(query, *args, **kwargs)
+        self._deadline_manager.check()
+        timeout_ms = max(1, int(self._deadline_manager.remaining() * 1000))
+        connection = self._cursor.connection
+        if getattr(self._cursor, "name", None):
+            # DECLARE ... CURSOR FOR takes a single statement, so the SET cannot ride along
+            with connection.cursor() as setter:
+                setter.execute(f"SET statement_timeout = {timeout_ms}")
+        else:
+            query = _with_statement_timeout(query, timeout_ms)
+        result = self._cursor.execute(query, *args, **kwargs)
+        with connection.cursor() as reset:
+            reset.execute("RESET statement_timeout")
+        return result
     def __getattr__(self, name):
         return getattr(self._cursor, name)
     def __enter__(self):
@@ -19,30 +56,48 @@ class CursorWithDeadline:
 
 
 class PostgresPool:
-    def __init__(self, config=None, connection_pool_cls=SimpleConnectionPool):
+    def __init__(self, config=None, connection_pool_cls=ThreadedConnectionPool, minconn=2, maxconn=25):
+        """
+        The pool is shared process-wide through the DI container, so the default
+        ThreadedConnectionPool keeps getconn/putconn safe across threads.
+        """
         cfg = config or get_postgres_config()
         self.pool = connection_pool_cls(
-            minconn=1,
-            maxconn=10,
+            minconn=minconn,
+            maxconn=maxconn,
             user=cfg.user,
             password=cfg.password,
             host=cfg.host,
             port=cfg.port,
             database=cfg.db,
         )
+        # Original autocommit mode of connections handed out with readonly=True
+        self._autocommit_to_restore = {}
 
     @contextlib.contextmanager
-    def connection(self, deadline_manager=None):
-        conn = self.pool.getconn()
+    def connection(self, deadline_manager=None, readonly=False):
+        """
+        Borrow a pooled connection for the duration of the block.
+        readonly=True runs it in autocommit mode, so single reads skip the
+        implicit BEGIN/COMMIT; the previous mode is restored before returning it.
+        """
+        conn = self.get_conn(readonly=readonly)
         try:
             yield conn, deadline_manager
         finally:
-            self.pool.putconn(conn)
+            self.put_conn(conn)
 
-    def get_conn(self):
-        return self.pool.getconn()
+    def get_conn(self, readonly=False):
+        conn = self.pool.getconn()
+        if readonly:
+            self._autocommit_to_restore[id(conn)] = conn.autocommit
+            conn.autocommit = True
+        return conn
 
     def put_conn(self, conn):
+        previous = self._autocommit_to_restore.pop(id(conn), None)
+        if previous is not None:
+            conn.autocommit = previous
         self.pool.putconn(conn)
 
 
@@ -3,6 +3,7 @@ from decimal import Decimal
 from datetime import datetime
 from typing import Optional, List
 from .models.activity_report_entry import ActivityReportEntry
+from .models.portfolio import Portfolio
 from .models.enums import Currency
 from .repository.base import (
     PortfolioRepository, EquityRepository, ActivityReportEntryRepository
@@ -30,16 +31,28 @@ class ActivityManagementService:
         stock_symbol: Optional[str] = None,
         raw_data: Optional[dict] = None,
         currency: Optional[Currency] = None,
-        conn=None
+        conn=None,
+        save: bool = True,
+        equity_id: Optional[UUID] = None,
+        portfolio: Optional[Portfolio] = None
     ) -> Optional[ActivityReportEntry]:
-        """Add an activity report entry to a portfolio."""
-        portfolio = self.portfolio_repo.get(portfolio_id, conn=conn)
+        """Add an activity report entry to a portfolio.
+
+        With save=False the entry is validated and returned but not persisted;
+        bulk callers collect such entries and flush them with save_activity_entries.
+        Passing an already resolved equity_id skips the per-entry symbol lookup and existence check,
+        and passing the loaded portfolio skips re-reading it, so bulk imports cost no queries per entry.
+        """
+        if portfolio is None:
+            portfolio = self.portfolio_repo.get(portfolio_id, conn=conn)
         if not portfolio:
             return None
         
+        # Equities resolved by the caller are known to exist
+        equity_repository = None if equity_id is not None else self.equity_repo
+        
         # Get stock if symbol provided
-        equity_id = None
-        if stock_symbol:
+        if equity_id is None and stock_symbol:
             equity = self.equity_repo.find_by_symbol(stock_symbol, "NASDAQ", conn=conn)
             if not equity:
                 # Create equity if it doesn't exist
@@ -77,11 +90,17 @@ class ActivityManagementService:
         )
         
         # Add to portfolio and save
-        portfolio.add_activity_entry(entry, self.equity_repo)
-        self.activity_entry_repo.save(entry, conn=conn)
-        self.portfolio_repo.save(portfolio, conn=conn)
+        portfolio.add_activity_entry(entry, equity_repository)
+        if save:
+            self.activity_entry_repo.save(entry, conn=conn)
+            self.portfolio_repo.save(portfolio, conn=conn)
         
         return entry
+
+    def save_activity_entries(self, entries: List[ActivityReportEntry], conn=None) -> None:
+        """Persist entries built with add_activity_entry(save=False) in one batch."""
+        if entries:
+            self.activity_entry_repo.batch_save(entries, conn=conn)
     
     def get_activity_entries(
         self, 
@@ -1,14 +1,18 @@
-from uuid import UUID
+from uuid import UUID, uuid4
 from decimal import Decimal
 from datetime import datetime
-from typing import List, Optional
+from typing import Dict, Iterable, List, Optional, Tuple
 from .models.import_result import ImportResult
-from .models.enums import Currency
+from .models.enums import Currency, Exchange
+from .models.holding import Equity
 from .portfolio_errors import DuplicateHoldingError
 from .holdings_management_service import HoldingsManagementService
 from .activity_management_service import ActivityManagementService
 from .repository.base import PortfolioRepository
 
+# Activity entries are written in pages of this size rather than one INSERT per row
+ACTIVITY_BATCH_SIZE = 1000
+
 class IBKRImportService:
     """Service for coordinating IBKR data import and portfolio updates."""
     
@@ -45,9 +49,16 @@ class IBKRImportService:
                 result.mark_failure(f"Portfolio with ID {portfolio_id} not found", "PortfolioNotFoundError")
                 return result
 
-            # Delegate processing to private methods
-            self._handle_trades(trades, portfolio_id, result, conn)
-            self._handle_dividends(dividends, portfolio_id, result, conn)
+            # Resolve or create every referenced equity in bulk, then delegate processing to private methods
+            equity_ids = self._prefetch_equities(
+                [trade.get('symbol') for trade in trades] + [position.get('symbol') for position in positions],
+                result,
+                conn
+            )
+            pending_entries = []
+            self._handle_trades(trades, portfolio_id, result, conn, pending_entries, equity_ids, portfolio)
+            self._handle_dividends(dividends, portfolio_id, result, conn, pending_entries, portfolio)
+            self._flush_activity_entries(pending_entries, conn)
             self._handle_positions(positions, portfolio_id, result, conn)
             self._handle_forex_balances(forex_balances, portfolio_id, result, conn)
 
@@ -60,131 +71,236 @@ class IBKRImportService:
         
         return result
 
-    def _handle_trades(self, trades, portfolio_id, result, conn):
+    def import_from_ibkr_stream(
+        self,
+        portfolio_id: UUID,
+        sections: Iterable[Tuple[str, dict]],
+        conn=None
+    ) -> ImportResult:
+        """Import (section_name, record) pairs as they are parsed, without intermediate lists.
+
+        Records are imported in file order. Sections without an importer (e.g. Statement) are ignored.
+        """
+        result = ImportResult(
+            success=False,
+            import_source='IBKR_CSV',
+            portfolio_id=str(portfolio_id),
+            started_at=datetime.now()
+        )
+
+        try:
+            portfolio = self.portfolio_repo.get(portfolio_id, conn=conn)
+            if not portfolio:
+                result.mark_failure(f"Portfolio with ID {portfolio_id} not found", "PortfolioNotFoundError")
+                return result
+
+            pending_entries = []
+            # Symbols are resolved (or created) the first time they appear, then reused
+            equity_ids = {}
+            for section_name, record in sections:
+                if section_name == 'Trades':
+                    symbol = record.get('symbol')
+                    if symbol and symbol not in equity_ids:
+                        equity_ids.update(self._prefetch_equities([symbol], result, conn))
+                    self._handle_trade(record, portfolio_id, result, conn, pending_entries, equity_ids, portfolio)
+                elif section_name == 'Dividends':
+                    self._handle_dividend(record, portfolio_id, result, conn, pending_entries, portfolio)
+                elif section_name == 'Open Positions':
+                    self._handle_position(record, portfolio_id, result, conn)
+                elif section_name == 'Forex Balances':
+                    self._handle_forex_balance(record, portfolio_id, result, conn)
+                self._flush_activity_entries(pending_entries, conn, ACTIVITY_BATCH_SIZE)
+            self._flush_activity_entries(pending_entries, conn)
+
+            portfolio.mark_imported('IBKR_CSV', result.activity_entries_created)
+            self.portfolio_repo.save(portfolio, conn=conn)
+            result.mark_success()
+
+        except Exception as e:
+            result.mark_failure(f"Unexpected error during import: {str(e)}", type(e).__name__)
+
+        return result
+
+    def _prefetch_equities(self, symbols, result, conn) -> Dict[str, UUID]:
+        """Look up all symbols in one query and create the missing equities in one batch.
+
+        Returns a symbol -> equity id map; empty if the equity repository has no bulk methods.
+        """
+        equity_repo = getattr(self.holdings_service, 'equity_repo', None)
+        if not hasattr(equity_repo, 'find_by_symbols'):
+            return {}
+        symbols = {symbol for symbol in symbols if symbol}
+        equities = equity_repo.find_by_symbols(symbols, "NASDAQ", conn=conn)
+        missing = [
+            Equity(id=uuid4(), symbol=symbol, exchange=Exchange.NASDAQ)
+            for symbol in sorted(symbols - equities.keys())
+        ]
+        if missing:
+            equity_repo.batch_save(missing, conn=conn)
+            result.equities_created += len(missing)
+        equity_ids = {symbol: equity.id for symbol, equity in equities.items()}
+        equity_ids.update((equity.symbol, equity.id) for equity in missing)
+        return equity_ids
+
+    def _handle_trades(self, trades, portfolio_id, result, conn, pending_entries=None, equity_ids=None, portfolio=None):
         """Process trades and add activity entries."""
         for trade in trades:
-            if not trade.get('symbol') or not trade.get('datetime'):
-                result.add_warning(f"Skipping trade missing symbol or datetime: {trade}")
-                result.skipped_trades += 1
-                continue
-                
-            try:
-                trade_datetime = self._parse_datetime(trade['datetime'])
-                entry = self.activity_service.add_activity_entry(
-                    portfolio_id=portfolio_id,
-                    activity_type='TRADE',
-                    amount=trade.get('proceeds', Decimal('0')),
-                    date=trade_datetime,
-                    stock_symbol=trade['symbol'],
-                    raw_data=trade,
-                    conn=conn
-                )
-                if entry:
-                    result.trades_imported += 1
-                    result.activity_entries_created += 1
-                else:
-                    result.add_failed_item('trade', trade, 'Failed to create activity entry')
-            except Exception as e:
-                result.add_failed_item('trade', trade, str(e))
-
-    def _handle_dividends(self, dividends, portfolio_id, result, conn):
+            self._handle_trade(trade, portfolio_id, result, conn, pending_entries, equity_ids, portfolio)
+            self._flush_activity_entries(pending_entries, conn, ACTIVITY_BATCH_SIZE)
+
+    def _handle_trade(self, trade, portfolio_id, result, conn, pending_entries=None, equity_ids=None, portfolio=None):
+        """Process a single trade and add its activity entry."""
+        if not trade.get('symbol') or not trade.get('datetime'):
+            result.add_warning(f"Skipping trade missing symbol or datetime: {trade}")
+            result.skipped_trades += 1
+            return
+            
+        try:
+            trade_datetime = self._parse_datetime(trade['datetime'])
+            entry = self.activity_service.add_activity_entry(
+                portfolio_id=portfolio_id,
+                activity_type='TRADE',
+                amount=trade.get('proceeds', Decimal('0')),
+                date=trade_datetime,
+                stock_symbol=trade['symbol'],
+                raw_data=trade,
+                conn=conn,
+                save=pending_entries is None,
+                equity_id=equity_ids.get(trade['symbol']) if equity_ids else None,
+                portfolio=portfolio
+            )
+            if entry:
+                if pending_entries is not None:
+                    pending_entries.append(entry)
+                result.trades_imported += 1
+                result.activity_entries_created += 1
+            else:
+                result.add_failed_item('trade', trade, 'Failed to create activity entry')
+        except Exception as e:
+            result.add_failed_item('trade', trade, str(e))
+
+    def _handle_dividends(self, dividends, portfolio_id, result, conn, pending_entries=None, portfolio=None):
         """Process dividends and add activity entries."""
         for dividend in dividends:
-            if not dividend.get('description') or not dividend.get('date'):
-                result.add_warning(f"Skipping dividend missing description or date: {dividend}")
-                result.skipped_dividends += 1
-                continue
-                
-            try:
-                dividend_date = self._parse_datetime(dividend['date'])
-                entry = self.activity_service.add_activity_entry(
-                    portfolio_id=portfolio_id,
-                    activity_type='DIVIDEND',
-                    amount=dividend.get('amount', Decimal('0')),
-                    date=dividend_date,
-                    raw_data=dividend,
-                    conn=conn
-                )
-                if entry:
-                    result.dividends_imported += 1
-                    result.activity_entries_created += 1
-                else:
-                    result.add_failed_item('dividend', dividend, 'Failed to create activity entry')
-            except Exception as e:
-                result.add_failed_item('dividend', dividend, str(e))
+            self._handle_dividend(dividend, portfolio_id, result, conn, pending_entries, portfolio)
+            self._flush_activity_entries(pending_entries, conn, ACTIVITY_BATCH_SIZE)
+
+    def _handle_dividend(self, dividend, portfolio_id, result, conn, pending_entries=None, portfolio=None):
+        """Process a single dividend and add its activity entry."""
+        if not dividend.get('description') or not dividend.get('date'):
+            result.add_warning(f"Skipping dividend missing description or date: {dividend}")
+            result.skipped_dividends += 1
+            return
+            
+        try:
+            dividend_date = self._parse_datetime(dividend['date'])
+            entry = self.activity_service.add_activity_entry(
+                portfolio_id=portfolio_id,
+                activity_type='DIVIDEND',
+                amount=dividend.get('amount', Decimal('0')),
+                date=dividend_date,
+                raw_data=dividend,
+                conn=conn,
+                save=pending_entries is None,
+                portfolio=portfolio
+            )
+            if entry:
+                if pending_entries is not None:
+                    pending_entries.append(entry)
+                result.dividends_imported += 1
+                result.activity_entries_created += 1
+            else:
+                result.add_failed_item('dividend', dividend, 'Failed to create activity entry')
+        except Exception as e:
+            result.add_failed_item('dividend', dividend, str(e))
 
     def _handle_positions(self, positions, portfolio_id, result, conn):
         """Process positions and add equity holdings."""
         for position in positions:
-            if not position.get('symbol') or not position.get('quantity'):
-                result.add_warning(f"Skipping position missing symbol or quantity: {position}")
-                result.skipped_positions += 1
-                continue
-                
-            try:
-                quantity = Decimal(str(position['quantity']))
-                cost_basis = Decimal(str(position.get('cost_basis', 0)))
-                equity_created = self._check_equity_creation(position, conn)
-                holding = self.holdings_service.add_equity_holding(
-                    portfolio_id=portfolio_id,
-                    symbol=position['symbol'],
-                    quantity=quantity,
-                    cost_basis=cost_basis,
-                    exchange="NASDAQ",
-                    conn=conn
-                )
-                if holding:
-                    result.positions_imported += 1
-                    result.equity_holdings_created += 1
-                    if equity_created:
-                        result.equities_created += 1
-                else:
-                    result.add_failed_item('position', position, 'Failed to create equity holding')
-            except DuplicateHoldingError:
-                result.add_warning(f"Duplicate holding for {position['symbol']} - skipping")
-                result.skipped_positions += 1
-            except ValueError as e:
-                result.add_failed_item('position', position, f'Invalid numeric value: {str(e)}')
-            except Exception as e:
-                result.add_failed_item('position', position, str(e))
+            self._handle_position(position, portfolio_id, result, conn)
+
+    def _handle_position(self, position, portfolio_id, result, conn):
+        """Process a single position and add its equity holding."""
+        if not position.get('symbol') or not position.get('quantity'):
+            result.add_warning(f"Skipping position missing symbol or quantity: {position}")
+            result.skipped_positions += 1
+            return
+            
+        try:
+            quantity = Decimal(str(position['quantity']))
+            cost_basis = Decimal(str(position.get('cost_basis', 0)))
+            equity_created = self._check_equity_creation(position, conn)
+            holding = self.holdings_service.add_equity_holding(
+                portfolio_id=portfolio_id,
+                symbol=position['symbol'],
+                quantity=quantity,
+                cost_basis=cost_basis,
+                exchange="NASDAQ",
+                conn=conn
+            )
+            if holding:
+                result.positions_imported += 1
+                result.equity_holdings_created += 1
+                if equity_created:
+                    result.equities_created += 1
+            else:
+                result.add_failed_item('position', position, 'Failed to create equity holding')
+        except DuplicateHoldingError:
+            result.add_warning(f"Duplicate holding for {position['symbol']} - skipping")
+            result.skipped_positions += 1
+        except ValueError as e:
+            result.add_failed_item('position', position, f'Invalid numeric value: {str(e)}')
+        except Exception as e:
+            result.add_failed_item('position', position, str(e))
 
     def _handle_forex_balances(self, forex_balances, portfolio_id, result, conn):
         """Process forex balances and update cash holdings."""
         if not forex_balances:
             return
         for forex_balance in forex_balances:
-            if not forex_balance.get('currency') or not forex_balance.get('quantity'):
-                result.add_warning(f"Skipping forex balance missing currency or quantity: {forex_balance}")
-                continue
-                
-            try:
-                currency_str = forex_balance['currency']
-                quantity = Decimal(str(forex_balance['quantity']))
+            self._handle_forex_balance(forex_balance, portfolio_id, result, conn)
+
+    def _handle_forex_balance(self, forex_balance, portfolio_id, result, conn):
+        """Process a single forex balance and update its cash holding."""
+        if not forex_balance.get('currency') or not forex_balance.get('quantity'):
+            result.add_warning(f"Skipping forex balance missing currency or quantity: {forex_balance}")
+            return
+            
+        try:
+            currency_str = forex_balance['currency']
+            quantity = Decimal(str(forex_balance['quantity']))
+            
+            # Check if currency is supported - add warning if not
+            if currency_str not in Currency.__members__:
+                result.add_warning(f"Unsupported currency '{currency_str}' in forex balance - skipping")
+                return
                 
-                # Check if currency is supported - add warning if not
-                if currency_str not in Currency.__members__:
-                    result.add_warning(f"Unsupported currency '{currency_str}' in forex balance - skipping")
-                    continue
-                    
-                currency = Currency(currency_str)
-                cash_holding_created = self._check_cash_holding_creation(portfolio_id, currency, conn)
-                success = self.holdings_service.update_cash_balance(
-                    portfolio_id=portfolio_id,
-                    new_balance_or_currency=currency,
-                    reason_or_new_balance=quantity,
-                    reason="IBKR_FOREX_IMPORT",
-                    conn=conn
-                )
-                if success:
-                    result.forex_balances_imported += 1
-                    if cash_holding_created:
-                        result.cash_holdings_created += 1
-                else:
-                    result.add_failed_item('forex_balance', forex_balance, 'Failed to update cash balance')
-            except ValueError as e:
-                result.add_failed_item('forex_balance', forex_balance, f'Invalid numeric value: {str(e)}')
-            except Exception as e:
-                result.add_failed_item('forex_balance', forex_balance, str(e))
+            currency = Currency(currency_str)
+            cash_holding_created = self._check_cash_holding_creation(portfolio_id, currency, conn)
+            success = self.holdings_service.update_cash_balance(
+                portfolio_id=portfolio_id,
+                new_balance_or_currency=currency,
+                reason_or_new_balance=quantity,
+                reason="IBKR_FOREX_IMPORT",
+                conn=conn
+            )
+            if success:
+                result.forex_balances_imported += 1
+                if cash_holding_created:
+                    result.cash_holdings_created += 1
+            else:
+                result.add_failed_item('forex_balance', forex_balance, 'Failed to update cash balance')
+        except ValueError as e:
+            result.add_failed_item('forex_balance', forex_balance, f'Invalid numeric value: {str(e)}')
+        except Exception as e:
+            result.add_failed_item('forex_balance', forex_balance, str(e))
+
+    def _flush_activity_entries(self, pending_entries, conn, min_size=1):
+        """Write queued activity entries in one batch once at least min_size are pending."""
+        if pending_entries is None or len(pending_entries) < min_size:
+            return
+        self.activity_service.save_activity_entries(pending_entries, conn=conn)
+        pending_entries.clear()
 
     def _parse_datetime(self, date_str):
         """Parse datetime from string."""
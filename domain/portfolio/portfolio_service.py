@@ -1,7 +1,7 @@
 from uuid import UUID, uuid4
 from decimal import Decimal
 from datetime import datetime
-from typing import Optional, List
+from typing import Iterable, Optional, List, Tuple
 from .models.portfolio import Portfolio, PortfolioName
 from .models.holding import EquityHolding, CashHolding
 from .models.activity_report_entry import ActivityReportEntry
@@ -70,6 +70,19 @@ class PortfolioService:
             portfolio_id, trades, dividends, positions, forex_balances, conn
         )
 
+    def import_from_ibkr_stream(
+        self,
+        portfolio_id: UUID,
+        sections: Iterable[Tuple[str, dict]],
+        conn=None
+    ) -> ImportResult:
+        """Import IBKR records as they are parsed, e.g. from IbkrCsvParser.iter_sections.
+
+        Equivalent to import_from_ibkr, but rows are imported in a single pass
+        without materializing the trades/dividends/positions lists first.
+        """
+        return self._ibkr_import_service.import_from_ibkr_stream(portfolio_id, sections, conn)
+
     # ================================================================
     # PORTFOLIO MANAGEMENT - Basic CRUD operations
     # ================================================================
@@ -1,6 +1,6 @@
 """Base repository interfaces for the portfolio domain."""
 
-from typing import Protocol, Optional, List
+from typing import Protocol, Optional, List, Dict, Iterable
 from uuid import UUID
 
 from ..models.portfolio import Portfolio
@@ -23,10 +23,13 @@ class EquityRepository(Protocol):
     """Repository interface for Equity entities."""
     
     def get(self, equity_id: UUID, conn=None) -> Optional[Equity]: ...
+    def get_many(self, equity_ids: Iterable[UUID], conn=None) -> Dict[UUID, Equity]: ...
     def find_by_symbol(self, symbol: str, exchange: str, conn=None) -> Optional[Equity]: ...
+    def find_by_symbols(self, symbols: Iterable[str], exchange: str, conn=None) -> Dict[str, Equity]: ...
     def find_by_portfolio_id(self, portfolio_id: UUID, conn=None) -> List[Equity]: ...
     def search(self, query: str, limit: int = 50, conn=None) -> List[Equity]: ...
     def save(self, equity: Equity, conn=None) -> None: ...
+    def batch_save(self, equities: List[Equity], conn=None) -> None: ...
     def delete(self, equity_id: UUID, conn=None) -> None: ...
     def exists(self, equity_id: UUID, conn=None) -> bool: ...
 
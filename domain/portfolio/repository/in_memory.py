@@ -1,6 +1,6 @@
 """In-memory repository implementations for the portfolio domain."""
 
-from typing import Optional, List, Dict
+from typing import Optional, List, Dict, Iterable
 from uuid import UUID
 
 from ..models.portfolio import Portfolio, PortfolioName
@@ -12,10 +12,16 @@ from ..portfolio_errors import DuplicateHoldingError
 class InMemoryPortfolioRepository:
     """In-memory implementation of PortfolioRepository."""
     
+    __slots__ = ('_portfolios', '_cash_holding_repo')
+
     def __init__(self, cash_holding_repo=None):
         self._portfolios: Dict[UUID, dict] = {}
         self._cash_holding_repo = cash_holding_repo or InMemoryCashHoldingRepository()
 
+    def clear(self) -> None:
+        """Drop all stored rows, so the repository can be reused from an empty state."""
+        self._portfolios.clear()
+
     def get(self, portfolio_id: UUID, conn=None) -> Optional[Portfolio]:
         row = self._portfolios.get(portfolio_id)
         if not row:
@@ -91,13 +97,23 @@ class InMemoryPortfolioRepository:
 class InMemoryEquityRepository:
     """In-memory implementation of EquityRepository."""
     
+    __slots__ = ('_equities',)
+
     def __init__(self):
         self._equities: Dict[UUID, dict] = {}
 
+    def clear(self) -> None:
+        """Drop all stored rows, so the repository can be reused from an empty state."""
+        self._equities.clear()
+
     def get(self, equity_id: UUID, conn=None) -> Optional[Equity]:
         row = self._equities.get(equity_id)
         return self._row_to_equity(row) if row else None
 
+    def get_many(self, equity_ids: Iterable[UUID], conn=None) -> Dict[UUID, Equity]:
+        rows = ((equity_id, self._equities.get(equity_id)) for equity_id in set(equity_ids))
+        return {equity_id: self._row_to_equity(row) for equity_id, row in rows if row}
+
     def find_by_symbol(self, symbol: str, exchange: str, conn=None) -> Optional[Equity]:
         from ..models.enums import Exchange
         # Convert string to Exchange enum if needed
@@ -113,6 +129,15 @@ class InMemoryEquityRepository:
                 return self._row_to_equity(row)
         return None
 
+    def find_by_symbols(self, symbols: Iterable[str], exchange: str, conn=None) -> Dict[str, Equity]:
+        symbols = set(symbols)
+        found = {}
+        for symbol in symbols:
+            equity = self.find_by_symbol(symbol, exchange, conn=conn)
+            if equity:
+                found[symbol] = equity
+        return found
+
     def find_by_portfolio_id(self, portfolio_id: UUID, conn=None) -> List[Equity]:
         # This would require join logic in a real implementation
         # For in-memory, we'll return all equities for simplicity
@@ -132,6 +157,10 @@ class InMemoryEquityRepository:
     def save(self, equity: Equity, conn=None) -> None:
         self._equities[equity.id] = self._equity_to_row(equity)
 
+    def batch_save(self, equities: List[Equity], conn=None) -> None:
+        for equity in equities:
+            self.save(equity)
+
     def delete(self, equity_id: UUID, conn=None) -> None:
         self._equities.pop(equity_id, None)
 
@@ -162,9 +191,15 @@ class InMemoryEquityRepository:
 class InMemoryEquityHoldingRepository:
     """In-memory implementation of EquityHoldingRepository."""
     
+    __slots__ = ('_holdings',)
+
     def __init__(self):
         self._holdings: Dict[UUID, dict] = {}
 
+    def clear(self) -> None:
+        """Drop all stored rows, so the repository can be reused from an empty state."""
+        self._holdings.clear()
+
     def find_by_portfolio_id(
         self, 
         portfolio_id: UUID, 
@@ -245,9 +280,15 @@ class InMemoryEquityHoldingRepository:
 class InMemoryCashHoldingRepository:
     """In-memory implementation of CashHoldingRepository."""
     
+    __slots__ = ('_holdings',)
+
     def __init__(self):
         self._holdings: Dict[UUID, dict] = {}
 
+    def clear(self) -> None:
+        """Drop all stored rows, so the repository can be reused from an empty state."""
+        self._holdings.clear()
+
     def find_by_portfolio_id(
         self, 
         portfolio_id: UUID, 
@@ -319,9 +360,15 @@ class InMemoryCashHoldingRepository:
 class InMemoryActivityReportEntryRepository:
     """In-memory implementation of ActivityReportEntryRepository."""
     
+    __slots__ = ('_entries',)
+
     def __init__(self):
         self._entries: Dict[UUID, dict] = {}
 
+    def clear(self) -> None:
+        """Drop all stored rows, so the repository can be reused from an empty state."""
+        self._entries.clear()
+
     def find_by_portfolio_id(
         self, 
         portfolio_id: UUID, 
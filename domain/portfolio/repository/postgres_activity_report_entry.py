@@ -1,16 +1,31 @@
 """PostgreSQL repository implementation for Activity Report Entry."""
 
+import csv
+import io
 import json
 from typing import Optional, List
 from uuid import UUID
 from decimal import Decimal
 from datetime import datetime
 
+from psycopg2.extras import execute_values
+
 from ..models.activity_report_entry import ActivityReportEntry
 from ..models.enums import Currency
 from .base import ActivityReportEntryRepository
 
 class PostgresActivityReportEntryRepository(ActivityReportEntryRepository):
+    _COLUMNS = "id, portfolio_id, equity_id, activity_type, amount, currency, date, raw_data, created_at"
+    # Text columns that are never None, so an empty CSV field in them is '' rather than NULL
+    _NOT_NULL_TEXT_COLUMNS = "activity_type, currency, raw_data"
+    _UPSERT = """
+        ON CONFLICT (id, date, portfolio_id) DO UPDATE SET
+            activity_type = EXCLUDED.activity_type,
+            amount = EXCLUDED.amount,
+            currency = EXCLUDED.currency,
+            raw_data = EXCLUDED.raw_data
+    """
+
     def __init__(self, db):
         self.db = db
 
@@ -153,10 +168,74 @@ class PostgresActivityReportEntryRepository(ActivityReportEntryRepository):
             if conn_ctx is not None:
                 conn_ctx.__exit__(None, None, None)
 
-    def batch_save(self, entries: List[ActivityReportEntry], conn=None) -> None:
-        """Save multiple activity report entries."""
-        for entry in entries:
-            self.save(entry, conn)
+    def batch_save(self, entries: List[ActivityReportEntry], conn=None, page_size: int = 1000) -> None:
+        """
+        Save multiple activity report entries in bulk.
+
+        Inside a transaction the rows are streamed with COPY into a temporary staging table and
+        upserted from there in one statement. On an autocommit connection, where the staging table
+        would not survive between statements, it falls back to one multi-row INSERT per page.
+        Entries repeating a conflict key (id, date, portfolio_id) are collapsed to the last one,
+        as saving them one by one would, since one upsert statement cannot update a row twice.
+        """
+        if not entries:
+            return
+        conn_ctx = None
+        if conn is None:
+            conn_ctx = self.db.connection()
+            conn, _ = conn_ctx.__enter__()
+
+        try:
+            rows = [
+                (
+                    str(entry.id),
+                    str(entry.portfolio_id),
+                    str(entry.equity_id) if entry.equity_id else None,
+                    entry.activity_type,
+                    entry.amount,
+                    entry.currency.value if hasattr(entry.currency, 'value') else entry.currency,
+                    entry.date,
+                    json.dumps(entry.raw_data if entry.raw_data is not None else {}),
+                    entry.created_at
+                )
+                for entry in entries
+            ]
+            # Last write wins; dict insertion order keeps each key at its first position
+            rows = list({(row[0], row[6], row[1]): row for row in rows}.values())
+            with conn.cursor() as cur:
+                if conn.autocommit:
+                    execute_values(cur, f"""
+                        INSERT INTO activity_report_entry ({self._COLUMNS})
+                        VALUES %s
+                        {self._UPSERT}
+                    """, rows, page_size=page_size)
+                else:
+                    self._copy_upsert(cur, rows)
+        finally:
+            if conn_ctx is not None:
+                conn_ctx.__exit__(None, None, None)
+
+    def _copy_upsert(self, cur, rows) -> None:
+        """COPY rows into a per-transaction staging table, then upsert them into activity_report_entry."""
+        buf = io.StringIO()
+        # None is written as an unquoted empty field, which COPY's CSV format reads as NULL;
+        # FORCE_NOT_NULL keeps '' in the text columns that are never None
+        csv.writer(buf).writerows(rows)
+        buf.seek(0)
+        cur.execute("""
+            CREATE TEMP TABLE IF NOT EXISTS activity_report_entry_staging
+            (LIKE activity_report_entry INCLUDING DEFAULTS) ON COMMIT DROP
+        """)
+        cur.execute("TRUNCATE activity_report_entry_staging")
+        cur.copy_expert(
+            f"COPY activity_report_entry_staging ({self._COLUMNS}) FROM STDIN "
+            f"WITH (FORMAT csv, FORCE_NOT_NULL ({self._NOT_NULL_TEXT_COLUMNS}))", buf
+        )
+        cur.execute(f"""
+            INSERT INTO activity_report_entry ({self._COLUMNS})
+            SELECT {self._COLUMNS} FROM activity_report_entry_staging
+            {self._UPSERT}
+        """)
 
     def exists(self, entry_id: UUID, conn=None) -> bool:
         """Check if an activity report entry exists."""
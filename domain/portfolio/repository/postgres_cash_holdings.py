@@ -5,6 +5,8 @@ from uuid import UUID
 from decimal import Decimal
 from datetime import datetime
 
+from psycopg2.extras import execute_batch
+
 from domain.portfolio.repository.base import CashHoldingRepository
 from domain.portfolio.models.holding import CashHolding
 from domain.portfolio.models.enums import Currency
@@ -12,6 +14,14 @@ from domain.portfolio.models.enums import Currency
 
 class PostgresCashHoldingRepository(CashHoldingRepository):
     """PostgreSQL implementation of CashHoldingRepository."""
+
+    _UPSERT_SQL = """
+        INSERT INTO cash_holding (id, portfolio_id, currency, balance, created_at, updated_at)
+        VALUES (%s, %s, %s, %s, %s, %s)
+        ON CONFLICT (id) DO UPDATE SET
+            balance = EXCLUDED.balance,
+            updated_at = EXCLUDED.updated_at
+    """
     
     def __init__(self, db):
         self.db = db
@@ -110,20 +120,7 @@ class PostgresCashHoldingRepository(CashHoldingRepository):
             conn, _ = conn_ctx.__enter__()
         try:
             with conn.cursor() as cur:
-                cur.execute("""
-                    INSERT INTO cash_holding (id, portfolio_id, currency, balance, created_at, updated_at)
-                    VALUES (%s, %s, %s, %s, %s, %s)
-                    ON CONFLICT (id) DO UPDATE SET
-                        balance = EXCLUDED.balance,
-                        updated_at = EXCLUDED.updated_at
-                """, (
-                    str(cash_holding.id),
-                    str(cash_holding.portfolio_id),
-                    cash_holding.currency.value if hasattr(cash_holding.currency, 'value') else str(cash_holding.currency),
-                    cash_holding.balance,
-                    cash_holding.created_at,
-                    cash_holding.updated_at
-                ))
+                cur.execute(self._UPSERT_SQL, self._holding_params(cash_holding))
         finally:
             if conn_ctx is not None:
                 conn_ctx.__exit__(None, None, None)
@@ -143,10 +140,36 @@ class PostgresCashHoldingRepository(CashHoldingRepository):
             if conn_ctx is not None:
                 conn_ctx.__exit__(None, None, None)
 
-    def batch_save(self, holdings: List[CashHolding], conn=None) -> None:
-        """Save multiple cash holdings."""
-        for holding in holdings:
-            self.save(holding, conn)
+    def batch_save(self, holdings: List[CashHolding], conn=None, page_size: int = 100) -> None:
+        """
+        Save multiple cash holdings.
+
+        execute_batch sends the upserts page_size statements per round trip instead of one each,
+        keeping per-row ON CONFLICT semantics for repeated ids.
+        """
+        if not holdings:
+            return
+        conn_ctx = None
+        if conn is None:
+            conn_ctx = self.db.connection()
+            conn, _ = conn_ctx.__enter__()
+        try:
+            with conn.cursor() as cur:
+                execute_batch(cur, self._UPSERT_SQL, [self._holding_params(holding) for holding in holdings], page_size=page_size)
+        finally:
+            if conn_ctx is not None:
+                conn_ctx.__exit__(None, None, None)
+
+    @staticmethod
+    def _holding_params(cash_holding: CashHolding) -> tuple:
+        return (
+            str(cash_holding.id),
+            str(cash_holding.portfolio_id),
+            cash_holding.currency.value if hasattr(cash_holding.currency, 'value') else str(cash_holding.currency),
+            cash_holding.balance,
+            cash_holding.created_at,
+            cash_holding.updated_at
+        )
 
     def exists(self, holding_id: UUID, conn=None) -> bool:
         """Check if a cash holding exists."""
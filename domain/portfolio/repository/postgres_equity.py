@@ -1,9 +1,11 @@
 """PostgreSQL repository implementation for Equity entities."""
 
-from typing import Optional, List
+from typing import Optional, List, Dict, Iterable
 from uuid import UUID
 from datetime import datetime
 
+from psycopg2.extras import execute_values
+
 from domain.portfolio.repository.base import EquityRepository
 from domain.portfolio.models.holding import Equity
 from domain.portfolio.models.enums import Exchange
@@ -57,6 +59,28 @@ class PostgresEquityRepository(EquityRepository):
             if conn_ctx is not None:
                 conn_ctx.__exit__(None, None, None)
 
+    def get_many(self, equity_ids: Iterable[UUID], conn=None) -> Dict[UUID, Equity]:
+        """Get several equities by ID in a single query, keyed by ID."""
+        ids = [str(equity_id) for equity_id in set(equity_ids)]
+        if not ids:
+            return {}
+        conn_ctx = None
+        if conn is None:
+            conn_ctx = self.db.connection()
+            conn, _ = conn_ctx.__enter__()
+        try:
+            with conn.cursor() as cur:
+                cur.execute("""
+                    SELECT * FROM equity WHERE id = ANY(%s::uuid[])
+                """, (ids,))
+                rows = cur.fetchall()
+                colnames = [desc[0] for desc in cur.description]
+                equities = (self._row_to_equity(dict(zip(colnames, row))) for row in rows)
+                return {equity.id: equity for equity in equities}
+        finally:
+            if conn_ctx is not None:
+                conn_ctx.__exit__(None, None, None)
+
     def find_by_symbol(self, symbol: str, exchange: str, conn=None) -> Optional[Equity]:
         """Find an equity by symbol and exchange."""
         conn_ctx = None
@@ -77,6 +101,28 @@ class PostgresEquityRepository(EquityRepository):
             if conn_ctx is not None:
                 conn_ctx.__exit__(None, None, None)
 
+    def find_by_symbols(self, symbols: Iterable[str], exchange: str, conn=None) -> Dict[str, Equity]:
+        """Find several equities on one exchange in a single query, keyed by symbol."""
+        symbols = list(set(symbols))
+        if not symbols:
+            return {}
+        conn_ctx = None
+        if conn is None:
+            conn_ctx = self.db.connection()
+            conn, _ = conn_ctx.__enter__()
+        try:
+            with conn.cursor() as cur:
+                cur.execute("""
+                    SELECT * FROM equity WHERE symbol = ANY(%s) AND exchange = %s
+                """, (symbols, exchange))
+                rows = cur.fetchall()
+                colnames = [desc[0] for desc in cur.description]
+                equities = (self._row_to_equity(dict(zip(colnames, row))) for row in rows)
+                return {equity.symbol: equity for equity in equities}
+        finally:
+            if conn_ctx is not None:
+                conn_ctx.__exit__(None, None, None)
+
     def find_by_portfolio_id(self, portfolio_id: UUID, conn=None) -> List[Equity]:
         """Find all equities associated with a portfolio."""
         conn_ctx = None
@@ -158,6 +204,37 @@ class PostgresEquityRepository(EquityRepository):
             if conn_ctx is not None:
                 conn_ctx.__exit__(None, None, None)
 
+    def batch_save(self, equities: List[Equity], conn=None, page_size: int = 100) -> None:
+        """Insert or update several equities with one multi-row INSERT per page."""
+        if not equities:
+            return
+        conn_ctx = None
+        if conn is None:
+            conn_ctx = self.db.connection()
+            conn, _ = conn_ctx.__enter__()
+        try:
+            with conn.cursor() as cur:
+                execute_values(cur, """
+                    INSERT INTO equity (id, symbol, name, exchange, created_at)
+                    VALUES %s
+                    ON CONFLICT (id) DO UPDATE SET
+                        symbol = EXCLUDED.symbol,
+                        name = EXCLUDED.name,
+                        exchange = EXCLUDED.exchange
+                """, [
+                    (
+                        str(equity.id),
+                        equity.symbol,
+                        equity.name,
+                        equity.exchange.value if hasattr(equity.exchange, 'value') else equity.exchange,
+                        equity.created_at
+                    )
+                    for equity in equities
+                ], page_size=page_size)
+        finally:
+            if conn_ctx is not None:
+                conn_ctx.__exit__(None, None, None)
+
     def delete(self, equity_id: UUID, conn=None) -> None:
         """Delete an equity."""
         conn_ctx = None
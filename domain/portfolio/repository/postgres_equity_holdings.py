@@ -5,12 +5,24 @@ from uuid import UUID
 from decimal import Decimal
 from datetime import datetime
 
+from psycopg2.extras import execute_batch
+
 from domain.portfolio.repository.base import EquityHoldingRepository
 from domain.portfolio.models.holding import EquityHolding
 
 
 class PostgresEquityHoldingRepository(EquityHoldingRepository):
     """PostgreSQL implementation of EquityHoldingRepository."""
+
+    _UPSERT_SQL = """
+        INSERT INTO equity_holding (id, portfolio_id, equity_id, quantity, cost_basis, current_value, created_at, updated_at)
+        VALUES (%s, %s, %s, %s, %s, %s, %s, %s)
+        ON CONFLICT (id) DO UPDATE SET
+            quantity = EXCLUDED.quantity,
+            cost_basis = EXCLUDED.cost_basis,
+            current_value = EXCLUDED.current_value,
+            updated_at = EXCLUDED.updated_at
+    """
     
     def __init__(self, db):
         self.db = db
@@ -114,24 +126,7 @@ class PostgresEquityHoldingRepository(EquityHoldingRepository):
             conn, _ = conn_ctx.__enter__()
         try:
             with conn.cursor() as cur:
-                cur.execute("""
-                    INSERT INTO equity_holding (id, portfolio_id, equity_id, quantity, cost_basis, current_value, created_at, updated_at)
-                    VALUES (%s, %s, %s, %s, %s, %s, %s, %s)
-                    ON CONFLICT (id) DO UPDATE SET
-                        quantity = EXCLUDED.quantity,
-                        cost_basis = EXCLUDED.cost_basis,
-                        current_value = EXCLUDED.current_value,
-                        updated_at = EXCLUDED.updated_at
-                """, (
-                    str(holding.id),
-                    str(holding.portfolio_id),
-                    str(holding.equity_id),
-                    holding.quantity,
-                    holding.cost_basis,
-                    holding.current_value,
-                    holding.created_at,
-                    holding.updated_at
-                ))
+                cur.execute(self._UPSERT_SQL, self._holding_params(holding))
         finally:
             if conn_ctx is not None:
                 conn_ctx.__exit__(None, None, None)
@@ -151,10 +146,38 @@ class PostgresEquityHoldingRepository(EquityHoldingRepository):
             if conn_ctx is not None:
                 conn_ctx.__exit__(None, None, None)
 
-    def batch_save(self, holdings: List[EquityHolding], conn=None) -> None:
-        """Save multiple equity holdings."""
-        for holding in holdings:
-            self.save(holding, conn)
+    def batch_save(self, holdings: List[EquityHolding], conn=None, page_size: int = 100) -> None:
+        """
+        Save multiple equity holdings.
+
+        execute_batch sends the upserts page_size statements per round trip instead of one each,
+        keeping per-row ON CONFLICT semantics for repeated ids.
+        """
+        if not holdings:
+            return
+        conn_ctx = None
+        if conn is None:
+            conn_ctx = self.db.connection()
+            conn, _ = conn_ctx.__enter__()
+        try:
+            with conn.cursor() as cur:
+                execute_batch(cur, self._UPSERT_SQL, [self._holding_params(holding) for holding in holdings], page_size=page_size)
+        finally:
+            if conn_ctx is not None:
+                conn_ctx.__exit__(None, None, None)
+
+    @staticmethod
+    def _holding_params(holding: EquityHolding) -> tuple:
+        return (
+            str(holding.id),
+            str(holding.portfolio_id),
+            str(holding.equity_id),
+            holding.quantity,
+            holding.cost_basis,
+            holding.current_value,
+            holding.created_at,
+            holding.updated_at
+        )
 
     def exists(self, holding_id: UUID, conn=None) -> bool:
         """Check if an equity holding exists."""
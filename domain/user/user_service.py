@@ -1,4 +1,4 @@
-from typing import Optional, List
+from typing import Dict, Optional, List
 from uuid import UUID
 from domain.user.user import User
 from domain.user.repository.base import UserRepository
@@ -8,6 +8,7 @@ from passlib.context import CryptContext
 class UserService:
     def __init__(self, user_repo: UserRepository):
         self.user_repo = user_repo
+        self._password_hashes: Dict[UUID, PasswordHash] = {}
 
     def get_user_by_id(self, user_id: UUID, conn=None) -> Optional[User]:
         return self.user_repo.get_by_id(user_id, conn=conn)
@@ -25,6 +26,7 @@ class UserService:
         pwd_context = CryptContext(schemes=["argon2"], deprecated="auto")
         new_hash = PasswordHash.create(new_password, pwd_context).hashed
         self.user_repo.change_password(user_id, new_hash, conn=conn)
+        self._password_hashes.pop(user_id, None)
 
     def verify_user_password(self, user_id: UUID, plain_password: str, conn=None) -> tuple[bool, str]:
         """
@@ -35,9 +37,37 @@ class UserService:
         user = self.get_user_by_id(user_id, conn=conn)
         if not user:
             return False, "user_not_found"
+        return self._verify_hash(user.password_hash, plain_password)
+
+    def cache_password_hash(self, user_id: UUID, conn=None) -> Optional[PasswordHash]:
+        """
+        Loads and remembers the stored hash for the user, so a later
+        verify_password_by_cached_hash needs no database connection.
+        Returns None if the user does not exist.
+        """
+        password_hash = self._password_hashes.get(user_id)
+        if password_hash is None:
+            user = self.get_user_by_id(user_id, conn=conn)
+            if not user:
+                return None
+            password_hash = self._password_hashes[user_id] = user.password_hash
+        return password_hash
+
+    def verify_password_by_cached_hash(self, user_id: UUID, plain_password: str, conn=None) -> tuple[bool, str]:
+        """
+        Same result as verify_user_password, but the stored hash is fetched at most
+        once per service instance. Call cache_password_hash first to release the
+        connection before the (deliberately slow) hash verification runs.
+        """
+        password_hash = self.cache_password_hash(user_id, conn=conn)
+        if password_hash is None:
+            return False, "user_not_found"
+        return self._verify_hash(password_hash, plain_password)
+
+    def _verify_hash(self, password_hash: PasswordHash, plain_password: str) -> tuple[bool, str]:
         pwd_context = CryptContext(schemes=["argon2"], deprecated="auto")
         try:
-            if user.password_hash.verify(plain_password, pwd_context):
+            if password_hash.verify(plain_password, pwd_context):
                 return True, "match"
             else:
                 return False, "password_mismatch"
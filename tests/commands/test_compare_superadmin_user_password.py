@@ -0,0 +1,24 @@
+import contextlib
+from unittest.mock import Mock, patch
+from commands import compare_superadmin_user_password as command
+
+
+def _container_with_connection(conn):
+    pool = Mock()
+    pool.connection.side_effect = lambda **kwargs: contextlib.nullcontext((conn, None))
+    container = Mock()
+    container.postgres_pool.return_value = pool
+    return container
+
+
+def test_missing_superadmin_reports_user_not_found(capsys):
+    conn = Mock()
+    repo = Mock()
+    repo.get_by_id.return_value = None
+    with patch.object(command, "get_container", return_value=_container_with_connection(conn)), \
+            patch.object(command, "PostgresUserRepository", return_value=repo), \
+            patch("sys.argv", ["compare_superadmin_user_password", "secret"]):
+        command.main()
+
+    assert capsys.readouterr().out.strip() == "Password does NOT match SUPER_ADMIN user. Reason: user_not_found"
+    repo.get_by_id.assert_called_once_with(command.SUPER_ADMIN_USER_ID, conn=conn)
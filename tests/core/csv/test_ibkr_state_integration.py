@@ -205,3 +205,235 @@ def test_full_parsing_integration(sample_ibkr_csv_content):
     assert meta["Account"] == "U12345678"
     assert "PeriodStart" in meta
     assert "PeriodEnd" in meta
+
+
+def test_iter_sections_streams_records(sample_ibkr_csv_content):
+    """iter_sections yields records lazily without filling the handler lists."""
+    parser = IbkrCsvParser(logger=Mock())
+    
+    with patch("builtins.open", mock_open(read_data=sample_ibkr_csv_content)):
+        records = list(parser.iter_sections("test.csv"))
+    
+    sections = [name for name, _ in records]
+    assert sections.count("Trades") == 2
+    assert sections.count("Dividends") == 2
+    assert sections.count("Statement") == 3
+    
+    trades = [record for name, record in records if name == "Trades"]
+    assert trades[0]["symbol"] == "AAPL"
+    assert trades[0]["quantity"] == 100.0
+    
+    # Nothing is accumulated on the handlers
+    assert parser.trades == []
+    assert parser.dividends == []
+
+
+def test_parse_async_matches_parse(sample_ibkr_csv_content, tmp_path):
+    """parse_async parses in a worker thread and fills the same handlers as parse."""
+    import asyncio
+    csv_path = tmp_path / "statement.csv"
+    csv_path.write_text(sample_ibkr_csv_content, encoding="utf-8")
+    
+    parser = IbkrCsvParser(logger=Mock())
+    assert asyncio.run(parser.parse_async(str(csv_path))) is parser
+    
+    expected = IbkrCsvParser(logger=Mock()).parse(str(csv_path))
+    assert parser.trades == expected.trades
+    assert parser.dividends == expected.dividends
+    assert len(parser.trades) == 2
+
+
+def test_parse_interns_repeated_trade_labels(sample_ibkr_csv_content):
+    """Repeated currency/category labels share one string object across records."""
+    parser = IbkrCsvParser(logger=Mock())
+    
+    with patch("builtins.open", mock_open(read_data=sample_ibkr_csv_content)):
+        parser.parse("test.csv")
+    
+    first, second = parser.trades
+    assert first["currency"] is second["currency"]
+    assert first["asset_category"] is second["asset_category"]
+    assert first["code"] is second["code"]
+
+
+def test_parse_streams_each_section_without_buffering(sample_ibkr_csv_content):
+    """parse hands every section over as a lazy row iterator, one call per section header."""
+    parser = IbkrCsvParser(logger=Mock())
+    seen = []
+    
+    def dispatch(section_name, rows):
+        assert not isinstance(rows, list)
+        seen.append((section_name, len(list(rows))))
+    
+    parser._dispatch_section = dispatch
+    with patch("builtins.open", mock_open(read_data=sample_ibkr_csv_content)):
+        parser.parse("test.csv")
+    
+    assert [name for name, _ in seen] == ["Statement", "Trades", "Dividends"]
+    assert seen[1] == ("Trades", 6)
+
+
+def test_parse_opens_file_with_large_read_buffer(sample_ibkr_csv_content):
+    """The statement is read through a 1 MiB buffer rather than the 8 KiB default."""
+    from core.csv.base import READ_BUFFER_SIZE
+    opener = mock_open(read_data=sample_ibkr_csv_content)
+    
+    with patch("builtins.open", opener):
+        IbkrCsvParser(logger=Mock()).parse("test.csv")
+    
+    assert opener.call_args.kwargs["buffering"] == READ_BUFFER_SIZE == 1 << 20
+
+
+def test_section_without_dedicated_parser_uses_its_own_state():
+    """A handler registered for an unknown section gets that section's rows under its own name."""
+    content = """Trades,Header,Symbol,Quantity
+Trades,Data,AAPL,100
+Cash Report,Header,Currency Summary,Total
+Cash Report,Data,Starting Cash,1000
+"""
+    handler = Mock()
+    parser = IbkrCsvParser(section_handlers={"Cash Report": handler}, logger=Mock())
+    
+    with patch("builtins.open", mock_open(read_data=content)):
+        parser.parse("test.csv")
+    
+    assert parser.state_machine.current_section_name == "Cash Report"
+    handler.handle_row.assert_called_once_with({"currency_summary": "Starting Cash", "total": "1000"})
+
+
+def test_section_header_detector_matches_exact_and_padded_headers():
+    from core.csv.ibkr import ibkr_section_header_detector
+    assert ibkr_section_header_detector(["Trades", "Header", "Symbol"]) == "Trades"
+    assert ibkr_section_header_detector([" Open Positions ", " header ", "Symbol"]) == "Open Positions"
+    assert ibkr_section_header_detector(["Trades", "Data", "Order"]) is None
+    assert ibkr_section_header_detector(["Trades"]) is None
+
+
+def test_ibkr_handlers_have_no_instance_dict():
+    """Handlers are slotted, so their per-row attribute reads skip the instance __dict__."""
+    from core.csv.ibkr import IbkrTradesHandler, IbkrDividendsHandler, IbkrOpenPositionsHandler
+    for handler in (IbkrTradesHandler(), IbkrDividendsHandler(), IbkrOpenPositionsHandler()):
+        assert not hasattr(handler, "__dict__")
+
+
+def test_parse_float_handles_cells_and_non_strings():
+    from core.csv.ibkr import parse_float
+    assert parse_float("1,234.50") == 1234.5
+    assert parse_float(" -15000.00 ") == -15000.0
+    assert parse_float("0") == 0.0
+    for blank in ("", "--", "abc", None):
+        assert parse_float(blank) is None
+    assert parse_float(3) == 3.0
+
+
+def test_parse_interns_repeated_dividend_currencies(sample_ibkr_csv_content):
+    parser = IbkrCsvParser(logger=Mock())
+    
+    with patch("builtins.open", mock_open(read_data=sample_ibkr_csv_content)):
+        parser.parse("test.csv")
+    
+    first, second = parser.dividends
+    assert first["currency"] is second["currency"] == "USD"
+
+
+def test_parse_period_date_fast_path_matches_strptime():
+    from datetime import datetime
+    from core.csv.ibkr import _parse_period_date
+    for text in ("January 1, 2024", "March 05, 2024", "December 31, 2025", "june 7, 2024"):
+        assert _parse_period_date(text) == datetime.strptime(text, "%B %d, %Y").date()
+    with pytest.raises(ValueError):
+        _parse_period_date("February 30, 2024")
+
+
+def test_parse_when_generated_fast_path_matches_strptime():
+    from datetime import datetime
+    from core.csv.ibkr import _parse_when_generated
+    for text in ("2024-12-31", "2024-01-05", "2024-1-5"):
+        assert _parse_when_generated(text) == datetime.strptime(text, "%Y-%m-%d")
+    for text in ("2024-02-30", "2024-12-31T10:00", "Invalid date"):
+        with pytest.raises(ValueError):
+            _parse_when_generated(text)
+
+
+def test_parse_builds_no_debug_messages_when_debug_disabled(sample_ibkr_csv_content):
+    """With DEBUG filtered out, a full parse never calls logger.debug."""
+    logger = Mock()
+    logger.isEnabledFor.return_value = False
+    parser = IbkrCsvParser(logger=logger)
+    
+    with patch("builtins.open", mock_open(read_data=sample_ibkr_csv_content)):
+        parser.parse("test.csv")
+    
+    assert len(parser.trades) == 2
+    logger.debug.assert_not_called()
+
+
+def test_parse_reuses_cached_result_for_unchanged_file(sample_ibkr_csv_content, tmp_path):
+    """A second parse of an unchanged file copies cached records instead of reading it again."""
+    import os
+    csv_path = tmp_path / "statement.csv"
+    csv_path.write_text(sample_ibkr_csv_content, encoding="utf-8")
+    first = IbkrCsvParser(logger=Mock()).parse(str(csv_path))
+    first.trades[0]["symbol"] = "CHANGED"
+    
+    with patch("builtins.open", side_effect=AssertionError("file re-read")):
+        second = IbkrCsvParser(logger=Mock()).parse(str(csv_path))
+    
+    assert [t["symbol"] for t in second.trades] == ["AAPL", "GOOGL"]
+    assert second.dividends == first.dividends
+    assert second.meta == first.meta
+    
+    # A changed file (new mtime/size) is parsed again
+    csv_path.write_text(sample_ibkr_csv_content.replace("GOOGL", "MSFT"), encoding="utf-8")
+    os.utime(csv_path, ns=(0, 0))
+    third = IbkrCsvParser(logger=Mock()).parse(str(csv_path))
+    assert [t["symbol"] for t in third.trades] == ["AAPL", "MSFT"]
+
+
+def test_parse_with_custom_handlers_is_not_cached(sample_ibkr_csv_content, tmp_path):
+    csv_path = tmp_path / "statement.csv"
+    csv_path.write_text(sample_ibkr_csv_content, encoding="utf-8")
+    IbkrCsvParser(logger=Mock()).parse(str(csv_path))
+    handler = Mock()
+    
+    IbkrCsvParser(section_handlers={"Trades": handler}, logger=Mock()).parse(str(csv_path))
+    
+    assert handler.handle_row.call_count == 2
+
+
+def test_section_parsers_resolved_at_init():
+    parser = IbkrCsvParser(logger=Mock())
+    
+    assert set(parser._section_parsers) == {"Trades", "Dividends", "Open Positions", "Statement", "Forex Balances"}
+    assert parser._section_parsers["Statement"] == (parser._parse_section_statement, "custom")
+    trades_method, kind = parser._section_parsers["Trades"]
+    assert kind == "custom" and trades_method.args == ("Trades",)
+    
+    custom = IbkrCsvParser(section_handlers={"Cash Report": Mock()}, logger=Mock())
+    parse_method, kind = custom._section_parsers["Cash Report"]
+    assert kind == "generic" and parse_method.args == ("Cash Report",)
+
+
+def test_iter_sections_builds_records_positionally(sample_ibkr_csv_content):
+    """Streaming uses the handlers' per-header column plan, not a dict per row."""
+    from core.csv.ibkr import IbkrTradesHandler
+    parser = IbkrCsvParser(logger=Mock())
+    
+    with patch("builtins.open", mock_open(read_data=sample_ibkr_csv_content)), \
+            patch.object(IbkrTradesHandler, "build_record", side_effect=AssertionError("dict built")):
+        records = list(parser.iter_sections("test.csv"))
+    
+    assert [r["symbol"] for name, r in records if name == "Trades"] == ["AAPL", "GOOGL"]
+
+
+def test_dict_rows_missing_columns_read_as_none():
+    """handle_row fetches all columns at once and falls back to None for absent ones."""
+    from core.csv.ibkr import IbkrDividendsHandler
+    handler = IbkrDividendsHandler()
+    handler.handle_row({"currency": "USD", "date": "2024-01-15", "description": "AAPL Dividend", "amount": "1,234.5"})
+    handler.handle_row({"date": "2024-02-15", "description": "MSFT Dividend", "amount": "10"})
+    
+    assert handler.dividends == [
+        {"currency": "USD", "date": "2024-01-15", "description": "AAPL Dividend", "amount": 1234.5},
+        {"currency": None, "date": "2024-02-15", "description": "MSFT Dividend", "amount": 10.0},
+    ]
@@ -100,6 +100,44 @@ class TestSectionParsingState:
         handler.handle_row.assert_called_once_with(expected_data)
         assert state.state == ParseState.DATA
     
+    def test_process_data_row_passes_cells_to_section_handlers(self):
+        """CsvSectionHandlers get the raw cells plus one column index shared by every row of the header."""
+        from core.csv.ibkr import IbkrTradesHandler
+        state = TradesParsingState("Trades", Mock())
+        state.process_header(["Trades", "Header", "Symbol", "Date/Time", "Quantity"])
+        handler = IbkrTradesHandler()
+        
+        state.process_data_row(["Trades", "Data", "AAPL", "2024-01-15", "100"], handler)
+        plan = handler.column_plan(state.col_idx)
+        state.process_data_row(["Trades", "Data", "MSFT", "2024-01-16", "1,000"], handler)
+        
+        assert handler.column_plan(state.col_idx) is plan
+        assert [(t["symbol"], t["quantity"], t["proceeds"]) for t in handler.trades] == [
+            ("AAPL", 100.0, None), ("MSFT", 1000.0, None)
+        ]
+    
+    def test_debug_messages_skipped_when_debug_disabled(self):
+        """Header and summary-row debug messages are not built when the logger filters DEBUG out."""
+        logger = Mock()
+        logger.isEnabledFor.return_value = False
+        state = TradesParsingState("Trades", logger)
+        
+        state.process_header(["Trades", "Header", "Symbol", "Quantity"])
+        state.process_data_row(["Trades", "Data", "Total", ""], Mock())
+        
+        logger.debug.assert_not_called()
+    
+    def test_process_row_skips_blank_and_whitespace_rows(self):
+        """Rows whose cells are all empty or whitespace are ignored."""
+        state = TradesParsingState("Trades", Mock())
+        state.process_header(["Trades", "Header", "Symbol"])
+        handler = Mock()
+        
+        for row in ([], ["", ""], [" ", "\t", ""]):
+            state.process_row(row, handler)
+        
+        handler.handle_row.assert_not_called()
+    
     def test_process_data_row_skip_summary(self):
         """Test that summary rows are skipped."""
         logger = Mock()
@@ -260,12 +298,10 @@ class TestCsvStateMachine:
         machine = CsvStateMachine(logger)
         handler = Mock()
         
-        # Set up state
+        # Mock the state's process_row method, then set up state
+        machine.states["Trades"].process_row = Mock()
         machine.transition_to_section("Trades")
         
-        # Mock the state's process_row method
-        machine.current_state.process_row = Mock()
-        
         rows = [
             ["Trades", "Header", "Symbol", "Quantity"],
             ["Trades", "Data", "AAPL", "100"]
@@ -303,3 +339,84 @@ def test_integration_trades_parsing(sample_csv_rows):
     calls = handler.handle_row.call_args_list
     assert calls[0][0][0] == {"symbol": "AAPL", "quantity": "100", "price": "150.00"}
     assert calls[1][0][0] == {"symbol": "GOOGL", "quantity": "50", "price": "2500.00"}
+
+
+def test_normalize_field_is_cached():
+    """Repeated header names are normalized once."""
+    from core.csv.utils import normalize_field
+    normalize_field.cache_clear()
+    
+    assert normalize_field(" Realized P/L ") == "realized_p_l"
+    assert normalize_field(" Realized P/L ") == "realized_p_l"
+    
+    assert normalize_field.cache_info().hits == 1
+
+
+def test_is_summary_row_matches_padded_labels():
+    from core.csv.utils import is_summary_row
+    assert is_summary_row(["Trades", "Data", "  SubTotal "])
+    assert is_summary_row(["Dividends", "Data", "Total in CAD"], summary_keywords=["total"])
+    assert not is_summary_row(["Trades", "Data", "Order"])
+    assert not is_summary_row(["Trades", "Data"])
+
+
+def test_trade_zero_commission_is_not_replaced_by_cad_column():
+    """A legitimate 0 in Comm/Fee or MTM P/L is kept instead of falling through to the CAD column."""
+    from core.csv.ibkr import IbkrTradesHandler
+    state = TradesParsingState("Trades", Mock())
+    state.process_header(["Trades", "Header", "Symbol", "Date/Time", "Comm/Fee", "Comm in CAD", "MTM P/L", "MTM in CAD"])
+    handler = IbkrTradesHandler()
+    
+    state.process_data_row(["Trades", "Data", "AAPL", "2024-01-15", "0", "-1.35", "0", "12.5"], handler)
+    state.process_data_row(["Trades", "Data", "MSFT", "2024-01-16", "", "-1.35", "--", "12.5"], handler)
+    
+    assert [(t["commission"], t["mtm_pl"]) for t in handler.trades] == [(0.0, 0.0), (-1.35, 12.5)]
+
+
+def test_section_processor_matches_row_by_row_processing():
+    """The fused per-section loop hands the handler exactly what process_row would."""
+    rows = [
+        ["Trades", "Data", "AAPL", "100"],
+        ["Trades", "Header", "Symbol", "Quantity"],
+        ["Trades", "Data", "AAPL", "100"],
+        ["Trades", "Data", "SubTotal", "100"],
+        ["Trades", "Data", "MSFT"],
+        [],
+        ["Trades", "Header", "Symbol", "Quantity", "Price"],
+        ["Trades", "Data", "GOOGL", "50", "2500.00"],
+    ]
+    fused, stepped = Mock(), Mock()
+    fused_state = TradesParsingState("Trades", Mock())
+    stepped_state = TradesParsingState("Trades", Mock())
+    
+    fused_state.make_processor()(rows, fused)
+    for row in rows:
+        stepped_state.process_row(row, stepped)
+    
+    assert fused.handle_row.call_args_list == stepped.handle_row.call_args_list
+    assert fused.handle_row.call_count == 2
+    assert fused_state.state == stepped_state.state == ParseState.DATA
+    assert fused_state.logger.warning.call_count == stepped_state.logger.warning.call_count == 2
+
+
+def test_section_processor_and_process_row_build_the_same_records():
+    """CsvSectionHandlers get identical records from the section processor and from process_row."""
+    from core.csv.ibkr import IbkrTradesHandler
+    rows = [
+        ["Trades", "Header", "DataDiscriminator", "Symbol", "Date/Time", "Quantity", "Comm/Fee"],
+        ["Trades", "Data", "Order", "AAPL", "2024-01-15", "100", "-1.00"],
+        ["Trades", "Data", "SubTotal", "", "", "100", "-1.00"],
+        ["Trades", "Data", "Order", "MSFT", "2024-01-16", "1,000"],
+        ["Trades", "Data", "Order", "MSFT", "2024-01-16", "1,000", "0"],
+    ]
+    by_section, by_row = IbkrTradesHandler(), IbkrTradesHandler()
+    
+    TradesParsingState("Trades", Mock()).make_processor()(rows, by_section)
+    stepped_state = TradesParsingState("Trades", Mock())
+    for row in rows:
+        stepped_state.process_row(row, by_row)
+    
+    assert by_section.trades == by_row.trades
+    assert [(t["symbol"], t["quantity"], t["commission"]) for t in by_section.trades] == [
+        ("AAPL", 100.0, -1.0), ("MSFT", 1000.0, 0.0)
+    ]
@@ -31,6 +31,29 @@ def test_single_section_csv():
     assert handler.rows[0]['Quantity'] == '10'
     assert handler.rows[1]['Symbol'] == 'GOOG'
 
+def test_indexed_handler_reads_cells_by_column_index():
+    class SymbolHandler(CsvSectionHandler):
+        def __init__(self):
+            self.symbols = []
+        def handle_row_indexed(self, row, col_idx):
+            self.symbols.append(row[col_idx['Symbol']])
+    handler = SymbolHandler()
+    parser = BaseCSVParser(section_handlers={None: handler}, logger=ListLogger())
+    parser.parse(os.path.join(TEST_DIR, 'simple.csv'))
+    assert handler.symbols == ['AAPL', 'GOOG']
+
+def test_plain_handler_without_base_class_receives_dict_rows():
+    class PlainHandler:
+        def __init__(self):
+            self.rows = []
+        def handle_row(self, row: dict):
+            self.rows.append(row)
+    handler = PlainHandler()
+    parser = BaseCSVParser(section_handlers={None: handler}, logger=ListLogger())
+    parser.parse(os.path.join(TEST_DIR, 'simple.csv'))
+    assert [row['Symbol'] for row in handler.rows] == ['AAPL', 'GOOG']
+    assert handler.rows[0]['Date'] == '2025-01-01'
+
 def test_multisection_csv():
     class SectionHandler(CsvSectionHandler):
         def __init__(self):
@@ -111,3 +134,11 @@ def test_bad_row_length_lenient():
     assert any("Row length" in e for e in errors)
     # Only valid rows should be appended
     assert len(handler.rows) == 2  # Only the first and last rows are valid
+
+def test_blank_rows_skipped_but_rows_with_empty_first_cell_kept(tmp_path):
+    csv_path = tmp_path / 'blanks.csv'
+    csv_path.write_text('Date,Symbol,Quantity\n , ,\n,,\n,AAPL,10\n')
+    handler = SimpleHandler()
+    parser = BaseCSVParser(section_handlers={None: handler}, logger=ListLogger())
+    parser.parse(str(csv_path))
+    assert handler.rows == [{'Date': '', 'Symbol': 'AAPL', 'Quantity': '10'}]
@@ -1,7 +1,7 @@
 import unittest
 from unittest.mock import MagicMock
 from core.cache.memory import MemoryCache
-from core.cache.redis import RedisCache
+from core.cache.redis import RedisCache, RedisClientFactory
 
 class TestMemoryCache(unittest.TestCase):
     def setUp(self):
@@ -17,6 +17,52 @@ class TestMemoryCache(unittest.TestCase):
         time.sleep(0.02)
         self.assertIsNone(self.cache.get('foo'))
 
+    def test_delete_many(self):
+        self.cache.set_many([('foo', 1), ('bar', 2), ('baz', 3)])
+        self.cache.delete_many(['foo', 'bar'])
+        self.assertEqual(self.cache.get_many(['foo', 'bar', 'baz']), {'baz': 3})
+
+    def test_get_many_skips_expired(self):
+        self.cache.set('fresh', 1)
+        self.cache.set('stale', 2, ttl=0.01)
+        import time
+        time.sleep(0.02)
+        self.assertEqual(self.cache.get_many(['fresh', 'stale']), {'fresh': 1})
+        self.assertNotIn('stale', self.cache._store)
+
+    def test_evicts_least_recently_used(self):
+        cache = MemoryCache(max_size=2)
+        cache.set('a', 1)
+        cache.set('b', 2)
+        self.assertEqual(cache.get('a'), 1)
+        cache.set('c', 3)
+        self.assertIsNone(cache.get('b'))
+        self.assertEqual(cache.get_many(['a', 'c']), {'a': 1, 'c': 3})
+
+    def test_set_sweeps_expired_entries(self):
+        self.cache.set('stale', 1, ttl=0.01)
+        self.cache.set('kept', 2)
+        self.cache.set('refreshed', 3, ttl=0.01)
+        self.cache.set('refreshed', 4)
+        import time
+        time.sleep(0.02)
+        self.cache.set('fresh', 5)
+        self.assertNotIn('stale', self.cache._store)
+        self.assertEqual(self.cache.get('kept'), 2)
+        self.assertEqual(self.cache.get('refreshed'), 4)
+        self.assertEqual(self.cache._expirations, [])
+
+    def test_expiry_heap_stays_bounded(self):
+        for i in range(10_000):
+            self.cache.set(f'key{i % 5}', i, ttl=3600)
+        self.assertLessEqual(len(self.cache._expirations), 2 * 5 + MemoryCache.HEAP_SLACK)
+        cache = MemoryCache(max_size=10)
+        for i in range(10_000):
+            cache.set(i, i, ttl=3600)
+        self.assertEqual(len(cache._store), 10)
+        self.assertLessEqual(len(cache._expirations), 2 * 10 + MemoryCache.HEAP_SLACK)
+        self.assertEqual(cache.get(9_999), 9_999)
+
     def test_delete(self):
         self.cache.set('foo', 'bar')
         self.cache.delete('foo')
@@ -27,35 +73,81 @@ class TestMemoryCache(unittest.TestCase):
         self.cache.clear()
         self.assertIsNone(self.cache.get('foo'))
 
+    def test_get_many_treats_stored_none_as_miss(self):
+        self.cache.set_many([('foo', None), ('bar', 0)])
+        self.assertIsNone(self.cache.get('foo'))
+        self.assertEqual(self.cache.get_many(['foo', 'bar']), {'bar': 0})
+
+    def test_get_many_and_set_many(self):
+        self.cache.set_many([('foo', 'bar'), ('baz', 'qux')])
+        self.assertEqual(self.cache.get_many(['foo', 'missing', 'baz']), {'foo': 'bar', 'baz': 'qux'})
+
 class TestRedisCache(unittest.TestCase):
     def test_default_ttl(self):
         mock_client = MagicMock()
         cache = RedisCache(client=mock_client, default_ttl=42)
         cache.set('foo', 'bar')
-        mock_client.setex.assert_called_with('foo', 42, 'bar')
+        mock_client.setex.assert_called_with('foo', 42, b'"bar"')
     def setUp(self):
         self.mock_client = MagicMock()
         self.cache = RedisCache(client=self.mock_client)
 
     def test_set_and_get(self):
-        self.mock_client.get.return_value = 'bar'
-        self.cache.set('foo', 'bar')
-        self.cache.get('foo')
-        self.mock_client.set.assert_called_with('foo', 'bar')
+        self.mock_client.get.return_value = b'{"price":1.5}'
+        self.cache.set('foo', {'price': 1.5})
+        self.assertEqual(self.cache.get('foo'), {'price': 1.5})
+        self.mock_client.set.assert_called_with('foo', b'{"price":1.5}')
         self.mock_client.get.assert_called_with('foo')
 
+    def test_get_many_treats_stored_none_as_miss(self):
+        self.mock_client.mget.return_value = [b'null', b'0', None]
+        self.assertEqual(self.cache.get_many(['foo', 'bar', 'baz']), {'bar': 0})
+
+    def test_get_missing_returns_none(self):
+        self.mock_client.get.return_value = None
+        self.assertIsNone(self.cache.get('foo'))
+
     def test_set_with_ttl(self):
         self.cache.set('foo', 'bar', ttl=10)
-        self.mock_client.setex.assert_called_with('foo', 10, 'bar')
+        self.mock_client.setex.assert_called_with('foo', 10, b'"bar"')
 
     def test_delete(self):
         self.cache.delete('foo')
         self.mock_client.delete.assert_called_with('foo')
 
+    def test_get_many_uses_single_mget(self):
+        self.mock_client.mget.return_value = [b'"bar"', None]
+        self.assertEqual(self.cache.get_many(['foo', 'missing', 'foo']), {'foo': 'bar'})
+        self.mock_client.mget.assert_called_once_with(['foo', 'missing'])
+        self.mock_client.get.assert_not_called()
+
+    def test_delete_many_uses_single_del(self):
+        self.cache.delete_many(['foo', 'bar'])
+        self.mock_client.delete.assert_called_once_with('foo', 'bar')
+        self.cache.delete_many([])
+        self.mock_client.delete.assert_called_once()
+
+    def test_set_many_uses_pipeline(self):
+        pipe = self.mock_client.pipeline.return_value.__enter__.return_value
+        self.cache.set_many([('foo', 'bar'), ('baz', 'qux')], ttl=10)
+        self.mock_client.pipeline.assert_called_once_with(transaction=False)
+        self.assertEqual(pipe.setex.call_count, 2)
+        pipe.setex.assert_any_call('baz', 10, b'"qux"')
+        pipe.execute.assert_called_once()
+        self.mock_client.setex.assert_not_called()
+
     def test_clear(self):
         self.cache.clear()
         self.mock_client.flushdb.assert_called_once()
 
+    def test_factory_uses_shared_keepalive_pool(self):
+        client = RedisClientFactory.create('localhost', 6379, 0)
+        pool = client.connection_pool
+        self.assertEqual(pool.max_connections, 50)
+        self.assertTrue(pool.connection_kwargs['socket_keepalive'])
+        self.assertEqual(pool.connection_kwargs['health_check_interval'], 30)
+        self.assertFalse(pool.connection_kwargs['decode_responses'])
+
     def test_test_connection_success(self):
         mock_logger = MagicMock()
         cache = RedisCache(logger=mock_logger, client=self.mock_client)
@@ -1,4 +1,4 @@
-from unittest.mock import Mock, call
+from unittest.mock import MagicMock, Mock, call
 from core.dataloader import DataLoader
 
 def make_mock_lock():
@@ -85,3 +85,45 @@ def test_dataloader_deduplication():
     assert backend.set.call_args_list == [call(1, 2), call(2, 3), call(3, 4)]
     lock = get_named_lock.last_lock['lock']
     assert lock.entered == 1 and lock.exited == 1
+
+def test_dataloader_uses_bulk_cache_calls():
+    from core.cache.redis import RedisCache
+    client = MagicMock()
+    client.mget.return_value = [b'"cached_1"', None]
+    backend = RedisCache(client=client, default_ttl=60)
+    pipe = client.pipeline.return_value.__enter__.return_value
+    from core.logger import Logger
+    logger = Logger(level="DEBUG")
+    loader = DataLoader(batch_load_fn=lambda keys: [f"loaded_{k}" for k in keys], backend=backend, get_named_lock=get_named_lock_factory(), logger=logger)
+    result = loader.load_many([1, 2, 1])
+    assert result == ["cached_1", "loaded_2", "cached_1"]
+    client.mget.assert_called_once_with([1, 2])
+    client.get.assert_not_called()
+    pipe.setex.assert_called_once_with(2, 60, b'"loaded_2"')
+    pipe.execute.assert_called_once()
+
+def test_dataloader_retries_keys_loaded_as_none_with_memory_cache():
+    from core.cache.memory import MemoryCache
+    calls = []
+    def batch_fn(keys):
+        calls.append(list(keys))
+        return [None for _ in keys]
+    from core.logger import Logger
+    loader = DataLoader(batch_load_fn=batch_fn, backend=MemoryCache(), get_named_lock=get_named_lock_factory(), logger=Logger(level="DEBUG"))
+    assert loader.load_many(["AAPL"]) == [None]
+    assert loader.load_many(["AAPL"]) == [None]
+    assert calls == [["AAPL"], ["AAPL"]]
+
+def test_dataloader_retries_keys_loaded_as_none_with_redis_cache():
+    from core.cache.redis import RedisCache
+    from core.logger import Logger
+    client = MagicMock()
+    client.mget.return_value = [b'null']
+    calls = []
+    def batch_fn(keys):
+        calls.append(list(keys))
+        return [None for _ in keys]
+    loader = DataLoader(batch_load_fn=batch_fn, backend=RedisCache(client=client), get_named_lock=get_named_lock_factory(), logger=Logger(level="DEBUG"))
+    assert loader.load_many(["x"]) == [None]
+    assert loader.load_many(["x"]) == [None]
+    assert calls == [["x"], ["x"]]
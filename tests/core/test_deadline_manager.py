@@ -21,3 +21,10 @@ def test_deadline_manager_multiple_checks():
     time.sleep(0.05)
     with pytest.raises(DeadlineExceeded):
         deadline.check()
+
+def test_deadline_manager_remaining():
+    deadline = DeadlineManager(timeout_seconds=1)
+    assert 0 < deadline.remaining() <= 1
+    expired = DeadlineManager(timeout_seconds=0)
+    time.sleep(0.01)
+    assert expired.remaining() < 0
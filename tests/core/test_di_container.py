@@ -0,0 +1,7 @@
+from core.di_container import get_container
+
+
+def test_get_container_returns_cached_instance():
+    container = get_container()
+    assert get_container() is container
+    assert container.logger is get_container().logger
@@ -0,0 +1,20 @@
+import uuid
+from core.ids import uuid7, new_tenant_id
+
+
+def test_uuid7_version_and_variant():
+    value = uuid7()
+    assert value.version == 7
+    assert value.variant == uuid.RFC_4122
+
+
+def test_uuid7_is_time_ordered():
+    first = uuid7()
+    import time
+    time.sleep(0.002)
+    second = uuid7()
+    assert first < second
+
+
+def test_new_tenant_id_is_uuid7():
+    assert new_tenant_id().version == 7
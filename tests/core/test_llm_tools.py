@@ -8,4 +8,10 @@ def test_summarize_positions_tool_formats_list():
     result = summarize_positions_tool(positions)
     assert "AAPL" in result
     assert "GOOG" in result
-    assert result.count("symbol") == 2  # Each dict stringified
+    lines = result.splitlines()
+    assert lines[0] == "symbol\tqty"  # Single header line
+    assert lines[1:] == ["AAPL\t10", "GOOG\t5"]
+
+def test_summarize_positions_tool_passes_through_serialized_payload():
+    payload = summarize_positions_tool([{"symbol": "AAPL", "qty": 10}])
+    assert summarize_positions_tool(payload) is payload
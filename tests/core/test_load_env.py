@@ -0,0 +1,79 @@
+import os
+import pytest
+from core.config import load_env as load_env_module
+from core.config.load_env import load_env
+
+
+def test_load_env_parses_file_once_per_mtime(tmp_path, monkeypatch):
+    env_file = tmp_path / ".env"
+    env_file.write_text("# comment\nLOAD_ENV_TEST_KEY = first\nnot a pair\n")
+    monkeypatch.delenv("LOAD_ENV_TEST_KEY", raising=False)
+    load_env_module._read_env.cache_clear()
+
+    load_env(str(env_file))
+    load_env(str(env_file))
+    assert os.environ["LOAD_ENV_TEST_KEY"] == "first"
+    assert load_env_module._read_env.cache_info().misses == 1
+
+    env_file.write_text("LOAD_ENV_TEST_KEY=second\n")
+    os.utime(env_file, ns=(0, os.stat(env_file).st_mtime_ns + 1_000_000_000))
+    monkeypatch.delenv("LOAD_ENV_TEST_KEY")
+    load_env(str(env_file))
+    assert os.environ["LOAD_ENV_TEST_KEY"] == "second"
+
+
+def test_load_env_missing_file(tmp_path):
+    with pytest.raises(FileNotFoundError):
+        load_env(str(tmp_path / "missing.env"))
+
+
+def test_load_env_strips_quotes_and_skips_noise(tmp_path, monkeypatch):
+    env_file = tmp_path / ".env"
+    env_file.write_text("\n  # LOAD_ENV_COMMENTED=1\nLOAD_ENV_QUOTED=\"a b\"\r\nLOAD_ENV_URL = x=y\nno pair\n")
+    for key in ("LOAD_ENV_QUOTED", "LOAD_ENV_URL", "LOAD_ENV_COMMENTED"):
+        monkeypatch.delenv(key, raising=False)
+
+    load_env(str(env_file))
+    assert os.environ["LOAD_ENV_QUOTED"] == "a b"
+    assert os.environ["LOAD_ENV_URL"] == "x=y"
+    assert "LOAD_ENV_COMMENTED" not in os.environ
+
+
+def test_load_env_empty_file(tmp_path):
+    env_file = tmp_path / ".env"
+    env_file.write_text("")
+    load_env(str(env_file))
+
+
+def test_get_app_config_snapshots_settings(tmp_path, monkeypatch):
+    from core.config.config import get_app_config
+    env_file = tmp_path / ".env"
+    env_file.write_text("POSTGRES_PORT=6543\nREDIS_HOST=cache\nLOG_LEVEL=debug\n")
+    for key in ("POSTGRES_PORT", "REDIS_HOST", "LOG_LEVEL", "OPENAI_API_KEY"):
+        monkeypatch.delenv(key, raising=False)
+
+    config = get_app_config(str(env_file))
+    assert config.postgres.port == 6543
+    assert config.redis.host == "cache"
+    assert config.log_level == "DEBUG"
+    assert config.openai_api_key is None
+
+
+def test_getters_read_the_cached_app_config(tmp_path, monkeypatch):
+    from core.config.config import get_alpha_vantage_api_key, get_app_config, get_log_level, get_postgres_config
+    env_file = tmp_path / ".env"
+    env_file.write_text("POSTGRES_PORT=6544\nLOG_LEVEL=warning\nALPHA_VANTAGE_API_KEY=demo\n")
+    for key in ("POSTGRES_PORT", "LOG_LEVEL", "ALPHA_VANTAGE_API_KEY"):
+        monkeypatch.delenv(key, raising=False)
+    path = str(env_file)
+
+    config = get_app_config(path)
+    assert get_postgres_config(path) is config.postgres
+    assert get_log_level(path) == "WARNING"
+    assert get_alpha_vantage_api_key(path) == "demo"
+
+    # Later environment changes do not leak into the snapshot until the cache is cleared
+    monkeypatch.setenv("LOG_LEVEL", "error")
+    assert get_log_level(path) == "WARNING"
+    get_app_config.cache_clear()
+    assert get_log_level(path) == "ERROR"
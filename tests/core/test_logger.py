@@ -0,0 +1,41 @@
+from core.logger.logger import Logger
+
+
+class ListHandler:
+    def __init__(self):
+        self.messages = []
+
+    def emit(self, message: str):
+        self.messages.append(message)
+
+
+def test_exception_includes_traceback():
+    handler = ListHandler()
+    logger = Logger(level="DEBUG", handler=handler)
+    try:
+        raise ValueError("boom")
+    except ValueError:
+        logger.exception("failed", job="import")
+    assert len(handler.messages) == 1
+    assert '"level":"ERROR"' in handler.messages[0]
+    assert '"job":"import"' in handler.messages[0]
+    assert "ValueError: boom" in handler.messages[0]
+
+
+def test_exception_skipped_when_error_disabled():
+    handler = ListHandler()
+    logger = Logger(level="CRITICAL", handler=handler)
+    try:
+        raise ValueError("boom")
+    except ValueError:
+        logger.exception("failed")
+    assert handler.messages == []
+
+
+def test_is_enabled_for_accepts_names_and_stdlib_levels():
+    import logging
+    logger = Logger(level="INFO", handler=ListHandler())
+    assert not logger.isEnabledFor("DEBUG")
+    assert not logger.isEnabledFor(logging.DEBUG)
+    assert logger.isEnabledFor("INFO")
+    assert logger.isEnabledFor(logging.ERROR)
@@ -1,4 +1,5 @@
 import pytest
+from unittest.mock import Mock
 from core.persistence.postgres import PostgresPool, CursorWithDeadline
 from core.deadline_manager import DeadlineManager, DeadlineExceeded
 
@@ -9,10 +10,18 @@ class DummyConn:
         pass
 
 class DummyCursor:
-    def __init__(self):
+    def __init__(self, queries=None):
         self.executed = False
+        self.queries = [] if queries is None else queries
+    @property
+    def connection(self):
+        # Cursors opened on the same connection record into the same query log
+        conn = Mock()
+        conn.cursor.side_effect = lambda: DummyCursor(self.queries)
+        return conn
     def execute(self, *args, **kwargs):
         self.executed = True
+        self.queries.append(args)
         return 'executed'
     def __enter__(self):
         return self
@@ -43,6 +52,35 @@ def test_cursor_with_deadline_executes():
         assert cur.executed
         assert result == 'executed'
 
+def test_cursor_with_deadline_sets_statement_timeout():
+    cur = DummyCursor()
+    deadline = DeadlineManager(timeout_seconds=2)
+    with CursorWithDeadline(cur, deadline) as c:
+        c.execute('SELECT 1')
+    (query,), (reset,) = cur.queries
+    prefix, _, statement = query.partition('; ')
+    assert prefix.startswith('SET statement_timeout = ')
+    assert 0 < int(prefix.rsplit(' ', 1)[1]) <= 2000
+    assert statement == 'SELECT 1'
+    assert reset == 'RESET statement_timeout'
+
+def test_cursor_with_deadline_keeps_params_and_sets_timeout_separately_for_named_cursors():
+    cur = DummyCursor()
+    cur.name = 'big_read'
+    deadline = DeadlineManager(timeout_seconds=2)
+    with CursorWithDeadline(cur, deadline) as c:
+        c.execute('SELECT * FROM t WHERE id = %s', (1,))
+    (set_timeout,), query, (reset,) = cur.queries
+    assert set_timeout.startswith('SET statement_timeout = ')
+    assert query == ('SELECT * FROM t WHERE id = %s', (1,))
+    assert reset == 'RESET statement_timeout'
+
+def test_cursor_without_deadline_skips_statement_timeout():
+    cur = DummyCursor()
+    with CursorWithDeadline(cur) as c:
+        c.execute('SELECT 1')
+    assert cur.queries == [('SELECT 1',)]
+
 def test_cursor_with_deadline_raises_on_expired():
     cur = DummyCursor()
     deadline = DeadlineManager(timeout_seconds=0)
@@ -112,3 +150,30 @@ def test_postgres_pool_connection_context_manager_with_deadline():
         assert deadline_mgr is deadline
         assert events == ['getconn']
     assert events == ['getconn', 'putconn']
+
+def test_postgres_pool_readonly_connection_uses_autocommit():
+    class DummyConn:
+        autocommit = False
+    class DummyPool:
+        def __init__(self, **kwargs):
+            self.conn = DummyConn()
+        def getconn(self):
+            return self.conn
+        def putconn(self, conn):
+            pass
+        def closeall(self):
+            pass
+    pool = PostgresPool(config=Mock(), connection_pool_cls=DummyPool)
+    with pool.connection(readonly=True) as (conn, _):
+        assert conn.autocommit is True
+    # Autocommit is restored before the connection goes back to the pool
+    assert conn.autocommit is False
+
+
+def test_postgres_pool_sizes_injected_pool():
+    class DummyPool:
+        def __init__(self, **kwargs):
+            self.kwargs = kwargs
+    pool = PostgresPool(config=Mock(), connection_pool_cls=DummyPool, minconn=3, maxconn=7)
+    assert pool.pool.kwargs['minconn'] == 3
+    assert pool.pool.kwargs['maxconn'] == 7
@@ -19,3 +19,28 @@ def test_batch_fetch_stock_prices():
     with patch.object(stock_api, 'fetch_stock_price', side_effect=lambda symbol: 100.0 if symbol == 'AAPL' else 200.0):
         prices = stock_api.batch_fetch_stock_prices(['AAPL', 'GOOG'])
     assert prices == [100.0, 200.0]
+
+def test_fetch_stock_prices_async():
+    import asyncio
+    import httpx
+
+    def handler(request):
+        symbol = request.url.params['symbol']
+        if symbol == 'BAD':
+            return httpx.Response(200, json={'Note': 'rate limited'})
+        close = '100.0' if symbol == 'AAPL' else '200.0'
+        return httpx.Response(200, json={
+            'Time Series (1min)': {
+                '2025-06-27 15:59:00': {'4. close': '1.0'},
+                '2025-06-27 16:00:00': {'4. close': close},
+            }
+        })
+
+    real_client = httpx.AsyncClient
+    def client_factory(*args, **kwargs):
+        return real_client(transport=httpx.MockTransport(handler))
+
+    with patch.object(stock_api, 'get_alpha_vantage_api_key', return_value='test'), \
+            patch.object(stock_api.httpx, 'AsyncClient', side_effect=client_factory):
+        prices = asyncio.run(stock_api.fetch_stock_prices_async(['AAPL', 'BAD', 'GOOG']))
+    assert prices == [100.0, None, 200.0]
@@ -96,6 +96,60 @@ class IBKRImportServiceTest(unittest.TestCase):
         entries = self.activity_service.get_activity_entries(self.portfolio.id, activity_type='TRADE')
         self.assertEqual(len(entries), 2)
 
+    def test_import_resolves_equities_in_bulk(self):
+        """Trades and positions share one symbol lookup and one batch insert of new equities."""
+        existing = self.equity_repo.mock_equity(symbol='AAPL')
+        self.equity_repo.clear_call_history()
+        trades = [
+            {'symbol': symbol, 'datetime': '2024-01-01T10:00:00', 'proceeds': Decimal('100.00')}
+            for symbol in ('AAPL', 'GOOGL', 'GOOGL', 'MSFT')
+        ]
+        positions = [{'symbol': 'MSFT', 'quantity': 5, 'cost_basis': 1500.00}]
+        
+        result = self.service.import_from_ibkr(
+            portfolio_id=self.portfolio.id,
+            trades=trades,
+            dividends=[],
+            positions=positions,
+            forex_balances=[]
+        )
+        
+        self.assertTrue(result.success)
+        self.assertEqual(result.trades_imported, 4)
+        self.assertEqual(result.equities_created, 2)
+        self.assertTrue(self.equity_repo.assert_method_called('find_by_symbols', times=1))
+        self.assertTrue(self.equity_repo.assert_method_called('batch_save', times=1))
+        self.assertFalse(self.equity_repo.assert_method_called('save'))
+        self.assertTrue(self.equity_repo.assert_method_called('get', times=1))
+        self.assertTrue(self.equity_repo.assert_equity_count(3))
+        
+        entries = self.activity_service.get_activity_entries(self.portfolio.id, activity_type='TRADE')
+        aapl_entries = [e for e in entries if e.equity_id == existing.id]
+        self.assertEqual(len(aapl_entries), 1)
+
+    def test_import_loads_portfolio_once(self):
+        """Activity entries reuse the portfolio loaded at the start of the import."""
+        loads = []
+        get = self.portfolio_repo.get
+        self.portfolio_repo.get = lambda portfolio_id, conn=None: loads.append(portfolio_id) or get(portfolio_id, conn=conn)
+        trades = [
+            {'symbol': 'AAPL', 'datetime': '2024-01-0%dT10:00:00' % day, 'proceeds': Decimal('100.00')}
+            for day in range(1, 6)
+        ]
+        dividends = [{'description': 'AAPL Dividend', 'date': '2024-01-15', 'amount': Decimal('5.00'), 'currency': 'USD'}]
+        
+        result = self.service.import_from_ibkr(
+            portfolio_id=self.portfolio.id,
+            trades=trades,
+            dividends=dividends,
+            positions=[],
+            forex_balances=[]
+        )
+        
+        self.assertTrue(result.success)
+        self.assertEqual(result.activity_entries_created, 6)
+        self.assertEqual(len(loads), 1)
+
     def test_import_dividends(self):
         """Test importing dividends from IBKR data."""
         dividends = [
@@ -322,6 +376,53 @@ class IBKRImportServiceTest(unittest.TestCase):
         self.assertEqual(len(result.warnings), 1)
         self.assertIn("Unsupported currency 'CHF'", result.warnings[0])
 
+    def test_import_from_stream(self):
+        """Test importing (section_name, record) pairs as they are streamed."""
+        sections = iter([
+            ('Statement', {'field_name': 'Account', 'field_value': 'U12345678'}),
+            ('Trades', {
+                'symbol': 'AAPL',
+                'datetime': '2024-01-01T10:00:00',
+                'proceeds': Decimal('1000.00')
+            }),
+            ('Trades', {'proceeds': Decimal('500.00')}),  # Missing symbol and datetime
+            ('Dividends', {
+                'description': 'AAPL Dividend',
+                'date': '2024-01-15',
+                'amount': Decimal('50.00'),
+                'currency': 'USD'
+            }),
+            ('Open Positions', {'symbol': 'AAPL', 'quantity': 50, 'cost_basis': 7525.00}),
+        ])
+        
+        result = self.service.import_from_ibkr_stream(
+            portfolio_id=self.portfolio.id,
+            sections=sections
+        )
+        
+        self.assertTrue(result.success)
+        self.assertEqual(result.trades_imported, 1)
+        self.assertEqual(result.skipped_trades, 1)
+        self.assertEqual(result.dividends_imported, 1)
+        self.assertEqual(result.positions_imported, 1)
+        self.assertEqual(result.activity_entries_created, 2)
+
+    def test_import_from_stream_resolves_each_symbol_once(self):
+        """Streamed trades look up each distinct symbol once, on first sight."""
+        self.equity_repo.clear_call_history()
+        sections = (
+            ('Trades', {'symbol': symbol, 'datetime': '2024-01-01T10:00:00', 'proceeds': Decimal('10.00')})
+            for symbol in ('AAPL', 'MSFT', 'AAPL', 'AAPL', 'MSFT')
+        )
+        
+        result = self.service.import_from_ibkr_stream(portfolio_id=self.portfolio.id, sections=sections)
+        
+        self.assertTrue(result.success)
+        self.assertEqual(result.trades_imported, 5)
+        self.assertEqual(result.equities_created, 2)
+        self.assertTrue(self.equity_repo.assert_method_called('find_by_symbols', times=2))
+        self.assertTrue(self.equity_repo.assert_method_called('batch_save', times=2))
+
 
 if __name__ == '__main__':
     unittest.main()
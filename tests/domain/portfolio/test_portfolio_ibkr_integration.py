@@ -143,7 +143,7 @@ Open Positions,Data,Total,,,,,,,147525.00,,151262.50,3737.50,'''
             self.assertTrue(self.activity_entry_repo.assert_entries_count_by_type(self.portfolio.id, 'DIVIDEND', 3))
             
             # Verify method call tracking
-            self.assertTrue(self.equity_repo.assert_method_called('save'))  # Stocks were saved
+            self.assertTrue(self.equity_repo.assert_method_called('batch_save'))  # Stocks were saved in one batch
             self.assertTrue(self.equity_repo.assert_method_called('find_by_symbol'))  # Symbol lookups occurred
             self.assertTrue(self.portfolio_repo.assert_method_called('get'))  # Portfolio was retrieved
             
@@ -181,7 +181,7 @@ Open Positions,Data,Total,,,,,,,147525.00,,151262.50,3737.50,'''
             
             # Test repository call history and assertions
             self.assertTrue(self.portfolio_repo.assert_method_called('get'))
-            self.assertTrue(self.equity_repo.assert_method_called('save'))
+            self.assertTrue(self.equity_repo.assert_method_called('batch_save'))
             self.assertTrue(self.activity_entry_repo.assert_method_called('save'))
             
             # Clear call history for isolated testing
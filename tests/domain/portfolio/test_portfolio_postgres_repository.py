@@ -131,6 +131,20 @@ class PostgresStockRepositoryTest(unittest.TestCase):
         retrieved = self.repo.get(self.stock_id, conn=self.conn)
         self.assertEqual(retrieved.name, 'Apple Inc. (Updated)')
 
+    def test_get_many(self):
+        missing_id = uuid4()
+        stocks = self.repo.get_many([self.stock_id, missing_id], conn=self.conn)
+        self.assertEqual(list(stocks), [self.stock_id])
+        self.assertEqual(stocks[self.stock_id].symbol, 'AAPL')
+
+    def test_batch_save_and_find_by_symbols(self):
+        msft = Stock(id=uuid4(), symbol='MSFT', name='Microsoft', exchange='NASDAQ')
+        self.repo.batch_save([msft], conn=self.conn)
+
+        stocks = self.repo.find_by_symbols(['AAPL', 'MSFT', 'NOPE'], 'NASDAQ', conn=self.conn)
+        self.assertEqual(set(stocks), {'AAPL', 'MSFT'})
+        self.assertEqual(stocks['MSFT'].id, msft.id)
+
 class PostgresHoldingRepositoryTest(unittest.TestCase):
     @classmethod
     def setUpClass(cls):
@@ -205,6 +219,14 @@ class PostgresHoldingRepositoryTest(unittest.TestCase):
         retrieved = self.repo.get(self.holding_id, conn=self.conn)
         self.assertEqual(retrieved.quantity, Decimal('150'))
 
+    def test_batch_save_upserts_repeated_ids(self):
+        self.holding.update_quantity(Decimal('175'))
+        self.repo.batch_save([self.holding, self.holding], conn=self.conn)
+        
+        holdings = self.repo.find_by_portfolio_id(self.portfolio_id, conn=self.conn)
+        self.assertEqual(len(holdings), 1)
+        self.assertEqual(holdings[0].quantity, Decimal('175'))
+
 class PostgresActivityReportEntryRepositoryTest(unittest.TestCase):
     @classmethod
     def setUpClass(cls):
@@ -267,6 +289,73 @@ class PostgresActivityReportEntryRepositoryTest(unittest.TestCase):
         self.assertEqual(len(entries), 1)
         self.assertEqual(entries[0].id, self.entry_id)
 
+    def test_batch_save(self):
+        entries = [
+            ActivityReportEntry(
+                id=uuid4(),
+                portfolio_id=self.portfolio_id,
+                equity_id=None,
+                activity_type='DIVIDEND',
+                amount=Decimal('10.00'),
+                currency=Currency.USD,
+                date=datetime.now(),
+                raw_data={'description': f'Dividend {i}'}
+            )
+            for i in range(3)
+        ]
+        self.repo.batch_save(entries, conn=self.conn, page_size=2)
+
+        dividend_entries = self.repo.find_by_portfolio_id(
+            self.portfolio_id,
+            activity_type='DIVIDEND',
+            conn=self.conn
+        )
+        self.assertEqual({e.id for e in dividend_entries}, {e.id for e in entries})
+
+    def test_batch_save_twice_in_one_transaction(self):
+        def make_entry(amount):
+            return ActivityReportEntry(
+                id=uuid4(),
+                portfolio_id=self.portfolio_id,
+                equity_id=None,
+                activity_type='DIVIDEND',
+                amount=Decimal(amount),
+                currency=Currency.USD,
+                date=datetime.now(),
+                raw_data={'description': 'Quoted "dividend", with comma\\ and backslash'}
+            )
+        first, second = make_entry('1.00'), make_entry('2.00')
+        self.repo.batch_save([first], conn=self.conn)
+        self.repo.batch_save([second], conn=self.conn)
+
+        dividend_entries = self.repo.find_by_portfolio_id(
+            self.portfolio_id,
+            activity_type='DIVIDEND',
+            conn=self.conn
+        )
+        self.assertEqual({e.id for e in dividend_entries}, {first.id, second.id})
+        self.assertEqual(dividend_entries[0].raw_data, first.raw_data)
+
+    def test_batch_save_duplicate_id_keeps_last(self):
+        entry = ActivityReportEntry(
+            id=uuid4(),
+            portfolio_id=self.portfolio_id,
+            equity_id=None,
+            activity_type='DIVIDEND',
+            amount=Decimal('1.00'),
+            currency=Currency.USD,
+            date=datetime.now(),
+            raw_data={'description': 'first'}
+        )
+        self.repo.batch_save([entry], conn=self.conn)
+        entry.amount = Decimal('2.00')
+        entry.raw_data = {'description': 'second'}
+        self.repo.batch_save([entry, entry], conn=self.conn)
+
+        saved = self.repo.get(entry.id, conn=self.conn)
+        self.assertEqual(saved.amount, Decimal('2.00'))
+        self.assertEqual(saved.raw_data, {'description': 'second'})
+
     def test_find_by_portfolio_id_with_activity_type_filter(self):
         # Add another entry with different activity type
         dividend_entry = ActivityReportEntry(
@@ -296,3 +385,28 @@ class PostgresActivityReportEntryRepositoryTest(unittest.TestCase):
 
 if __name__ == '__main__':
     unittest.main()
+
+
+def test_activity_batch_save_copies_each_conflict_key_once():
+    from unittest.mock import MagicMock
+    conn = MagicMock(autocommit=False)
+    cur = conn.cursor.return_value.__enter__.return_value
+    copied = []
+    cur.copy_expert.side_effect = lambda sql, buf: copied.append((sql, buf.getvalue()))
+    portfolio_id, date = uuid4(), datetime(2024, 1, 15)
+    def make_entry(entry_id, amount):
+        return ActivityReportEntry(
+            id=entry_id, portfolio_id=portfolio_id, equity_id=None, activity_type='DIVIDEND',
+            amount=Decimal(amount), currency=Currency.USD, date=date, raw_data={}
+        )
+    repeated, other = uuid4(), uuid4()
+
+    PostgresActivityReportEntryRepository(db=None).batch_save(
+        [make_entry(repeated, '1.00'), make_entry(other, '5.00'), make_entry(repeated, '2.00')], conn=conn
+    )
+
+    (sql, payload), = copied
+    assert "FORCE_NOT_NULL" in sql
+    lines = payload.splitlines()
+    assert [line.split(',')[0] for line in lines] == [str(repeated), str(other)]
+    assert lines[0].split(',')[4] == '2.00'
@@ -313,7 +313,7 @@ class PortfolioServiceTest(unittest.TestCase):
         self.assertTrue(self.activity_repo.assert_entries_count_by_type(portfolio.id, 'TRADE', 2))
         self.assertTrue(self.activity_repo.assert_entries_count_by_type(portfolio.id, 'DIVIDEND', 1))
         self.assertTrue(self.equity_repo.assert_equity_count(2))  # AAPL and GOOGL
-        self.assertTrue(self.equity_repo.assert_method_called('save'))  # Stocks were saved
+        self.assertTrue(self.equity_repo.assert_method_called('batch_save'))  # Stocks were saved in one batch
         self.assertTrue(self.portfolio_repo.assert_method_called('get'))  # Portfolio was retrieved
 
     def test_import_from_ibkr_nonexistent_portfolio(self):
@@ -454,6 +454,15 @@ class InMemoryEquityRepositoryTest(unittest.TestCase):
         equity = self.repo.get(self.equity_id)
         self.assertIsNone(equity)
 
+    def test_get_many(self):
+        google = self.repo.mock_equity(symbol="GOOG")
+        missing_id = uuid4()
+        equities = self.repo.get_many([self.equity_id, google.id, self.equity_id, missing_id])
+        self.assertEqual(set(equities), {self.equity_id, google.id})
+        self.assertEqual(equities[google.id].symbol, "GOOG")
+        self.assertTrue(self.repo.assert_method_called('get_many', times=1))
+        self.assertFalse(self.repo.assert_method_called('get'))
+
     def test_exists(self):
         self.assertTrue(self.repo.exists(self.equity_id))
         self.assertFalse(self.repo.exists(uuid4()))
@@ -59,6 +59,27 @@ class UserServiceTest(unittest.TestCase):
         ok, reason = self.service.verify_user_password(uuid4(), "password")
         self.assertFalse(ok)
         self.assertEqual(reason, "user_not_found")
+    def test_verify_password_by_cached_hash(self):
+        self.assertIsNotNone(self.service.cache_password_hash(self.user_id))
+        # The stored hash is served from the cache, even if the repository is unavailable
+        self.repo.get_by_id = None
+        ok, reason = self.service.verify_password_by_cached_hash(self.user_id, "password")
+        self.assertTrue(ok)
+        self.assertEqual(reason, "match")
+        ok, reason = self.service.verify_password_by_cached_hash(self.user_id, "wrongpassword")
+        self.assertFalse(ok)
+        self.assertEqual(reason, "password_mismatch")
+
+    def test_verify_password_by_cached_hash_unknown_user(self):
+        ok, reason = self.service.verify_password_by_cached_hash(uuid4(), "password")
+        self.assertFalse(ok)
+        self.assertEqual(reason, "user_not_found")
+
+    def test_change_user_password_invalidates_cached_hash(self):
+        self.service.cache_password_hash(self.user_id)
+        self.service.change_user_password(self.user_id, "newpassword123")
+        ok, _ = self.service.verify_password_by_cached_hash(self.user_id, "newpassword123")
+        self.assertTrue(ok)
 
 if __name__ == "__main__":
     unittest.main()
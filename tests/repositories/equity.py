@@ -1,6 +1,6 @@
 """Test-specific in-memory equity repository with mocking and assertion utilities."""
 
-from typing import Optional, List, Dict
+from typing import Optional, List, Dict, Iterable
 from uuid import UUID, uuid4
 from datetime import datetime
 
@@ -19,6 +19,12 @@ class InMemoryEquityRepository:
         row = self._equities.get(equity_id)
         return self._row_to_equity(row) if row else None
 
+    def get_many(self, equity_ids: Iterable[UUID], conn=None) -> Dict[UUID, Equity]:
+        equity_ids = set(equity_ids)
+        self._record_call('get_many', {'equity_ids': equity_ids})
+        rows = ((equity_id, self._equities.get(equity_id)) for equity_id in equity_ids)
+        return {equity_id: self._row_to_equity(row) for equity_id, row in rows if row}
+
     def find_by_symbol(self, symbol: str, exchange: str, conn=None) -> Optional[Equity]:
         from domain.portfolio.models.enums import Exchange
         self._record_call('find_by_symbol', {'symbol': symbol, 'exchange': exchange})
@@ -36,6 +42,16 @@ class InMemoryEquityRepository:
                 return self._row_to_equity(row)
         return None
 
+    def find_by_symbols(self, symbols: Iterable[str], exchange: str, conn=None) -> Dict[str, Equity]:
+        symbols = set(symbols)
+        self._record_call('find_by_symbols', {'symbols': symbols, 'exchange': exchange})
+        found = {}
+        for symbol in symbols:
+            equity = self.find_by_symbol(symbol, exchange, conn=conn)
+            if equity:
+                found[symbol] = equity
+        return found
+
     def find_by_portfolio_id(self, portfolio_id: UUID, conn=None) -> List[Equity]:
         self._record_call('find_by_portfolio_id', {'portfolio_id': portfolio_id})
         # This would require join logic in a real implementation
@@ -58,6 +74,11 @@ class InMemoryEquityRepository:
         self._record_call('save', {'equity_id': equity.id})
         self._equities[equity.id] = self._equity_to_row(equity)
 
+    def batch_save(self, equities: List[Equity], conn=None) -> None:
+        self._record_call('batch_save', {'equity_ids': [equity.id for equity in equities]})
+        for equity in equities:
+            self._equities[equity.id] = self._equity_to_row(equity)
+
     def delete(self, equity_id: UUID, conn=None) -> None:
         self._record_call('delete', {'equity_id': equity_id})
         self._equities.pop(equity_id, None)